@@ -0,0 +1,94 @@
+"""Benchmark of the NovaSeq X sample sheet BCLConvert_Data section on a synthetic run.
+
+Builds a run of 8 lanes with 1536 dual indexed libraries each, without any lims, and reports
+the wall time and peak traced memory of building the section as one string and of streaming it
+to a file.
+
+    python -m benchmarks.sample_sheet_writer --lanes 8 --samples 1536
+"""
+
+import argparse
+import itertools
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from cg_lims.EPPs.files.sample_sheet.create_sample_sheet import iter_bcl_data_section
+from cg_lims.EPPs.files.sample_sheet.models import NovaSeqXRun
+from mock import Mock
+
+RUN_UDFS: Dict = {
+    "BaseSpace Run Name": "benchmark",
+    "Read 1 Cycles": 151,
+    "Read 2 Cycles": 151,
+    "Index Read 1": 10,
+    "Index Read 2": 10,
+    "BCLConvert Software Version": "4.1.7",
+    "Compression Format": "gzip",
+    "Library Tube Strip ID": "LS0000000",
+    "DRAGEN Demultiplex": True,
+}
+
+
+def make_lane_leaves(lanes: int, samples: int) -> Dict[int, List[Mock]]:
+    """Return the same synthetic libraries on every lane, with random 10 nt dual indexes."""
+    randomizer = random.Random(0)
+    sequences = ("".join(randomizer.choices("ACGT", k=10)) for _ in itertools.count())
+    labels: Dict[str, str] = {}
+    libraries: List[Mock] = []
+    lims = Mock()
+    lims.get_reagent_types.side_effect = lambda name: [Mock(sequence=labels[name])]
+    for sample_number in range(samples):
+        sequence: str = f"{next(sequences)}-{next(sequences)}"
+        label: str = f"UDI_{sample_number} ({sequence})"
+        labels[label] = sequence
+        libraries.append(
+            Mock(
+                lims=lims,
+                reagent_labels=[label],
+                samples=[Mock(id=f"ACC{sample_number}A1")],
+            )
+        )
+    return {lane: libraries for lane in range(1, lanes + 1)}
+
+
+def measure(name: str, function: Callable[[], None]) -> None:
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    function()
+    elapsed: float = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<10} {elapsed:8.2f} s {peak / 2**20:10.1f} MiB peak")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lanes", type=int, default=8)
+    parser.add_argument("--samples", type=int, default=1536)
+    arguments = parser.parse_args()
+
+    run_settings = NovaSeqXRun(process=Mock(udf=RUN_UDFS))
+    lane_leaves: Dict[int, List[Mock]] = make_lane_leaves(
+        lanes=arguments.lanes, samples=arguments.samples
+    )
+    print(f"{arguments.lanes} lanes x {arguments.samples} samples")
+
+    def build_string() -> None:
+        "".join(iter_bcl_data_section(run_settings=run_settings, lane_leaves=lane_leaves))
+
+    def stream_to_file() -> None:
+        with tempfile.TemporaryFile("w") as file:
+            NovaSeqXRun.write_sample_sheet(
+                content=iter_bcl_data_section(run_settings=run_settings, lane_leaves=lane_leaves),
+                file=file,
+            )
+
+    measure("string", build_string)
+    measure("streaming", stream_to_file)
+
+
+if __name__ == "__main__":
+    main()
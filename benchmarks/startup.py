@@ -0,0 +1,229 @@
+"""Benchmark of the startup time of the lims entry point, for every command.
+
+Runs `lims ... <command> --help` for each command path of the epps and scripts trees in a new
+python process with -X importtime: once with an empty bytecode cache (cold start) and <repeat> times
+with the cache filled (warm start). The wall times and the import cost per module are written to a
+JSON report. The benchmark fails if a command is over its budget, or slower than in a baseline
+report by more than the allowed regression.
+
+    python -m benchmarks.startup --report startup.json
+    python -m benchmarks.startup --commands "epps udf" --baseline startup.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import click
+import yaml
+from cg_lims.commands.base import cli
+
+DEFAULT_BUDGET_FILE = Path(__file__).parent / "startup_budget.yaml"
+DEFAULT_REPEAT = 3
+REPORTED_MODULES = 25
+ENTRY_POINT = "from cg_lims.commands import cli; cli()"
+
+CommandPath = Tuple[str, ...]
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+class StartupRun(NamedTuple):
+    seconds: float
+    imports: List[ImportRecord]
+    error: Optional[str]
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse the lines written to stderr by python -X importtime, eg.
+    'import time:       537 |      22656 |       click'."""
+    records: List[ImportRecord] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        records.append(
+            ImportRecord(
+                module=module.strip(), self_us=int(self_us), cumulative_us=int(cumulative_us)
+            )
+        )
+    return records
+
+
+def iter_command_paths(group: click.Group, ctx: click.Context, path: CommandPath = ()):
+    """Yield the path of every command, that is not a group, below the group."""
+    for name in group.list_commands(ctx):
+        command: click.Command = group.get_command(ctx, name)
+        if isinstance(command, click.Group):
+            yield from iter_command_paths(group=command, ctx=ctx, path=(*path, name))
+        else:
+            yield (*path, name)
+
+
+def get_command_paths(prefix: CommandPath = ()) -> List[CommandPath]:
+    """Return all command paths starting with the prefix."""
+    paths: Iterator[CommandPath] = iter_command_paths(group=cli, ctx=click.Context(cli))
+    return [path for path in paths if path[: len(prefix)] == prefix]
+
+
+def get_arguments(path: CommandPath, config: str, log: str) -> List[str]:
+    """Arguments of a --help dry run of the command, with the options required by its groups."""
+    group_arguments: Dict[str, List[str]] = {
+        "epps": ["-l", log, "-p", "24-000000"],
+        "scripts": ["-l", log],
+    }
+    group, *subcommands = path
+    return ["-c", config, group, *group_arguments.get(group, []), *subcommands, "--help"]
+
+
+def run_startup(arguments: List[str], pycache_prefix: str) -> StartupRun:
+    """Run the entry point in a new python process, with its bytecode cache in pycache_prefix."""
+    environment: Dict[str, str] = {**os.environ, "PYTHONPYCACHEPREFIX": pycache_prefix}
+    # Warm starts need the bytecode written by the cold start.
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    start: float = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", ENTRY_POINT, *arguments],
+        capture_output=True,
+        text=True,
+        env=environment,
+    )
+    seconds: float = time.perf_counter() - start
+    error: Optional[str] = None
+    if process.returncode != 0:
+        error = process.stderr.splitlines()[-1] if process.stderr else f"exit {process.returncode}"
+    return StartupRun(seconds=seconds, imports=parse_importtime(process.stderr), error=error)
+
+
+def get_module_breakdown(imports: List[ImportRecord]) -> List[Dict]:
+    """The modules with the largest cumulative import time, and their own share of it."""
+    largest = sorted(imports, key=lambda record: record.cumulative_us, reverse=True)
+    return [record._asdict() for record in largest[:REPORTED_MODULES]]
+
+
+def benchmark_command(path: CommandPath, repeat: int, config: str, work_dir: Path) -> Dict:
+    """Cold and warm start of one command."""
+    arguments: List[str] = get_arguments(
+        path=path, config=config, log=str(work_dir / "benchmark.log")
+    )
+    with tempfile.TemporaryDirectory(dir=work_dir) as pycache_prefix:
+        cold: StartupRun = run_startup(arguments=arguments, pycache_prefix=pycache_prefix)
+        warm: List[StartupRun] = [
+            run_startup(arguments=arguments, pycache_prefix=pycache_prefix) for _ in range(repeat)
+        ]
+    last: StartupRun = warm[-1] if warm else cold
+    return {
+        "cold_seconds": round(cold.seconds, 4),
+        "warm_seconds": round(statistics.median(run.seconds for run in warm), 4) if warm else None,
+        "import_seconds": round(sum(record.self_us for record in last.imports) / 1e6, 4),
+        "module_count": len(last.imports),
+        "modules": get_module_breakdown(last.imports),
+        "error": cold.error or next((run.error for run in warm if run.error), None),
+    }
+
+
+def get_budget_seconds(command: str, budget: Dict) -> float:
+    """The budget of the longest command prefix in the budget file, or the default."""
+    budgets: Dict[str, float] = budget.get("commands") or {}
+    prefixes: List[str] = [
+        prefix for prefix in budgets if command == prefix or command.startswith(f"{prefix} ")
+    ]
+    if prefixes:
+        return budgets[max(prefixes, key=len)]
+    return budget["default"]
+
+
+def check_budgets(results: Dict[str, Dict], budget: Dict, baseline: Optional[Dict]) -> List[str]:
+    """Return a message for every command that failed, is over budget or has regressed."""
+    max_regression: float = budget.get("max_regression", 0.2)
+    min_regression_seconds: float = budget.get("min_regression_seconds", 0.05)
+    baseline_results: Dict[str, Dict] = (baseline or {}).get("commands", {})
+    violations: List[str] = []
+    for command, result in results.items():
+        if result["error"]:
+            violations.append(f"{command}: failed, {result['error']}")
+            continue
+        seconds: float = result["warm_seconds"] or result["cold_seconds"]
+        budget_seconds: float = get_budget_seconds(command=command, budget=budget)
+        if seconds > budget_seconds:
+            violations.append(
+                f"{command}: {seconds:.3f} s is over the budget of {budget_seconds} s"
+            )
+        baseline_seconds: Optional[float] = baseline_results.get(command, {}).get("warm_seconds")
+        if (
+            baseline_seconds
+            and seconds > baseline_seconds * (1 + max_regression)
+            and seconds - baseline_seconds > min_regression_seconds
+        ):
+            violations.append(
+                f"{command}: {seconds:.3f} s regressed from {baseline_seconds:.3f} s in the baseline"
+            )
+    return violations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", default="", help='Command path prefix, eg. "epps udf"')
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Warm start runs")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET_FILE)
+    parser.add_argument("--baseline", type=Path, help="Report of an earlier run to compare with")
+    parser.add_argument("--report", type=Path, default=Path("startup_report.json"))
+    arguments = parser.parse_args()
+
+    budget: Dict = yaml.safe_load(arguments.budget.read_text())
+    baseline: Optional[Dict] = (
+        json.loads(arguments.baseline.read_text()) if arguments.baseline else None
+    )
+    paths: List[CommandPath] = get_command_paths(prefix=tuple(arguments.commands.split()))
+    print(f"{len(paths)} commands, {arguments.repeat} warm runs each")
+
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        config = Path(work_dir) / "config.yaml"
+        # A closed port, so that lims lookups in the group callbacks fail at once.
+        config.write_text("BASEURI: http://127.0.0.1:9\nUSERNAME: benchmark\nPASSWORD: x\n")
+        for path in paths:
+            command: str = " ".join(path)
+            results[command] = benchmark_command(
+                path=path, repeat=arguments.repeat, config=str(config), work_dir=Path(work_dir)
+            )
+            result: Dict = results[command]
+            print(
+                f"{command:<70} cold {result['cold_seconds']:6.3f} s "
+                f"warm {result['warm_seconds'] or 0:6.3f} s "
+                f"imports {result['import_seconds']:6.3f} s"
+            )
+
+    violations: List[str] = check_budgets(results=results, budget=budget, baseline=baseline)
+    report: Dict = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "repeat": arguments.repeat,
+        "budget": budget,
+        "commands": results,
+        "violations": violations,
+    }
+    arguments.report.write_text(json.dumps(report, indent=2))
+    print(f"Report written to {arguments.report}")
+
+    for violation in violations:
+        print(violation)
+    if violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,20 @@
 #!/usr/bin/env python
 
+from typing import Dict
+
 import click
-from cg_lims.EPPs.arnold.flow_cell import flow_cell
-from cg_lims.EPPs.arnold.prep import prep
-from cg_lims.EPPs.arnold.sample import sample
-from cg_lims.EPPs.arnold.sequencing import sequencing
+from cg_lims.lazy import LazyGroup
+
+COMMANDS: Dict[str, str] = {
+    "flow-cell": "cg_lims.EPPs.arnold.flow_cell:flow_cell",
+    "prep": "cg_lims.EPPs.arnold.prep:prep",
+    "sample": "cg_lims.EPPs.arnold.sample:sample",
+    "sequencing": "cg_lims.EPPs.arnold.sequencing:sequencing",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @click.pass_context
 def arnold_upload(ctx):
     """Main load commands."""
     pass
-
-
-arnold_upload.add_command(flow_cell)
-arnold_upload.add_command(prep)
-arnold_upload.add_command(sample)
-arnold_upload.add_command(sequencing)
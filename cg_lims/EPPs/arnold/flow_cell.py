@@ -2,12 +2,10 @@ import logging
 from typing import List
 
 import click
-import requests
-from cg_lims.exceptions import LimsError
+from cg_lims.clients.arnold.arnold_client import ArnoldClient
 from cg_lims.get.artifacts import OutputGenerationType, OutputType, get_output_artifacts
 from cg_lims.models.arnold.flow_cell import FlowCell, Lane
 from genologics.lims import Artifact, Lims, Process
-from requests import Response
 
 LOG = logging.getLogger(__name__)
 
@@ -31,7 +29,7 @@ def flow_cell(ctx):
     LOG.info(f"Running {ctx.command_path} with params: {ctx.params}")
     process: Process = ctx.obj["process"]
     lims: Lims = ctx.obj["lims"]
-    arnold_host: str = ctx.obj["arnold_host"]
+    arnold_client: ArnoldClient = ctx.obj["arnold_client"]
     lanes = get_output_artifacts(
         process=process,
         output_generation_types=[OutputGenerationType.PER_INPUT],
@@ -39,14 +37,7 @@ def flow_cell(ctx):
         output_type=OutputType.RESULT_FILE,
     )
     flow_cell_document: FlowCell = build_flow_cell_document(process=process, lanes=lanes)
-    response: Response = requests.post(
-        url=f"{arnold_host}/flow_cell",
-        headers={"Content-Type": "application/json"},
-        data=flow_cell_document.json(exclude_none=True),
+    arnold_client.send_document(
+        method="post", endpoint="flow_cell", document=flow_cell_document.json(exclude_none=True)
     )
-    if not response.ok:
-        LOG.info(response.text)
-        raise LimsError(response.text)
-
-    LOG.info("Arnold output: %s", response.text)
     click.echo("FlowCell document inserted to arnold database")
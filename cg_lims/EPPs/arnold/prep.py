@@ -1,20 +1,20 @@
-import json
 import logging
 from typing import List, Literal
 
 import click
-import requests
 from cg_lims import options
-from cg_lims.exceptions import LimsError
+from cg_lims.clients.arnold.arnold_client import ArnoldClient
+from cg_lims.clients.arnold.upload_manifest import UploadManifest
+from cg_lims.EPPs.arnold.upload import upload_step_documents
 from cg_lims.get.samples import get_process_samples
 from cg_lims.models.arnold.base_step import BaseStep
+from cg_lims.models.arnold.build import DEFAULT_WORKERS, build_documents_concurrently
 from cg_lims.models.arnold.prep.microbial_prep import build_microbial_step_documents
 from cg_lims.models.arnold.prep.rna import build_rna_documents
 from cg_lims.models.arnold.prep.sars_cov_2_prep import build_sars_cov_2_documents
 from cg_lims.models.arnold.prep.twist import build_twist_documents
 from cg_lims.models.arnold.prep.wgs import build_wgs_documents
 from genologics.lims import Lims, Process, Sample
-from requests import Response
 
 LOG = logging.getLogger(__name__)
 
@@ -28,43 +28,45 @@ prep_document_functions = {
 
 
 def build_step_documents(
-    prep_type: Literal["wgs", "twist", "micro", "cov", "rna"], process: Process, lims: Lims
+    prep_type: Literal["wgs", "twist", "micro", "cov", "rna"],
+    process: Process,
+    lims: Lims,
+    workers: int = DEFAULT_WORKERS,
 ) -> List[BaseStep]:
     prep_document_function = prep_document_functions[prep_type]
     samples: List[Sample] = get_process_samples(process=process)
-    all_step_documents = []
-    for sample in samples:
-        step_documents: List[BaseStep] = prep_document_function(
-            sample_id=sample.id, process_id=process.id, lims=lims
-        )
-        all_step_documents += step_documents
-    return all_step_documents
+    return build_documents_concurrently(
+        build_function=prep_document_function,
+        sample_ids=[sample.id for sample in samples],
+        process_id=process.id,
+        lims=lims,
+        workers=workers,
+    )
 
 
 @click.command()
 @options.prep(help="Prep type.")
+@options.workers(default=DEFAULT_WORKERS)
+@options.force_upload()
 @click.pass_context
-def prep(ctx, prep_type: Literal["wgs", "twist", "micro", "cov", "rna"]):
+def prep(
+    ctx, workers: int, force_upload: bool, prep_type: Literal["wgs", "twist", "micro", "cov", "rna"]
+):
     """Creating Step documents from a prep in the arnold step collection."""
 
     LOG.info(f"Running {ctx.command_path} with params: {ctx.params}")
 
     process: Process = ctx.obj["process"]
     lims: Lims = ctx.obj["lims"]
-    arnold_host: str = ctx.obj["arnold_host"]
+    arnold_client: ArnoldClient = ctx.obj["arnold_client"]
 
     all_step_documents: List[BaseStep] = build_step_documents(
-        prep_type=prep_type, process=process, lims=lims
+        prep_type=prep_type, process=process, lims=lims, workers=workers
     )
-
-    response: Response = requests.post(
-        url=f"{arnold_host}/steps",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps([doc.dict(exclude_none=True) for doc in all_step_documents]),
+    message: str = upload_step_documents(
+        arnold_client=arnold_client,
+        step_documents=all_step_documents,
+        manifest=ctx.obj.get("arnold_upload_manifest") or UploadManifest(),
+        force=force_upload,
     )
-    if not response.ok:
-        LOG.info(response.text)
-        raise LimsError(response.text)
-
-    LOG.info("Arnold output: %s", response.text)
-    click.echo("Step documents inserted to arnold database")
+    click.echo(message)
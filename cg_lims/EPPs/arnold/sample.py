@@ -1,14 +1,12 @@
-import json
 import logging
 from typing import List
 
 import click
-import requests
+from cg_lims.clients.arnold.arnold_client import ArnoldClient, UploadResult
 from cg_lims.exceptions import LimsError
 from cg_lims.get.samples import get_process_samples
 from cg_lims.models.arnold.sample import ArnoldSample
 from genologics.lims import Process, Sample
-from requests import Response
 
 LOG = logging.getLogger(__name__)
 
@@ -21,7 +19,7 @@ def sample(ctx):
     LOG.info(f"Running {ctx.command_path} with params: {ctx.params}")
 
     process: Process = ctx.obj["process"]
-    arnold_host: str = ctx.obj["arnold_host"]
+    arnold_client: ArnoldClient = ctx.obj["arnold_client"]
     samples: List[Sample] = get_process_samples(process=process)
 
     sample_documents = []
@@ -29,14 +27,10 @@ def sample(ctx):
         arnold_sample = ArnoldSample(**dict(sample.udf.items()), sample_id=sample.id, id=sample.id)
         sample_documents.append(arnold_sample.dict(exclude_none=True))
 
-    response: Response = requests.put(
-        url=f"{arnold_host}/samples",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps(sample_documents),
+    result: UploadResult = arnold_client.send_documents(
+        method="put", endpoint="samples", documents=sample_documents
     )
-    if not response.ok:
-        LOG.info(response.text)
-        raise LimsError(response.text)
+    if not result.ok:
+        raise LimsError(result.get_error_summary())
 
-    LOG.info("Arnold output: %s", response.text)
     click.echo("Sample documents inserted to arnold database")
@@ -0,0 +1,46 @@
+import logging
+from typing import Dict, List
+
+from cg_lims.clients.arnold.arnold_client import ArnoldClient, UploadResult
+from cg_lims.clients.arnold.upload_manifest import UploadManifest
+from cg_lims.exceptions import LimsError
+from cg_lims.models.arnold.base_step import BaseStep
+
+LOG = logging.getLogger(__name__)
+
+
+def upload_step_documents(
+    arnold_client: ArnoldClient,
+    step_documents: List[BaseStep],
+    manifest: UploadManifest,
+    force: bool = False,
+) -> str:
+    """Send the step documents that are new or changed since their last upload to arnold, or all
+    of them if forced, and record each uploaded chunk in the manifest, which is saved once at
+    the end.
+    Returns a summary of the upload. Raises LimsError if any chunk failed."""
+    documents: List[Dict] = [document.dict(exclude_none=True) for document in step_documents]
+    changed_documents: List[Dict] = documents if force else manifest.get_changed(documents)
+    skipped_count: int = len(documents) - len(changed_documents)
+
+    try:
+        result: UploadResult = arnold_client.send_documents(
+            method="post",
+            endpoint="steps",
+            documents=changed_documents,
+            on_uploaded=manifest.record,
+        )
+    finally:
+        manifest.save()
+    if not result.ok:
+        raise LimsError(
+            message=f"Arnold rejected {len(changed_documents) - result.uploaded_count} of "
+            f"{len(changed_documents)} step documents: {result.get_error_summary()}"
+        )
+
+    message: str = (
+        f"{result.uploaded_count} step documents inserted to arnold database, "
+        f"{skipped_count} unchanged documents skipped"
+    )
+    LOG.info(message)
+    return message
@@ -1,21 +1,33 @@
 #!/usr/bin/env python
 import logging
 import pathlib
+from functools import partial
+from typing import Dict
 
 import click
 from cg_lims import options
-from cg_lims.EPPs.arnold import arnold_upload
-from cg_lims.EPPs.files import files
-
-# commands
-from cg_lims.EPPs.move import move
-from cg_lims.EPPs.qc import qc
-from cg_lims.EPPs.udf import udf
 from cg_lims.get.files import get_log_content
+from cg_lims.get.snapshot import ProcessSnapshot
+from cg_lims.lazy import LazyContextObject, LazyGroup
 from genologics.entities import Process
 
+COMMANDS: Dict[str, str] = {
+    "move": "cg_lims.EPPs.move.base:move",
+    "files": "cg_lims.EPPs.files.base:files",
+    "udf": "cg_lims.EPPs.udf.base:udf",
+    "qc": "cg_lims.EPPs.qc.base:qc",
+    "arnold-upload": "cg_lims.EPPs.arnold.base:arnold_upload",
+}
+
+
+def log_status_db_statistics(context_object: LazyContextObject) -> None:
+    """Log the request statistics of the StatusDB client, if the command used it."""
+    status_db = context_object.get_created("status_db")
+    if status_db:
+        status_db.log_statistics()
 
-@click.group(invoke_without_command=True)
+
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @options.log()
 @options.process()
 @click.pass_context
@@ -30,12 +42,12 @@ def epps(ctx, log: str, process: Process):
             new_log.write(log_content)
 
     logging.basicConfig(filename=str(log_path.absolute()), filemode="a", level=logging.INFO)
+    ctx.with_resource(ctx.obj["instrumentation"].record(ctx))
+    xml_cache = getattr(ctx.obj["lims"], "xml_cache", None)
+    if xml_cache:
+        ctx.call_on_close(xml_cache.log_statistics)
+        ctx.call_on_close(xml_cache.flush)
+    ctx.call_on_close(partial(log_status_db_statistics, context_object=ctx.obj))
     process = Process(ctx.obj["lims"], id=process)
     ctx.obj["process"] = process
-
-
-epps.add_command(move)
-epps.add_command(files)
-epps.add_command(udf)
-epps.add_command(qc)
-epps.add_command(arnold_upload)
+    ctx.obj["snapshot"] = ProcessSnapshot(process=process)
@@ -1,39 +1,34 @@
 #!/usr/bin/env python
+from typing import Dict
+
 import click
-from cg_lims.EPPs.files.barcode_tubes import make_barcode_file
-from cg_lims.EPPs.files.csv_for_kapa_truble_shooting.csv_for_kapa_debug import trouble_shoot_kapa
-from cg_lims.EPPs.files.femtopulse_csv import make_femtopulse_csv
-from cg_lims.EPPs.files.hamilton.base import hamilton
-from cg_lims.EPPs.files.parsers.file_to_udf import csv_well_to_udf
-from cg_lims.EPPs.files.parsers.illumina_xml_to_udf import parse_run_parameters
-from cg_lims.EPPs.files.parsers.ont_json_to_udf import parse_ont_report
-from cg_lims.EPPs.files.parsers.quantit_excel_to_udf import quantit_excel_to_udf
-from cg_lims.EPPs.files.placement_map.make_96well_placement_map import placement_map
-from cg_lims.EPPs.files.pooling_map.make_pooling_map import pool_map
-from cg_lims.EPPs.files.sample_sheet.create_ont_sample_sheet import create_ont_sample_sheet
-from cg_lims.EPPs.files.sample_sheet.create_sample_sheet import create_sample_sheet
-from cg_lims.EPPs.files.smrt_link.run_design import create_smrtlink_run_design
-from cg_lims.EPPs.files.smrt_link.sample_setup import create_smrtlink_sample_setup
+from cg_lims import options
+from cg_lims.lazy import LazyGroup
+from cg_lims.put.write_back import write_back_session
+
+COMMANDS: Dict[str, str] = {
+    "csv-well-to-udf": "cg_lims.EPPs.files.parsers.file_to_udf:csv_well_to_udf",
+    "pool-map": "cg_lims.EPPs.files.pooling_map.make_pooling_map:pool_map",
+    "placement-map": "cg_lims.EPPs.files.placement_map.make_96well_placement_map:placement_map",
+    "hamilton": "cg_lims.EPPs.files.hamilton.base:hamilton",
+    "trouble-shoot-kapa": "cg_lims.EPPs.files.csv_for_kapa_truble_shooting.csv_for_kapa_debug:trouble_shoot_kapa",
+    "make-barcode-file": "cg_lims.EPPs.files.barcode_tubes:make_barcode_file",
+    "create-ont-sample-sheet": "cg_lims.EPPs.files.sample_sheet.create_ont_sample_sheet:create_ont_sample_sheet",
+    "create-sample-sheet": "cg_lims.EPPs.files.sample_sheet.create_sample_sheet:create_sample_sheet",
+    "parse-run-parameters": "cg_lims.EPPs.files.parsers.illumina_xml_to_udf:parse_run_parameters",
+    "parse-ont-report": "cg_lims.EPPs.files.parsers.ont_json_to_udf:parse_ont_report",
+    "make-femtopulse-csv": "cg_lims.EPPs.files.femtopulse_csv:make_femtopulse_csv",
+    "create-smrtlink-sample-setup": "cg_lims.EPPs.files.smrt_link.sample_setup:create_smrtlink_sample_setup",
+    "create-smrtlink-run-design": "cg_lims.EPPs.files.smrt_link.run_design:create_smrtlink_run_design",
+    "quantit-excel-to-udf": "cg_lims.EPPs.files.parsers.quantit_excel_to_udf:quantit_excel_to_udf",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
+@options.batch_write()
 @click.pass_context
-def files(ctx):
+def files(ctx, batch_write: bool):
     """Main entry point of file commands"""
-    pass
-
 
-files.add_command(csv_well_to_udf)
-files.add_command(pool_map)
-files.add_command(placement_map)
-files.add_command(hamilton)
-files.add_command(trouble_shoot_kapa)
-files.add_command(make_barcode_file)
-files.add_command(create_ont_sample_sheet)
-files.add_command(create_sample_sheet)
-files.add_command(parse_run_parameters)
-files.add_command(parse_ont_report)
-files.add_command(make_femtopulse_csv)
-files.add_command(create_smrtlink_sample_setup)
-files.add_command(create_smrtlink_run_design)
-files.add_command(quantit_excel_to_udf)
+    if batch_write:
+        ctx.with_resource(write_back_session(context_object=ctx.obj))
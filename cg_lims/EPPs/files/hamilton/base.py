@@ -1,20 +1,19 @@
+from typing import Dict
+
 import click
-from cg_lims.EPPs.files.hamilton.buffer_exchange_twist_file import buffer_exchange_twist_file
-from cg_lims.EPPs.files.hamilton.make_kapa_csv import make_kapa_csv
-from cg_lims.EPPs.files.hamilton.make_target_enrichment_csv import make_target_enrichment_csv
-from cg_lims.EPPs.files.hamilton.normalization_file import barcode_file
-from cg_lims.EPPs.files.hamilton.sars_cov2_prep_file import sars_cov2_prep_file
+from cg_lims.lazy import LazyGroup
+
+COMMANDS: Dict[str, str] = {
+    "make-kapa-csv": "cg_lims.EPPs.files.hamilton.make_kapa_csv:make_kapa_csv",
+    "make-target-enrichment-csv": "cg_lims.EPPs.files.hamilton.make_target_enrichment_csv:make_target_enrichment_csv",
+    "barcode-file": "cg_lims.EPPs.files.hamilton.normalization_file:barcode_file",
+    "sars-cov2-prep-file": "cg_lims.EPPs.files.hamilton.sars_cov2_prep_file:sars_cov2_prep_file",
+    "buffer-exchange-twist-file": "cg_lims.EPPs.files.hamilton.buffer_exchange_twist_file:buffer_exchange_twist_file",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @click.pass_context
 def hamilton(ctx):
     """Main entry point of hamilton file commands"""
     pass
-
-
-hamilton.add_command(make_kapa_csv)
-hamilton.add_command(make_target_enrichment_csv)
-hamilton.add_command(barcode_file)
-hamilton.add_command(sars_cov2_prep_file)
-hamilton.add_command(buffer_exchange_twist_file)
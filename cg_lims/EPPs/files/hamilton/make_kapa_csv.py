@@ -9,6 +9,7 @@ from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.files.manage_csv_files import make_plate_file
 from cg_lims.get.artifacts import get_artifacts, get_latest_analyte
 from cg_lims.get.fields import get_index_well
+from cg_lims.put.write_back import flush_write_back
 from genologics.lims import Lims
 
 LOG = logging.getLogger(__name__)
@@ -121,6 +122,7 @@ def make_kapa_csv(ctx: click.Context, file: str, extension: str, process_types:
 
     try:
         get_file_data_and_write(lims, process_types, artifacts, file_name)
+        flush_write_back(ctx.obj)
         click.echo("The file was successfully generated.")
     except LimsError as e:
         sys.exit(e.message)
@@ -1,15 +1,21 @@
-import csv
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Dict, List, Tuple
 
 import click
 from cg_lims import options
-from cg_lims.exceptions import ArgumentError, LimsError, MissingArtifactError, MissingFileError
+from cg_lims.exceptions import ArgumentError, LimsError, MissingArtifactError
+from cg_lims.files.result_file_ingestion import (
+    ResultFileIngestion,
+    check_result_file,
+    open_csv_rows,
+)
 from cg_lims.get.artifacts import create_well_dict, get_artifact_by_name
 from cg_lims.get.files import get_file_path
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
+from genologics.lims import Lims
 
 LOG = logging.getLogger(__name__)
 
@@ -64,39 +70,25 @@ def get_file_placeholder_paths(placeholder_names: List[str], process: Process) -
 
 
 def set_udfs_from_file(
-    well_field: str, udf_vf_dict: Dict[str, str], well_dict: Dict[str, Artifact], result_file: Path
+    well_field: str,
+    udf_vf_dict: Dict[str, str],
+    ingestion: ResultFileIngestion,
+    result_file: Path,
 ) -> List[str]:
-    """Parse a CSV file and set the corresponding UDF values for each sample."""
+    """Parse a CSV file and collect the corresponding UDF values for each sample."""
     error_msg: List[str] = []
-    passed_arts: int = 0
-    with open(result_file, newline="", encoding="latin1") as csvfile:
-        reader: csv.DictReader = csv.DictReader(csvfile)
-        for sample in reader:
-            well: str = sample.get(well_field)
-            if well not in well_dict:
-                LOG.info(f"Well {well} was not found in the step. Skipping!")
-                continue
-            artifact: Artifact = well_dict[well]
-            for udf_name in list(udf_vf_dict.keys()):
-                if udf_vf_dict[udf_name] not in reader.fieldnames:
-                    LOG.info(
-                        f"Value {udf_vf_dict[udf_name]} does not exist in file {result_file}, skipping."
-                    )
-                    continue
-                value_field: str = udf_vf_dict[udf_name]
-                value: Any = sample.get(value_field)
-                if not value:
-                    error_msg.append("Some samples in the file had missing values.")
-                    LOG.info(f"Missing value for sample {sample} in well {well}. Skipping!")
-                    continue
-                try:
-                    artifact.udf[udf_name] = str(value)
-                except:
-                    artifact.udf[udf_name] = float(value)
-                artifact.put()
-                passed_arts += 1
-
-    if passed_arts < len(well_dict.keys()):
+    missing_values: int = ingestion.missing_values
+    with open_csv_rows(result_file=result_file) as rows:
+        patched_wells: int = ingestion.ingest_rows(
+            rows=rows,
+            well_column=well_field,
+            udf_columns=udf_vf_dict,
+            coercers={udf_name: str for udf_name in udf_vf_dict},
+            source=f"file {result_file}",
+        )
+    if ingestion.missing_values > missing_values:
+        error_msg.append("Some samples in the file had missing values.")
+    if patched_wells < len(ingestion.well_dict.keys()):
         error_msg.append("Some samples in the step were not represented in the file.")
 
     return error_msg
@@ -104,22 +96,25 @@ def set_udfs_from_file(
 
 def set_udfs(
     param_dict: Dict[str, Dict[str, Dict[str, str]]],
-    well_dict: dict,
+    well_dict: Dict[str, Artifact],
+    lims: Lims,
 ) -> None:
-    """Loop through each given file and parse out the given values which are then set to their corresponding UDFs."""
+    """Loop through each given file and parse out the given values which are then set to their
+    corresponding UDFs. All artifacts are written back together once every file is parsed."""
 
     error_message: List[str] = []
+    ingestion = ResultFileIngestion(well_dict=well_dict)
 
     for file in param_dict.keys():
         well_field: str = param_dict[file]["Well Name"]
-        if not Path(file).is_file():
-            raise MissingFileError(f"No such file: {file}")
+        check_result_file(result_file=Path(file))
         error_message += set_udfs_from_file(
             well_field=well_field,
             udf_vf_dict=param_dict[file]["UDF"],
-            well_dict=well_dict,
+            ingestion=ingestion,
             result_file=Path(file),
         )
+    ingestion.apply(lims=lims)
 
     if error_message:
         error_string: str = " ".join(list(set(error_message)))
@@ -160,10 +155,8 @@ def csv_well_to_udf(
         param_dict: Dict[str, Dict[str, Dict[str, str]]] = make_parameter_dict(
             udfs=udfs, value_fields=value_fields, files=files, well_fields=well_fields
         )
-        set_udfs(
-            param_dict=param_dict,
-            well_dict=well_dict,
-        )
+        set_udfs(param_dict=param_dict, well_dict=well_dict, lims=process.lims)
+        flush_write_back(ctx.obj)
         click.echo("The UDFs were successfully populated.")
     except LimsError as e:
         sys.exit(e.message)
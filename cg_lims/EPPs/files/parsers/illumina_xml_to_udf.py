@@ -9,6 +9,7 @@ from xml.etree import ElementTree
 import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingFileError
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Process
 from genologics.lims import Lims
 
@@ -138,6 +139,7 @@ def parse_run_parameters(ctx, local_file: str):
             raise MissingFileError(message)
         xml: ElementTree = parse_xml_file(file_path=Path(file_path))
         set_process_udfs(xml=xml, process=process)
+        flush_write_back(ctx.obj)
         click.echo("The UDFs were successfully set.")
     except LimsError as e:
         LOG.error(e.message)
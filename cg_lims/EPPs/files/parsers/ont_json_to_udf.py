@@ -11,6 +11,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingFileError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -125,6 +126,7 @@ def parse_ont_report(ctx, root_path: str):
             json_dict: Dict = parse_html(file_path=file_path)
             set_sequencing_qc(artifact=artifact, json_dict=json_dict)
 
+        flush_write_back(ctx.obj)
         click.echo("Sequencing metrics were successfully read!")
     except LimsError as e:
         LOG.error(e.message)
@@ -4,38 +4,44 @@ from pathlib import Path
 from typing import Dict
 
 import click
-import pandas as pd
 from cg_lims import options
-from cg_lims.exceptions import LimsError, MissingArtifactError, MissingFileError
+from cg_lims.exceptions import LimsError, MissingArtifactError
+from cg_lims.files.result_file_ingestion import (
+    ResultFileIngestion,
+    check_result_file,
+    open_excel_rows,
+)
 from cg_lims.get.artifacts import create_well_dict, get_artifact_by_name
 from cg_lims.get.files import get_file_path
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
+from genologics.lims import Lims
 
 LOG = logging.getLogger(__name__)
 
 
-def set_udfs(udf: str, well_dict: Dict[str, Artifact], result_file: Path):
+QUANTIT_SKIP_ROWS = 11
+QUANTIT_WELL_COLUMN = 0
+QUANTIT_VALUE_COLUMN = 2
+
+
+def set_udfs(udf: str, well_dict: Dict[str, Artifact], result_file: Path, lims: Lims):
     """Reads the Quant-iT Excel file and sets the value for each sample"""
 
-    failed_artifacts: int = 0
-    df: pd.DataFrame = pd.read_excel(result_file, skiprows=11, header=None)
-    for index, row in df.iterrows():
-        if row[0] not in well_dict.keys():
-            LOG.info(f"Well {row[0]} is not used by a sample in the step, skipping.")
-            continue
-        elif pd.isna(row[2]):
-            LOG.info(
-                f"Well {row[0]} does not have a valid concentration value ({row[2]}), skipping."
-            )
-            failed_artifacts += 1
-            continue
-        artifact: Artifact = well_dict[row[0]]
-        artifact.udf[udf] = row[2]
-        artifact.put()
+    ingestion = ResultFileIngestion(well_dict=well_dict)
+    with open_excel_rows(result_file=result_file, skip_rows=QUANTIT_SKIP_ROWS) as rows:
+        ingestion.ingest_rows(
+            rows=rows,
+            well_column=QUANTIT_WELL_COLUMN,
+            udf_columns={udf: QUANTIT_VALUE_COLUMN},
+            header=False,
+            source=f"file {result_file}",
+        )
+    ingestion.apply(lims=lims)
 
-    if failed_artifacts:
+    if ingestion.missing_values:
         raise MissingArtifactError(
-            f"Warning: Skipped {failed_artifacts} artifact(s) with wrong and/or blank values for some UDFs."
+            f"Warning: Skipped {ingestion.missing_values} artifact(s) with wrong and/or blank values for some UDFs."
         )
 
 
@@ -64,12 +70,12 @@ def quantit_excel_to_udf(
         file_path: str = get_file_path(file_art)
 
     try:
-        if not Path(file_path).is_file():
-            raise MissingFileError(f"No such file: {file_path}")
+        check_result_file(result_file=Path(file_path))
         well_dict: Dict[str, Artifact] = create_well_dict(
             process=process, input_flag=input, quantit_well_format=True
         )
-        set_udfs(udf=udf, well_dict=well_dict, result_file=Path(file_path))
+        set_udfs(udf=udf, well_dict=well_dict, result_file=Path(file_path), lims=process.lims)
+        flush_write_back(ctx.obj)
         click.echo(f"Updated {len(well_dict.keys())} artifact(s) successfully.")
     except LimsError as e:
         sys.exit(e.message)
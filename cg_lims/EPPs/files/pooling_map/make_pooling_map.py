@@ -19,12 +19,18 @@ from cg_lims.EPPs.files.pooling_map.models import (
 from cg_lims.exceptions import LimsError
 from cg_lims.get.artifacts import get_artifacts
 from genologics.entities import Artifact, Process, Sample
-from matplotlib import colors
 
-COLORS: List[str] = list(colors.XKCD_COLORS.values())
 LOG = logging.getLogger(__name__)
 
 
+def get_container_colors() -> List[str]:
+    """Colors to tell the source containers apart. matplotlib is imported here, as it is only needed
+    for its color table and slow to import."""
+    from matplotlib import colors
+
+    return list(colors.XKCD_COLORS.values())
+
+
 def add_pool_info(
     pool_udfs: List[str],
     pool: Artifact,
@@ -72,6 +78,7 @@ def make_html(
     header_info = PlacementMapHeader(process_type=process.type.name, date=date.today().isoformat())
     html.append(PLACEMENT_MAP_HEADER.format(**header_info.dict()))
     source_containers: Dict[str, str] = {}
+    container_colors: List[str] = get_container_colors()
     for pool in pools:
         artifacts: List[Tuple[str, Artifact]] = [
             (artifact.location[1], artifact) for artifact in pool.input_artifact_list()
@@ -95,7 +102,7 @@ def make_html(
             sample: Sample = artifact.samples[0]
             sample_warning_color: str = "#F08080" if artifact.udf.get("Warning") else "#FFFFFF"
             if artifact.container.name not in source_containers.keys():
-                source_container_color: str = COLORS.pop(0)
+                source_container_color: str = container_colors.pop(0)
                 source_containers[artifact.container.name] = source_container_color
             sample_table_values = SampleTableSection(
                 sample_id=sample.id,
@@ -1,10 +1,13 @@
 import logging
+import os
 import re
 import sys
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 
 import click
 from cg_lims import options
+from cg_lims.EPPs.files.sample_sheet.index_collisions import LaneIndexCollisions
 from cg_lims.EPPs.files.sample_sheet.models import (
     IlluminaIndex,
     IndexSetup,
@@ -14,8 +17,10 @@ from cg_lims.EPPs.files.sample_sheet.models import (
     SampleSheetHeader,
 )
 from cg_lims.exceptions import InvalidValueError, LimsError
-from cg_lims.get.artifacts import get_artifact_lane, get_artifacts, get_non_pooled_artifacts
-from genologics.entities import Artifact, Process, ReagentType
+from cg_lims.get.artifacts import get_artifact_lane, get_artifacts
+from cg_lims.get.pool_resolver import PoolResolver
+from cg_lims.get.reagent_catalog import get_reagent_catalog
+from genologics.entities import Artifact, Process
 from genologics.lims import Lims
 
 LOG = logging.getLogger(__name__)
@@ -35,19 +40,17 @@ def get_reagent_label(artifact: Artifact) -> Optional[str]:
 def get_reagent_index(lims: Lims, label: str) -> str:
     """Return the index sequence from a given reagent label"""
 
-    reagent_types: List[ReagentType] = lims.get_reagent_types(name=label)
+    sequences: List[Optional[str]] = get_reagent_catalog(lims=lims).get_sequences(label=label)
 
-    if len(reagent_types) > 1:
+    if len(sequences) > 1:
         LOG.error(
-            f"Got an unexpected amount of reagent types ({len(reagent_types)}), for label {label}."
+            f"Got an unexpected amount of reagent types ({len(sequences)}), for label {label}."
         )
-        raise ValueError(f"Expecting at most one reagent type. Got {len(reagent_types)}.")
+        raise ValueError(f"Expecting at most one reagent type. Got {len(sequences)}.")
 
-    try:
-        reagent_type = reagent_types.pop()
-    except IndexError:
+    if not sequences:
         return ""
-    sequence: str = reagent_type.sequence
+    sequence: str = sequences[0]
 
     match = re.match(r"^.+ \((.+)\)$", label)
     if match and match.group(1) != sequence:
@@ -106,79 +109,24 @@ def get_index_list(artifacts: List[Artifact]) -> List[IlluminaIndex]:
     return index_list
 
 
-def string_hamming_distance(index_1: str, index_2: str) -> Optional[int]:
-    """Return the hamming distance of two strings."""
-    if len(index_1) != len(index_2):
-        return None
-    return sum(n1 != n2 for n1, n2 in zip(index_1, index_2))
-
-
-def calculate_index_hamming_distance(
-    index_1: IlluminaIndex, index_2: IlluminaIndex
-) -> Optional[int]:
-    """Calculate and return the hamming distance of two indexes."""
-    if index_1.type != index_2.type:
-        return None
-    elif len(index_1.sequence) == len(index_2.sequence):
-        return string_hamming_distance(index_1=index_1.sequence, index_2=index_2.sequence)
-    elif len(index_1.sequence) < len(index_2.sequence):
-        if index_1.type == IndexType.INDEX_1:
-            return string_hamming_distance(
-                index_1=index_1.sequence, index_2=index_2.sequence[: len(index_1.sequence)]
-            )
-        elif index_1.type == IndexType.INDEX_2:
-            return string_hamming_distance(
-                index_1=index_1.sequence, index_2=index_2.sequence[-len(index_1.sequence) :]
-            )
-    else:
-        if index_1.type == IndexType.INDEX_1:
-            return string_hamming_distance(
-                index_1=index_1.sequence[: len(index_2.sequence)], index_2=index_2.sequence
-            )
-        elif index_1.type == IndexType.INDEX_2:
-            return string_hamming_distance(
-                index_1=index_1.sequence[-len(index_2.sequence) :], index_2=index_2.sequence
-            )
-    message: str = (
-        f"Non-supported index type identified for indexes {index_1.sequence} and {index_2.sequence}: '{index_1.type}'."
-    )
-    LOG.error(message)
-    raise InvalidValueError(message)
-
-
-def get_barcode_mismatches(index: IlluminaIndex, all_indexes: List[IlluminaIndex]) -> int:
-    """Return the highest number of barcode mismatches allowed for an index."""
+def check_duplicate_indexes(all_indexes: List[IlluminaIndex]) -> None:
     if len(all_indexes) > len(set(all_indexes)):
         message: str = f"Duplicate indexes have been identified! Aborting sample sheet generation."
         LOG.error(message)
         raise InvalidValueError(message)
-    for comparison_index in all_indexes:
-        hamming_distance: int = calculate_index_hamming_distance(
-            index_1=index, index_2=comparison_index
-        )
-        if comparison_index.sequence == index.sequence or hamming_distance is None:
-            continue
-        elif hamming_distance < 3:
-            LOG.info(
-                f"Low hamming distance ({hamming_distance}) found between indexes {index.sequence} and {comparison_index.sequence}. "
-                f"Setting barcode mismatches to 0."
-            )
-            return 0
-    return 1
 
 
 def get_lane_sample_object(
-    run_settings: NovaSeqXRun, lane: int, artifact: Artifact, all_indexes: List[IlluminaIndex]
+    run_settings: NovaSeqXRun,
+    lane: int,
+    artifact: Artifact,
+    index_collisions: LaneIndexCollisions,
 ) -> LaneSample:
     """Return a LaneSample object representing the data of a lane-sample row in the BCLConvert_Data section."""
     indexes: List[IlluminaIndex] = get_sample_indexes(artifact=artifact)
     if len(indexes) == IndexSetup.DUAL_INDEX:
-        barcode_mismatch_index_1: int = get_barcode_mismatches(
-            index=indexes[0], all_indexes=all_indexes
-        )
-        barcode_mismatch_index_2: int = get_barcode_mismatches(
-            index=indexes[1], all_indexes=all_indexes
-        )
+        barcode_mismatch_index_1: int = index_collisions.get_barcode_mismatches(index=indexes[0])
+        barcode_mismatch_index_2: int = index_collisions.get_barcode_mismatches(index=indexes[1])
         return LaneSample(
             run_settings=run_settings,
             lane=lane,
@@ -189,9 +137,7 @@ def get_lane_sample_object(
             barcode_mismatch_index_2=barcode_mismatch_index_2,
         )
     elif len(indexes) == IndexSetup.SINGLE_INDEX:
-        barcode_mismatch_index_1: int = get_barcode_mismatches(
-            index=indexes[0], all_indexes=all_indexes
-        )
+        barcode_mismatch_index_1: int = index_collisions.get_barcode_mismatches(index=indexes[0])
         return LaneSample(
             run_settings=run_settings,
             lane=lane,
@@ -206,40 +152,64 @@ def get_lane_sample_object(
     raise ValueError(message)
 
 
-def create_bcl_data_section(run_settings: NovaSeqXRun) -> str:
-    """Return the BCLConvert_Data section of the sample sheet."""
-    section: str = f"{SampleSheetHeader.BCL_DATA_SECTION}"
-    section = section + run_settings.get_bcl_data_header_row()
-    lane_artifacts: Dict[int, Artifact] = get_lane_artifacts(process=run_settings.process)
-    for lane in lane_artifacts:
-        unpooled_artifacts: List[Artifact] = get_non_pooled_artifacts(artifact=lane_artifacts[lane])
-        pool_indexes: List[IlluminaIndex] = get_index_list(artifacts=unpooled_artifacts)
-        for artifact in unpooled_artifacts:
-            lane_sample = get_lane_sample_object(
-                run_settings=run_settings,
-                lane=lane,
-                artifact=artifact,
-                all_indexes=pool_indexes,
-            )
-            section = section + lane_sample.get_bclconversion_data_row()
-    return section
-
-
-def create_sample_sheet_from_process(process: Process) -> str:
-    """Return the sample sheet content from a given sequencing run set-up process."""
+def iter_lane_rows(
+    run_settings: NovaSeqXRun, lane: int, artifacts: List[Artifact]
+) -> Iterator[str]:
+    """Yield the BCLConvert_Data rows of the non pooled artifacts of a lane."""
+    pool_indexes: List[IlluminaIndex] = get_index_list(artifacts=artifacts)
+    check_duplicate_indexes(all_indexes=pool_indexes)
+    index_collisions = LaneIndexCollisions(indexes=pool_indexes)
+    index_collisions.log_collisions(lane=lane)
+    for artifact in artifacts:
+        lane_sample: LaneSample = get_lane_sample_object(
+            run_settings=run_settings,
+            lane=lane,
+            artifact=artifact,
+            index_collisions=index_collisions,
+        )
+        yield lane_sample.get_bclconversion_data_row()
+
+
+def iter_bcl_data_section(
+    run_settings: NovaSeqXRun, lane_leaves: Dict[int, List[Artifact]]
+) -> Iterator[str]:
+    """Yield the BCLConvert_Data section of the sample sheet, lane by lane."""
+    yield f"{SampleSheetHeader.BCL_DATA_SECTION}"
+    yield run_settings.get_bcl_data_header_row()
+    for lane, artifacts in lane_leaves.items():
+        yield from iter_lane_rows(run_settings=run_settings, lane=lane, artifacts=artifacts)
+
+
+def get_lane_leaves(process: Process) -> Dict[int, List[Artifact]]:
+    """Return the non pooled artifacts of each lane of the process, sorted by lane."""
+    lane_artifacts: Dict[int, Artifact] = get_lane_artifacts(process=process)
+    return PoolResolver(lims=process.lims).resolve(pools=lane_artifacts)
+
+
+def iter_sample_sheet(process: Process) -> Iterator[str]:
+    """Yield the sample sheet of a sequencing run set-up process, section by section and row by
+    row as they are computed."""
     run_settings: NovaSeqXRun = NovaSeqXRun(process=process)
-    sample_sheet = (
-        run_settings.create_head_section()
-        + run_settings.create_reads_section()
-        + run_settings.create_sequencing_settings_section()
-    )
+    get_reagent_catalog(lims=process.lims).sync()
+    yield from run_settings.iter_header_sections()
     if process.udf["DRAGEN Demultiplex"]:
-        sample_sheet = (
-            sample_sheet
-            + create_bcl_settings_section(run_settings=run_settings)
-            + create_bcl_data_section(run_settings=run_settings)
+        yield create_bcl_settings_section(run_settings=run_settings)
+        yield from iter_bcl_data_section(
+            run_settings=run_settings, lane_leaves=get_lane_leaves(process=process)
         )
-    return sample_sheet
+
+
+def write_sample_sheet(process: Process, file_path: Path) -> None:
+    """Stream the sample sheet of a process to a file. The file is only put in place once the
+    whole sample sheet has been written."""
+    temporary_path: Path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        with open(temporary_path, "w") as file:
+            NovaSeqXRun.write_sample_sheet(content=iter_sample_sheet(process=process), file=file)
+        os.replace(temporary_path, file_path)
+    finally:
+        if temporary_path.exists():
+            temporary_path.unlink()
 
 
 @click.command()
@@ -252,10 +222,8 @@ def create_sample_sheet(ctx, file: str):
     process = ctx.obj["process"]
 
     try:
-        sample_sheet_content: str = create_sample_sheet_from_process(process=process)
         run_name: str = process.udf.get("BaseSpace Run Name")
-        with open(f"{file}_samplesheet_{run_name}.csv", "w") as file:
-            file.write(sample_sheet_content)
+        write_sample_sheet(process=process, file_path=Path(f"{file}_samplesheet_{run_name}.csv"))
         click.echo("The sample sheet was successfully generated.")
     except LimsError as e:
         sys.exit(e.message)
@@ -0,0 +1,101 @@
+import logging
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+from cg_lims.EPPs.files.sample_sheet.models import IlluminaIndex, IndexType
+from cg_lims.exceptions import InvalidValueError
+
+LOG = logging.getLogger(__name__)
+
+MIN_HAMMING_DISTANCE = 3
+BLOCK_SIZE = 256
+
+
+class IndexCollision(NamedTuple):
+    type: str
+    sequence_1: str
+    sequence_2: str
+    distance: int
+
+
+class LaneIndexCollisions:
+    """
+    Pairwise Hamming distances between all indexes of a lane, and the barcode mismatches allowed
+    for each index.
+
+    The distinct sequences of each index type are encoded once into a uint8 matrix, INDEX_1
+    sequences aligned to the left and INDEX_2 sequences aligned to the right. Sequences of
+    different lengths are then compared on their common prefix (INDEX_1) or suffix (INDEX_2).
+    The distances are computed in blocks of <block_size> rows against the whole matrix. An index
+    closer than MIN_HAMMING_DISTANCE to any other sequence of its type gets 0 barcode mismatches,
+    all other indexes get 1.
+    """
+
+    def __init__(self, indexes: List[IlluminaIndex], block_size: int = BLOCK_SIZE):
+        self.block_size: int = block_size
+        self.collisions: List[IndexCollision] = []
+        self._mismatches: Dict[Tuple[str, str], int] = {}
+
+        sequences_per_type: Dict[str, List[str]] = {}
+        for index in indexes:
+            sequences_per_type.setdefault(index.type, [])
+            if index.sequence not in sequences_per_type[index.type]:
+                sequences_per_type[index.type].append(index.sequence)
+        for index_type, sequences in sequences_per_type.items():
+            self._compare_sequences(index_type=index_type, sequences=sequences)
+
+    def _encode(self, index_type: str, sequences: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the sequences as a matrix of ascii codes and a mask of the used positions."""
+        lengths: np.ndarray = np.array([len(sequence) for sequence in sequences])
+        width: int = int(lengths.max(initial=0))
+        if index_type not in (IndexType.INDEX_1, IndexType.INDEX_2) and np.any(lengths != width):
+            message: str = f"Non-supported index type identified for indexes: '{index_type}'."
+            LOG.error(message)
+            raise InvalidValueError(message)
+
+        encoded: np.ndarray = np.zeros((len(sequences), width), dtype=np.uint8)
+        positions: np.ndarray = np.arange(width)
+        if index_type == IndexType.INDEX_2:
+            used: np.ndarray = positions[None, :] >= (width - lengths)[:, None]
+        else:
+            used: np.ndarray = positions[None, :] < lengths[:, None]
+        encoded[used] = np.frombuffer("".join(sequences).encode("ascii"), dtype=np.uint8)
+        return encoded, used
+
+    def _compare_sequences(self, index_type: str, sequences: List[str]) -> None:
+        encoded, used = self._encode(index_type=index_type, sequences=sequences)
+        close: np.ndarray = np.zeros(len(sequences), dtype=bool)
+        for start in range(0, len(sequences), self.block_size):
+            stop: int = min(start + self.block_size, len(sequences))
+            distances: np.ndarray = (
+                (encoded[start:stop, None, :] != encoded[None, :, :])
+                & used[start:stop, None, :]
+                & used[None, :, :]
+            ).sum(axis=2)
+            distances[np.arange(stop - start), np.arange(start, stop)] = MIN_HAMMING_DISTANCE
+            close_pairs: np.ndarray = distances < MIN_HAMMING_DISTANCE
+            close[start:stop] |= close_pairs.any(axis=1)
+            for row, column in zip(*np.nonzero(close_pairs)):
+                if start + row < column:
+                    self.collisions.append(
+                        IndexCollision(
+                            type=index_type,
+                            sequence_1=sequences[start + row],
+                            sequence_2=sequences[column],
+                            distance=int(distances[row, column]),
+                        )
+                    )
+        for sequence, is_close in zip(sequences, close):
+            self._mismatches[(index_type, sequence)] = 0 if is_close else 1
+
+    def get_barcode_mismatches(self, index: IlluminaIndex) -> int:
+        """Return the highest number of barcode mismatches allowed for an index of the lane."""
+        return self._mismatches[(index.type, index.sequence)]
+
+    def log_collisions(self, lane: int) -> None:
+        for collision in self.collisions:
+            LOG.info(
+                f"Low hamming distance ({collision.distance}) found in lane {lane} between "
+                f"indexes {collision.sequence_1} and {collision.sequence_2}. "
+                f"Setting barcode mismatches to 0."
+            )
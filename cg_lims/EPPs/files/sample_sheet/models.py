@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import Iterable, Iterator, Optional, TextIO
 
 from cg_lims.enums import IntEnum, StrEnum
 from genologics.lims import Process
@@ -94,6 +94,18 @@ class NovaSeqXRun:
             f"InputContainerIdentifier,{self.library_tube_id}\n"
         )
 
+    def iter_header_sections(self) -> Iterator[str]:
+        """Yield the [Header], [Reads] and [Sequencing_Settings] sections of the sample sheet."""
+        yield self.create_head_section()
+        yield self.create_reads_section()
+        yield self.create_sequencing_settings_section()
+
+    @staticmethod
+    def write_sample_sheet(content: Iterable[str], file: TextIO) -> None:
+        """Write sample sheet sections and rows to an open file or buffer as they are produced."""
+        for chunk in content:
+            file.write(chunk)
+
     def get_bcl_data_header_row(self) -> str:
         """Return the .csv-header of the BCLConvert_Data content section."""
         base_header = f"\nLane,Sample_ID,Index"
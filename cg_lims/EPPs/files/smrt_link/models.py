@@ -5,8 +5,9 @@ from typing import Any, Dict, List, Optional, Pattern
 import pandas as pd
 from cg_lims.enums import StrEnum
 from cg_lims.exceptions import MissingUDFsError
-from cg_lims.get.artifacts import get_artifacts, get_non_pooled_artifacts
+from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.fields import get_alternative_artifact_well, get_smrtbell_adapter_name
+from cg_lims.get.pool_resolver import PoolResolver
 from genologics.lims import Artifact, Container, Process
 
 LOG = logging.getLogger(__name__)
@@ -284,8 +285,10 @@ class RevioRun:
     def _get_sample_settings(self) -> str:
         """Return the [SMRT Cell Settings] section of the run design."""
         section = f"Bio Sample Name,Plate Well,Adapter,Adapter2"
-        for well, pool in self.pools.items():
-            artifacts: List[Artifact] = get_non_pooled_artifacts(artifact=pool)
+        well_leaves: Dict[str, List[Artifact]] = PoolResolver(lims=self.process.lims).resolve(
+            pools=self.pools
+        )
+        for well, artifacts in well_leaves.items():
             for artifact in artifacts:
                 row = (
                     f"\n{artifact.samples[0].id},"
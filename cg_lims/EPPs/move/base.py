@@ -1,20 +1,18 @@
 #!/usr/bin/env python
-import click
+from typing import Dict
 
-from cg_lims.EPPs.move.move_samples import move_samples
-from cg_lims.EPPs.move.place_samples_in_seq_agg import place_samples_in_seq_agg
+import click
+from cg_lims.lazy import LazyGroup
 
-# commands
-from cg_lims.EPPs.move.rerun_samples import rerun_samples
+COMMANDS: Dict[str, str] = {
+    "rerun-samples": "cg_lims.EPPs.move.rerun_samples:rerun_samples",
+    "move-samples": "cg_lims.EPPs.move.move_samples:move_samples",
+    "place-samples-in-seq-agg": "cg_lims.EPPs.move.place_samples_in_seq_agg:place_samples_in_seq_agg",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @click.pass_context
 def move(ctx):
     """Main entry point of move commands"""
     pass
-
-
-move.add_command(rerun_samples)
-move.add_command(move_samples)
-move.add_command(place_samples_in_seq_agg)
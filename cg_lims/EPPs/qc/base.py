@@ -1,17 +1,18 @@
 #!/usr/bin/env python
+from typing import Dict
+
 import click
-from cg_lims.EPPs.qc.illumina_sequencing_quality_control import sequencing_quality_control
-from cg_lims.EPPs.qc.pacbio_sequencing_quality_control import pacbio_sample_sequencing_metrics
-from cg_lims.EPPs.qc.set_qc_fail import set_qc_fail
+from cg_lims.lazy import LazyGroup
+
+COMMANDS: Dict[str, str] = {
+    "set-qc-fail": "cg_lims.EPPs.qc.set_qc_fail:set_qc_fail",
+    "sequencing-quality-control": "cg_lims.EPPs.qc.illumina_sequencing_quality_control:sequencing_quality_control",
+    "pacbio-sample-sequencing-metrics": "cg_lims.EPPs.qc.pacbio_sequencing_quality_control:pacbio_sample_sequencing_metrics",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @click.pass_context
 def qc(ctx):
     """Main entry point of move commands"""
     pass
-
-
-qc.add_command(set_qc_fail)
-qc.add_command(sequencing_quality_control)
-qc.add_command(pacbio_sample_sequencing_metrics)
@@ -2,15 +2,18 @@ import logging
 import sys
 
 import click
+from cg_lims import options
 from cg_lims.EPPs.qc.sequencing_artifact_manager import IlluminaSequencingArtifactManager
 from cg_lims.EPPs.qc.sequencing_quality_checker import IlluminaSequencingQualityChecker
+from cg_lims.get.batch import BATCH_CHUNK_SIZE
 
 LOG = logging.getLogger(__name__)
 
 
 @click.command()
+@options.batch_size(default=BATCH_CHUNK_SIZE)
 @click.pass_context
-def sequencing_quality_control(ctx):
+def sequencing_quality_control(ctx, batch_size: int):
     """Sequencing quality control script for the BCL conversion step in LIMS."""
 
     LOG.info(f"Running {ctx.command_path} with params: {ctx.params}")
@@ -24,6 +27,7 @@ def sequencing_quality_control(ctx):
     quality_checker = IlluminaSequencingQualityChecker(
         artifact_manager=artifact_manager,
         cg_api_client=status_db_api,
+        batch_size=batch_size,
     )
 
     quality_summary: str = quality_checker.validate_sequencing_quality(lims=lims)
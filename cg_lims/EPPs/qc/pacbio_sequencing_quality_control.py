@@ -2,10 +2,12 @@ import logging
 import sys
 
 import click
+from cg_lims import options
 from cg_lims.clients.cg.status_db_api import StatusDBAPI
 from cg_lims.EPPs.qc.sequencing_artifact_manager import PacbioSequencingArtifactManager
 from cg_lims.EPPs.qc.sequencing_quality_checker import PacBioSequencingQualityChecker
 from cg_lims.exceptions import LimsError
+from cg_lims.get.batch import BATCH_CHUNK_SIZE
 from genologics.entities import Process
 from genologics.lims import Lims
 
@@ -13,8 +15,9 @@ LOG = logging.getLogger(__name__)
 
 
 @click.command()
+@options.batch_size(default=BATCH_CHUNK_SIZE)
 @click.pass_context
-def pacbio_sample_sequencing_metrics(ctx):
+def pacbio_sample_sequencing_metrics(ctx, batch_size: int):
     """Script for fetching PacBio sample sequencing results from StatusDB and set corresponding artifact UDFs."""
 
     LOG.info(f"Running {ctx.command_path} with params: {ctx.params}")
@@ -31,6 +34,7 @@ def pacbio_sample_sequencing_metrics(ctx):
         quality_checker: PacBioSequencingQualityChecker = PacBioSequencingQualityChecker(
             artifact_manager=artifact_manager,
             cg_api_client=status_db_api,
+            batch_size=batch_size,
         )
 
         quality_summary: str = quality_checker.validate_sequencing_quality(lims=lims)
@@ -1,16 +1,19 @@
 import logging
-from typing import List
+from typing import Dict, Iterable, Iterator, List
 
-from cg_lims.clients.cg.models import PacbioSampleSequencingMetrics, SampleLaneSequencingMetrics
+from cg_lims.clients.cg.models import (
+    PacbioSampleSequencingMetricsRecord,
+    SampleLaneSequencingMetricsRecord,
+)
 from cg_lims.clients.cg.status_db_api import StatusDBAPI
 from cg_lims.EPPs.qc.models import CellSample, CellSampleSet, SampleLane, SampleLaneSet
 from cg_lims.EPPs.qc.sequencing_artifact_manager import (
     IlluminaSequencingArtifactManager,
     PacbioSequencingArtifactManager,
 )
-from cg_lims.exceptions import MissingSampleError
-from cg_lims.get.samples import is_negative_control
-from genologics.entities import Sample
+from cg_lims.get.batch import BATCH_CHUNK_SIZE, chunk_entities
+from cg_lims.get.samples import get_negative_controls
+from cg_lims.put.write_back import WriteBackSession
 from genologics.lims import Lims
 
 LOG = logging.getLogger(__name__)
@@ -24,54 +27,85 @@ MISSING_IN_LIMS_MSG = (
 MISSING_IN_METRICS_MSG = "No metrics were found for the following sample sequencing artifacts:"
 
 
+def resolve_negative_controls(
+    negative_controls: Dict[str, bool], sample_ids: Iterable[str], lims: Lims
+) -> None:
+    """Store in <negative_controls> if the samples not yet resolved are negative controls."""
+    negative_controls.update(
+        get_negative_controls(
+            lims=lims,
+            sample_ids=[
+                sample_id for sample_id in sample_ids if sample_id not in negative_controls
+            ],
+        )
+    )
+
+
 class IlluminaSequencingQualityChecker:
     """This class contains the logic for validating the sequencing quality of a flow cell."""
 
     READS_MIN_THRESHOLD = 1000
 
     def __init__(
-        self, cg_api_client: StatusDBAPI, artifact_manager: IlluminaSequencingArtifactManager
+        self,
+        cg_api_client: StatusDBAPI,
+        artifact_manager: IlluminaSequencingArtifactManager,
+        batch_size: int = BATCH_CHUNK_SIZE,
     ) -> None:
         self.artifact_manager: IlluminaSequencingArtifactManager = artifact_manager
         self.cg_api_client: StatusDBAPI = cg_api_client
+        self.batch_size: int = batch_size
 
         self.q30_threshold: int = self.artifact_manager.q30_threshold
         self.flow_cell_name: str = self.artifact_manager.flow_cell_name
 
-        self.metrics: List[SampleLaneSequencingMetrics] = []
+        self.sample_lanes_in_metrics: SampleLaneSet = set()
         self.failed_qc_count: int = 0
+        self.negative_controls: Dict[str, bool] = {}
 
-    def _get_sequencing_metrics(self) -> List[SampleLaneSequencingMetrics]:
-        metrics = self.cg_api_client.get_sequencing_metrics_for_illumina_flow_cell(
+    def _get_sequencing_metrics(self) -> Iterator[SampleLaneSequencingMetricsRecord]:
+        return self.cg_api_client.iter_sequencing_metrics_for_illumina_flow_cell(
             self.flow_cell_name
         )
-        self.metrics = metrics
-        return metrics
 
     def validate_sequencing_quality(self, lims: Lims) -> str:
         """
         Validate the sequencing data for each sample in all lanes on a
         flow cell based on the number of reads and q30 scores.
+
+        The metrics are streamed from StatusDB and validated <batch_size> at a time: the samples
+        of each batch are fetched once each, with batch calls, and all updated sample artifacts
+        are written back to lims together when every lane has been validated.
         """
         LOG.info(f"Validating sequencing quality for flow cell {self.flow_cell_name}")
 
-        sequencing_metrics = self._get_sequencing_metrics()
-
-        for metrics in sequencing_metrics:
-            passed_qc: bool = self._quality_control(metrics=metrics, lims=lims)
-            self._update_sample_with_quality_results(
-                metrics=metrics, passed_quality_control=passed_qc
-            )
-
-            if not passed_qc:
-                self.failed_qc_count += 1
+        with WriteBackSession(lims=lims, chunk_size=self.batch_size):
+            for metrics_batch in chunk_entities(
+                entities=self._get_sequencing_metrics(), chunk_size=self.batch_size
+            ):
+                resolve_negative_controls(
+                    negative_controls=self.negative_controls,
+                    sample_ids=[metrics.sample_internal_id for metrics in metrics_batch],
+                    lims=lims,
+                )
+                for metrics in metrics_batch:
+                    self.sample_lanes_in_metrics.add(
+                        (metrics.sample_internal_id, metrics.flow_cell_lane_number)
+                    )
+                    passed_qc: bool = self._quality_control(metrics=metrics, lims=lims)
+                    self._update_sample_with_quality_results(
+                        metrics=metrics, passed_quality_control=passed_qc
+                    )
+
+                    if not passed_qc:
+                        self.failed_qc_count += 1
 
         self.failed_qc_count += len(self._get_sample_lanes_not_in_metrics())
 
         return self._generate_summary()
 
     def _update_sample_with_quality_results(
-        self, metrics: SampleLaneSequencingMetrics, passed_quality_control: bool
+        self, metrics: SampleLaneSequencingMetricsRecord, passed_quality_control: bool
     ) -> None:
         self.artifact_manager.update_sample(
             sample_id=metrics.sample_internal_id,
@@ -81,21 +115,18 @@ class IlluminaSequencingQualityChecker:
             passed_quality_control=passed_quality_control,
         )
 
-    def _quality_control(self, metrics: SampleLaneSequencingMetrics, lims: Lims) -> bool:
-        try:
-            sample: Sample = Sample(lims=lims, id=metrics.sample_internal_id)
-            negative_control: bool = is_negative_control(sample=sample)
-            return self._passes_quality_thresholds(
-                reads=metrics.sample_total_reads_in_lane,
-                q30_score=metrics.sample_base_percentage_passing_q30,
-                negative_control=negative_control,
-            )
-        except MissingSampleError:
-            return self._passes_quality_thresholds(
-                reads=metrics.sample_total_reads_in_lane,
-                q30_score=metrics.sample_base_percentage_passing_q30,
-                negative_control=False,
+    def _quality_control(self, metrics: SampleLaneSequencingMetricsRecord, lims: Lims) -> bool:
+        if metrics.sample_internal_id not in self.negative_controls:
+            resolve_negative_controls(
+                negative_controls=self.negative_controls,
+                sample_ids=[metrics.sample_internal_id],
+                lims=lims,
             )
+        return self._passes_quality_thresholds(
+            reads=metrics.sample_total_reads_in_lane,
+            q30_score=metrics.sample_base_percentage_passing_q30,
+            negative_control=self.negative_controls[metrics.sample_internal_id],
+        )
 
     def _passes_quality_thresholds(
         self, q30_score: float, reads: int, negative_control: bool
@@ -108,11 +139,7 @@ class IlluminaSequencingQualityChecker:
         return passes_q30_threshold and passes_read_threshold
 
     def _get_sample_lanes_in_metrics(self) -> SampleLaneSet:
-        sample_lanes = set()
-        for metrics in self.metrics:
-            sample_lane = (metrics.sample_internal_id, metrics.flow_cell_lane_number)
-            sample_lanes.add(sample_lane)
-        return sample_lanes
+        return self.sample_lanes_in_metrics
 
     def _get_sample_lanes_not_in_metrics(self) -> List[SampleLane]:
         in_lims: SampleLaneSet = self.artifact_manager.get_sample_lanes_in_lims()
@@ -176,46 +203,57 @@ class PacBioSequencingQualityChecker:
     YIELD_MIN_THRESHOLD = 10000
 
     def __init__(
-        self, cg_api_client: StatusDBAPI, artifact_manager: PacbioSequencingArtifactManager
+        self,
+        cg_api_client: StatusDBAPI,
+        artifact_manager: PacbioSequencingArtifactManager,
+        batch_size: int = BATCH_CHUNK_SIZE,
     ) -> None:
         self.artifact_manager: PacbioSequencingArtifactManager = artifact_manager
         self.cg_api_client: StatusDBAPI = cg_api_client
+        self.batch_size: int = batch_size
 
         self.smrt_cells: List[str] = self.artifact_manager.get_cells_in_lims()
 
-        self.metrics: List[PacbioSampleSequencingMetrics] = []
+        self.cell_samples_in_metrics: CellSampleSet = set()
         self.failed_qc_count: int = 0
+        self.negative_controls: Dict[str, bool] = {}
 
-    def _get_sequencing_metrics(self) -> List[PacbioSampleSequencingMetrics]:
-        metrics: List[PacbioSampleSequencingMetrics] = []
-        cell_metrics: List[PacbioSampleSequencingMetrics] = (
-            self.cg_api_client.get_pacbio_sequencing_metrics(smrt_cell_ids=self.smrt_cells)
-        )
-        metrics.extend(cell_metrics)
-        self.metrics = metrics
-        return metrics
+    def _get_sequencing_metrics(self) -> Iterator[PacbioSampleSequencingMetricsRecord]:
+        return self.cg_api_client.iter_pacbio_sequencing_metrics(smrt_cell_ids=self.smrt_cells)
 
     def validate_sequencing_quality(self, lims: Lims) -> str:
-        """Validate the sequencing data for each sample in all SMRT cells"""
-        LOG.info(f"Validating sequencing quality for SMRT Cells  {self.smrt_cells}")
-
-        sequencing_metrics = self._get_sequencing_metrics()
+        """Validate the sequencing data for each sample in all SMRT cells.
 
-        for metrics in sequencing_metrics:
-            passed_qc: bool = self._quality_control(metrics=metrics, lims=lims)
-            self._update_sample_with_quality_results(
-                metrics=metrics, passed_quality_control=passed_qc
-            )
+        The metrics are streamed from StatusDB and validated <batch_size> at a time: the
+        negative control status of the samples of each batch is resolved with batch calls, and
+        the updated sample artifacts are written back in batches of <batch_size>."""
+        LOG.info(f"Validating sequencing quality for SMRT Cells  {self.smrt_cells}")
 
-            if not passed_qc:
-                self.failed_qc_count += 1
+        with WriteBackSession(lims=lims, chunk_size=self.batch_size):
+            for metrics_batch in chunk_entities(
+                entities=self._get_sequencing_metrics(), chunk_size=self.batch_size
+            ):
+                resolve_negative_controls(
+                    negative_controls=self.negative_controls,
+                    sample_ids=[metrics.sample_id for metrics in metrics_batch],
+                    lims=lims,
+                )
+                for metrics in metrics_batch:
+                    self.cell_samples_in_metrics.add((metrics.smrt_cell_id, metrics.sample_id))
+                    passed_qc: bool = self._quality_control(metrics=metrics, lims=lims)
+                    self._update_sample_with_quality_results(
+                        metrics=metrics, passed_quality_control=passed_qc
+                    )
+
+                    if not passed_qc:
+                        self.failed_qc_count += 1
 
         self.failed_qc_count += len(self._get_cell_samples_not_in_metrics())
 
         return self._generate_summary()
 
     def _update_sample_with_quality_results(
-        self, metrics: PacbioSampleSequencingMetrics, passed_quality_control: bool
+        self, metrics: PacbioSampleSequencingMetricsRecord, passed_quality_control: bool
     ) -> None:
         self.artifact_manager.update_sample(
             sample_id=metrics.sample_id,
@@ -227,19 +265,17 @@ class PacBioSequencingQualityChecker:
             passed_quality_control=passed_quality_control,
         )
 
-    def _quality_control(self, metrics: PacbioSampleSequencingMetrics, lims: Lims) -> bool:
-        try:
-            sample: Sample = Sample(lims=lims, id=metrics.sample_id)
-            negative_control: bool = is_negative_control(sample=sample)
-            return self._passes_quality_thresholds(
-                hifi_yield=metrics.hifi_yield,
-                negative_control=negative_control,
-            )
-        except MissingSampleError:
-            return self._passes_quality_thresholds(
-                hifi_yield=metrics.hifi_yield,
-                negative_control=False,
+    def _quality_control(self, metrics: PacbioSampleSequencingMetricsRecord, lims: Lims) -> bool:
+        if metrics.sample_id not in self.negative_controls:
+            resolve_negative_controls(
+                negative_controls=self.negative_controls,
+                sample_ids=[metrics.sample_id],
+                lims=lims,
             )
+        return self._passes_quality_thresholds(
+            hifi_yield=metrics.hifi_yield,
+            negative_control=self.negative_controls[metrics.sample_id],
+        )
 
     def _passes_quality_thresholds(self, hifi_yield: int, negative_control: bool) -> bool:
         """Check if the provided metrics pass the minimum quality thresholds. Negative controls always pass."""
@@ -249,11 +285,7 @@ class PacBioSequencingQualityChecker:
         return passes_yield_threshold
 
     def _get_cell_samples_in_metrics(self) -> CellSampleSet:
-        cell_samples = set()
-        for metrics in self.metrics:
-            cell_sample = (metrics.smrt_cell_id, metrics.sample_id)
-            cell_samples.add(cell_sample)
-        return cell_samples
+        return self.cell_samples_in_metrics
 
     def _get_cell_samples_not_in_metrics(self) -> List[CellSample]:
         in_lims: CellSampleSet = self.artifact_manager.get_cell_samples_in_lims()
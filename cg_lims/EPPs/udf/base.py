@@ -1,21 +1,24 @@
 #!/usr/bin/env python
+from typing import Dict
+
 import click
-from cg_lims.EPPs.udf.calculate import calculate
-from cg_lims.EPPs.udf.check import check
+from cg_lims import options
+from cg_lims.lazy import LazyGroup
+from cg_lims.put.write_back import write_back_session
 
-# commands
-from cg_lims.EPPs.udf.copy import copy
-from cg_lims.EPPs.udf.set import set
+COMMANDS: Dict[str, str] = {
+    "copy": "cg_lims.EPPs.udf.copy.base:copy",
+    "calculate": "cg_lims.EPPs.udf.calculate.base:calculate",
+    "set": "cg_lims.EPPs.udf.set.base:set",
+    "check": "cg_lims.EPPs.udf.check.base:check",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
+@options.batch_write()
 @click.pass_context
-def udf(ctx):
+def udf(ctx, batch_write: bool):
     """Main entry point of udf commands"""
-    pass
-
 
-udf.add_command(copy)
-udf.add_command(calculate)
-udf.add_command(set)
-udf.add_command(check)
+    if batch_write:
+        ctx.with_resource(write_back_session(context_object=ctx.obj))
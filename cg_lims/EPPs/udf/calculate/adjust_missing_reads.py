@@ -6,6 +6,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import InvalidValueError, LimsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -278,6 +279,7 @@ def adjust_missing_reads(
             for app in apptag_virus:
                 if app in sample_apptag:
                     adjust_micro_artifact_reads(artifact=artifact, reset_amount=reset_virus_reads)
+        flush_write_back(ctx.obj)
         process.udf["Adjusted Reads to Sequence"] = True
         process.put()
         success_message = "Udfs have been updated on all samples."
@@ -8,6 +8,7 @@ from cg_lims import options
 from cg_lims.exceptions import ArgumentError, LimsError
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.processes import get_latest_process
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process, Sample
 from genologics.lims import Lims
 
@@ -203,6 +204,7 @@ def aggregate_sequencing_metrics(
                 lims=lims,
                 times_sequenced_udf=times_sequenced_udf,
             )
+        flush_write_back(ctx.obj)
         click.echo("All UDF values have been aggregated!")
     except LimsError as e:
         sys.exit(e.message)
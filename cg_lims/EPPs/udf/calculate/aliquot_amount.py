@@ -7,6 +7,7 @@ from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.udfs import get_maximum_amount
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -108,6 +109,7 @@ def aliquot_amount(
             amount_udf=amount_ng_udf,
             maximum_sample_amount=int(max_amount),
         )
+        flush_write_back(ctx.obj)
         message: str = "Amount needed has been calculated for all samples."
         LOG.info(message)
         click.echo(message)
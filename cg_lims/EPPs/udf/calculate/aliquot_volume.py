@@ -7,6 +7,7 @@ from cg_lims import options
 from cg_lims.exceptions import LimsError, LowVolumeError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.samples import get_one_sample_from_artifact
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -166,6 +167,7 @@ def aliquot_volume(
             amount_needed_udf=amount_ng_udf,
             minimum_limit=float(min_volume),
         )
+        flush_write_back(ctx.obj)
         message: str = "Volumes have been calculated for all samples."
         LOG.info(message)
         click.echo(message)
@@ -1,78 +1,45 @@
 #!/usr/bin/env python
 
+from typing import Dict
+
 import click
-from cg_lims.EPPs.udf.calculate.adjust_missing_reads import adjust_missing_reads
-from cg_lims.EPPs.udf.calculate.aggregate_sequencing_metrics import aggregate_sequencing_metrics
-from cg_lims.EPPs.udf.calculate.aliquot_amount import aliquot_amount
-from cg_lims.EPPs.udf.calculate.aliquot_volume import aliquot_volume
-from cg_lims.EPPs.udf.calculate.calculate_amount_ng import calculate_amount_ng
-from cg_lims.EPPs.udf.calculate.calculate_amount_ng_fmol import calculate_amount_ng_fmol
-from cg_lims.EPPs.udf.calculate.calculate_average_size_and_set_qc import (
-    calculate_average_size_and_set_qc,
-)
-from cg_lims.EPPs.udf.calculate.calculate_beads import calculate_beads
-from cg_lims.EPPs.udf.calculate.calculate_buffer import volume_buffer
-from cg_lims.EPPs.udf.calculate.calculate_microbial_aliquot_volumes import (
-    calculate_microbial_aliquot_volumes,
-)
-from cg_lims.EPPs.udf.calculate.calculate_resuspension_buffer_volumes import (
-    calculate_resuspension_buffer_volume,
-)
-from cg_lims.EPPs.udf.calculate.calculate_saphyr_concentration import calculate_saphyr_concentration
-from cg_lims.EPPs.udf.calculate.calculate_water_volume_rna import calculate_water_volume_rna
-from cg_lims.EPPs.udf.calculate.get_missing_reads import get_missing_reads
-from cg_lims.EPPs.udf.calculate.library_normalization import library_normalization
-from cg_lims.EPPs.udf.calculate.library_normalization_revio import library_normalization_revio
-from cg_lims.EPPs.udf.calculate.maf_calculate_volume import maf_calculate_volume
-from cg_lims.EPPs.udf.calculate.molar_concentration import molar_concentration
-from cg_lims.EPPs.udf.calculate.novaseq_x_denaturation import novaseq_x_denaturation
-from cg_lims.EPPs.udf.calculate.novaseq_x_volumes import novaseq_x_volumes
-from cg_lims.EPPs.udf.calculate.ont_aliquot_volume import ont_aliquot_volume
-from cg_lims.EPPs.udf.calculate.ont_sequencing_reload import ont_available_sequencing_reload
-from cg_lims.EPPs.udf.calculate.qpcr_concentration import qpcr_concentration
-from cg_lims.EPPs.udf.calculate.revio_abc_volumes import revio_abc_volumes
-from cg_lims.EPPs.udf.calculate.revio_pooling import revio_pooling
-from cg_lims.EPPs.udf.calculate.sum_missing_reads_in_pool import missing_reads_in_pool
-from cg_lims.EPPs.udf.calculate.twist_get_volumes_from_buffer import get_volumes_from_buffer
+from cg_lims.lazy import LazyGroup
 
-# commands
-from cg_lims.EPPs.udf.calculate.twist_pool import twist_pool
-from cg_lims.EPPs.udf.calculate.twist_qc_amount import twist_qc_amount
+COMMANDS: Dict[str, str] = {
+    "twist-pool": "cg_lims.EPPs.udf.calculate.twist_pool:twist_pool",
+    "aliquot-amount": "cg_lims.EPPs.udf.calculate.aliquot_amount:aliquot_amount",
+    "aliquot-volume": "cg_lims.EPPs.udf.calculate.aliquot_volume:aliquot_volume",
+    "twist-qc-amount": "cg_lims.EPPs.udf.calculate.twist_qc_amount:twist_qc_amount",
+    "get-volumes-from-buffer": "cg_lims.EPPs.udf.calculate.twist_get_volumes_from_buffer:get_volumes_from_buffer",
+    "get-missing-reads": "cg_lims.EPPs.udf.calculate.get_missing_reads:get_missing_reads",
+    "calculate-amount-ng": "cg_lims.EPPs.udf.calculate.calculate_amount_ng:calculate_amount_ng",
+    "calculate-amount-ng-fmol": "cg_lims.EPPs.udf.calculate.calculate_amount_ng_fmol:calculate_amount_ng_fmol",
+    "volume-buffer": "cg_lims.EPPs.udf.calculate.calculate_buffer:volume_buffer",
+    "molar-concentration": "cg_lims.EPPs.udf.calculate.molar_concentration:molar_concentration",
+    "calculate-beads": "cg_lims.EPPs.udf.calculate.calculate_beads:calculate_beads",
+    "missing-reads-in-pool": "cg_lims.EPPs.udf.calculate.sum_missing_reads_in_pool:missing_reads_in_pool",
+    "maf-calculate-volume": "cg_lims.EPPs.udf.calculate.maf_calculate_volume:maf_calculate_volume",
+    "calculate-resuspension-buffer-volume": "cg_lims.EPPs.udf.calculate.calculate_resuspension_buffer_volumes:calculate_resuspension_buffer_volume",
+    "calculate-water-volume-rna": "cg_lims.EPPs.udf.calculate.calculate_water_volume_rna:calculate_water_volume_rna",
+    "calculate-microbial-aliquot-volumes": "cg_lims.EPPs.udf.calculate.calculate_microbial_aliquot_volumes:calculate_microbial_aliquot_volumes",
+    "calculate-average-size-and-set-qc": "cg_lims.EPPs.udf.calculate.calculate_average_size_and_set_qc:calculate_average_size_and_set_qc",
+    "novaseq-x-volumes": "cg_lims.EPPs.udf.calculate.novaseq_x_volumes:novaseq_x_volumes",
+    "library-normalization": "cg_lims.EPPs.udf.calculate.library_normalization:library_normalization",
+    "library-normalization-revio": "cg_lims.EPPs.udf.calculate.library_normalization_revio:library_normalization_revio",
+    "novaseq-x-denaturation": "cg_lims.EPPs.udf.calculate.novaseq_x_denaturation:novaseq_x_denaturation",
+    "qpcr-concentration": "cg_lims.EPPs.udf.calculate.qpcr_concentration:qpcr_concentration",
+    "calculate-saphyr-concentration": "cg_lims.EPPs.udf.calculate.calculate_saphyr_concentration:calculate_saphyr_concentration",
+    "ont-aliquot-volume": "cg_lims.EPPs.udf.calculate.ont_aliquot_volume:ont_aliquot_volume",
+    "ont-available-sequencing-reload": "cg_lims.EPPs.udf.calculate.ont_sequencing_reload:ont_available_sequencing_reload",
+    "adjust-missing-reads": "cg_lims.EPPs.udf.calculate.adjust_missing_reads:adjust_missing_reads",
+    "revio-pooling": "cg_lims.EPPs.udf.calculate.revio_pooling:revio_pooling",
+    "revio-abc-volumes": "cg_lims.EPPs.udf.calculate.revio_abc_volumes:revio_abc_volumes",
+    "aggregate-sequencing-metrics": "cg_lims.EPPs.udf.calculate.aggregate_sequencing_metrics:aggregate_sequencing_metrics",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @click.pass_context
 def calculate(ctx):
     """Main entry point of calculate commands"""
     pass
-
-
-calculate.add_command(twist_pool)
-calculate.add_command(aliquot_amount)
-calculate.add_command(aliquot_volume)
-calculate.add_command(twist_qc_amount)
-calculate.add_command(get_volumes_from_buffer)
-calculate.add_command(get_missing_reads)
-calculate.add_command(calculate_amount_ng)
-calculate.add_command(calculate_amount_ng_fmol)
-calculate.add_command(volume_buffer)
-calculate.add_command(molar_concentration)
-calculate.add_command(calculate_beads)
-calculate.add_command(missing_reads_in_pool)
-calculate.add_command(maf_calculate_volume)
-calculate.add_command(calculate_resuspension_buffer_volume)
-calculate.add_command(calculate_water_volume_rna)
-calculate.add_command(calculate_microbial_aliquot_volumes)
-calculate.add_command(calculate_average_size_and_set_qc)
-calculate.add_command(novaseq_x_volumes)
-calculate.add_command(library_normalization)
-calculate.add_command(library_normalization_revio)
-calculate.add_command(novaseq_x_denaturation)
-calculate.add_command(qpcr_concentration)
-calculate.add_command(calculate_saphyr_concentration)
-calculate.add_command(ont_aliquot_volume)
-calculate.add_command(ont_available_sequencing_reload)
-calculate.add_command(adjust_missing_reads)
-calculate.add_command(revio_pooling)
-calculate.add_command(revio_abc_volumes)
-calculate.add_command(aggregate_sequencing_metrics)
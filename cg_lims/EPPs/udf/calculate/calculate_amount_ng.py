@@ -6,6 +6,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -61,6 +62,7 @@ def calculate_amount_ng(
                 continue
             artifact.udf[amount_udf] = conc * (vol - int(subtract_volume))
             artifact.put()
+        flush_write_back(ctx.obj)
         if missing_udfs_count:
             raise MissingUDFsError(
                 f"Udf missing for {missing_udfs_count} artifact(s): "
@@ -10,6 +10,7 @@ from cg_lims.EPPs.udf.calculate.constants import (
 )
 from cg_lims.exceptions import LimsError, MissingArtifactError, MissingValueError
 from cg_lims.get.artifacts import get_artifacts, get_latest_analyte, get_sample_artifact
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Sample
 from genologics.lims import Lims
 
@@ -149,6 +150,7 @@ def calculate_amount_ng_fmol(
             size_udf=size_udf,
         )
 
+        flush_write_back(ctx.obj)
         message = "Amounts have been calculated for all artifacts."
         LOG.info(message)
         click.echo(message)
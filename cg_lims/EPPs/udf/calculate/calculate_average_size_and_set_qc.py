@@ -7,6 +7,7 @@ import numpy as np
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 
 LOG = logging.getLogger(__name__)
@@ -69,6 +70,7 @@ def calculate_average_size_and_set_qc(ctx, lower_threshold: str, upper_threshold
             upper_threshold=upper_threshold,
             all_artifacts=artifacts,
         )
+        flush_write_back(ctx.obj)
         message = "Average Size (bp) have been calculated and set for all samples."
         LOG.info(message)
         click.echo(message)
@@ -7,6 +7,7 @@ from typing import List
 import click
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 
 LOG = logging.getLogger(__name__)
@@ -55,6 +56,7 @@ def calculate_beads(context: click.Context):
     try:
         artifacts: List[Artifact] = get_artifacts(process=process, input=False)
         calculate_volumes(artifacts=artifacts)
+        flush_write_back(context.obj)
         message = "Beads volumes have been calculated."
         LOG.info(message)
         click.echo(message)
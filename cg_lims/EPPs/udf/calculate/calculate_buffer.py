@@ -8,6 +8,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 
 LOG = logging.getLogger(__name__)
@@ -87,6 +88,7 @@ def volume_buffer(
             sample_volume_limit=sample_volume_limit,
             maximum_volume=int(max_volume),
         )
+        flush_write_back(ctx.obj)
         message = "Volumes have been calculated."
         LOG.info(message)
         click.echo(message)
@@ -12,6 +12,7 @@ from typing import List
 import click
 from cg_lims.exceptions import HighConcentrationError, LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 
 FINAL_CONCENTRATION = 2
@@ -83,6 +84,7 @@ def calculate_microbial_aliquot_volumes(context: click.Context):
     try:
         artifacts: List[Artifact] = get_artifacts(process=process, input=False)
         calculate_volumes(artifacts=artifacts)
+        flush_write_back(context.obj)
         message = "Microbial aliquot volumes have been calculated."
         LOG.info(message)
         click.echo(message)
@@ -12,6 +12,7 @@ from typing import List
 import click
 from cg_lims.exceptions import InvalidValueError, LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 
 LOG = logging.getLogger(__name__)
@@ -66,6 +67,7 @@ def calculate_resuspension_buffer_volume(context: click.Context):
     try:
         artifacts: List[Artifact] = get_artifacts(process=process, input=False)
         calculate_rb_volume(artifacts=artifacts)
+        flush_write_back(context.obj)
         message = "RB volumes have been calculated!"
         LOG.info(message)
         click.echo(message)
@@ -7,6 +7,7 @@ import numpy as np
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 
 LOG = logging.getLogger(__name__)
@@ -79,6 +80,7 @@ def calculate_saphyr_concentration(ctx, concentration_udf: List[str]) -> None:
                 failed_samples += 1
                 continue
             set_average_and_cv(artifact=artifact, udf_names=concentration_udf)
+        flush_write_back(ctx.obj)
         if failed_samples:
             raise MissingUDFsError(
                 f"{failed_samples} samples have invalid concentration values (<= 0). See log for more information."
@@ -8,6 +8,7 @@ from typing import List
 import click
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 
 LOG = logging.getLogger(__name__)
@@ -48,6 +49,7 @@ def calculate_water_volume_rna(context: click.Context):
     try:
         artifacts: List[Artifact] = get_artifacts(process=process, input=False)
         calculate_sample_and_water_volumes(artifacts=artifacts)
+        flush_write_back(context.obj)
         message = "Sample and H2O volumes have been calculated!"
         LOG.info(message)
         click.echo(message)
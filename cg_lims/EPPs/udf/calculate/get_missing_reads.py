@@ -2,9 +2,11 @@ import logging
 import sys
 
 import click
+from cg_lims.clients.cg.async_status_db_api import gather_application_tags
 from cg_lims.clients.cg.status_db_api import StatusDBAPI
 from cg_lims.exceptions import LimsError, MissingCgFieldError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 from requests.exceptions import ConnectionError
 
@@ -46,6 +48,10 @@ def find_reruns(artifacts: list, status_db: StatusDBAPI) -> None:
     Negative control samples are never sent for rerun.
     A pool with any sample that is not a negative control will be sent for rerun if reads are missing.
     """
+    gather_application_tags(
+        status_db=status_db,
+        tag_names=[artifact.samples[0].udf.get("Sequencing Analysis") for artifact in artifacts],
+    )
     failed_arts = 0
     for artifact in artifacts:
         if check_control(artifact):
@@ -98,6 +104,7 @@ def get_missing_reads(ctx):
     try:
         artifacts = get_artifacts(process=process, input=False)
         find_reruns(artifacts=artifacts, status_db=status_db)
+        flush_write_back(ctx.obj)
         message = "Missing Reads and Rerun info have been set on all artifacts"
         LOG.info(message)
         click.echo(message)
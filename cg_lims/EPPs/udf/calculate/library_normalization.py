@@ -13,6 +13,7 @@ from cg_lims.get.udfs import (
     get_process_total_volume,
     get_total_volume,
 )
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -172,6 +173,7 @@ def library_normalization(
             sample_volume_limit=sample_volume_limit,
             minimum_limit=float(min_volume),
         )
+        flush_write_back(ctx.obj)
         if samples_below_threshold or samples_low_concentration:
             messages: List = ["Warning:"]
             if samples_below_threshold:
@@ -11,6 +11,7 @@ from cg_lims.get.udfs import (
     get_artifact_volume,
     get_final_concentration,
 )
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -107,6 +108,7 @@ def library_normalization_revio(
             buffer_volume_udf=buffer_udf,
             concentration_udf=concentration_udf,
         )
+        flush_write_back(ctx.obj)
         if failed_samples:
             failed_samples_string: str = ", ".join(failed_samples)
             error_message: str = (
@@ -12,6 +12,7 @@ from typing import List, Optional
 import click
 from cg_lims.exceptions import LimsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 from pydantic.v1 import BaseModel, validator
 
@@ -117,6 +118,7 @@ def maf_calculate_volume(context: click.Context):
     try:
         artifacts: List[Artifact] = get_artifacts(process=process, input=False)
         calculate_volume(artifacts=artifacts)
+        flush_write_back(context.obj)
         message = "MAF volumes have been calculated."
         LOG.info(message)
         click.echo(message)
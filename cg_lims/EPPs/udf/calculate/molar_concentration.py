@@ -6,6 +6,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from cg_lims.set.qc import set_qc_fail
 from genologics.entities import Artifact
 
@@ -101,6 +102,7 @@ def molar_concentration(
             lower_threshold=lower_threshold,
             upper_threshold=upper_threshold,
         )
+        flush_write_back(ctx.obj)
         message = "Concentration (nM) have been calculated for all samples."
         LOG.info(message)
         click.echo(message)
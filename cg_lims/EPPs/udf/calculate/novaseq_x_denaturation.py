@@ -12,6 +12,7 @@ from cg_lims.EPPs.udf.calculate.constants import (
 )
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -152,6 +153,7 @@ def novaseq_x_denaturation(ctx):
         parent_process: Process = get_parent_process(process=process)
         set_process_udfs(process=process, parent_process=parent_process)
         set_artifact_udfs(process=process, parent_process=parent_process)
+        flush_write_back(ctx.obj)
         message: str = "Denaturation volumes have been calculated and set."
         LOG.info(message)
         click.echo(message)
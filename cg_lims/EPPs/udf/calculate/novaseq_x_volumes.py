@@ -12,6 +12,7 @@ from cg_lims.EPPs.udf.calculate.constants import (
 )
 from cg_lims.exceptions import InvalidValueError, LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -211,6 +212,7 @@ def novaseq_x_volumes(ctx):
 
     try:
         set_volumes_and_total_reads(process=process)
+        flush_write_back(ctx.obj)
         message: str = "NovaSeq X volumes have been calculated and set."
         LOG.info(message)
         click.echo(message)
@@ -12,6 +12,7 @@ from cg_lims.exceptions import LimsError, MissingArtifactError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts, get_latest_analyte, get_sample_artifact
 from cg_lims.get.samples import get_one_sample_from_artifact
 from cg_lims.get.udfs import get_udf
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process, Sample
 from genologics.lims import Lims
 
@@ -165,6 +166,7 @@ def ont_aliquot_volume(
                 max_volume=max_volume,
             )
 
+        flush_write_back(ctx.obj)
         if failed_samples:
             raise MissingUDFsError(
                 f"Warning: {len(failed_samples)} sample(s) didn't have a high enough concentration for the amount needed."
@@ -7,6 +7,7 @@ from cg_lims.exceptions import LimsError
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.samples import get_one_sample_from_artifact
 from cg_lims.get.udfs import get_analyte_udf
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 from genologics.lims import Lims
 
@@ -86,6 +87,7 @@ def ont_available_sequencing_reload(ctx):
         artifacts = get_artifacts(process=process, measurement=True)
         for artifact in artifacts:
             set_available_amount_and_conc(lims=lims, artifact=artifact)
+        flush_write_back(ctx.obj)
         message: str = "Available amounts have been successfully calculated and set."
         LOG.info(message)
         click.echo(message)
@@ -20,6 +20,7 @@ from cg_lims.exceptions import (
 from cg_lims.get.artifacts import get_artifact_by_name, get_artifacts
 from cg_lims.get.files import get_file_path
 from cg_lims.get.samples import get_one_sample_from_artifact
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Container, Process
 
 LOG = logging.getLogger(__name__)
@@ -220,6 +221,7 @@ def qpcr_concentration(
             if well_results.artifact.qc_flag == "FAILED":
                 failed_samples += 1
 
+        flush_write_back(ctx.obj)
         if missing_samples:
             raise MissingValueError(
                 f"No values found for the following samples in the result file! "
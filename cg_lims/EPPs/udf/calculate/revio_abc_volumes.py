@@ -6,6 +6,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingValueError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -171,6 +172,7 @@ def revio_abc_volumes(
             polymerase_dilution_mix_ratio=polymerase_dilution_mix_ratio,
             sequencing_polymerase_ratio=sequencing_polymerase_ratio,
         )
+        flush_write_back(ctx.obj)
         message: str = "ABC volumes have been calculated for all artifacts and process UDFs!"
         LOG.info(message)
         click.echo(message)
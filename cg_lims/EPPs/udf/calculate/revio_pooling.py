@@ -7,6 +7,7 @@ from cg_lims import options
 from cg_lims.EPPs.udf.calculate.constants import SMRT_LINK_AVERAGE_MOLECULAR_WEIGHT_SS_DNA
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -152,6 +153,7 @@ def revio_pooling(
                 control_volume_udf=control_volume_udf,
             )
 
+        flush_write_back(ctx.obj)
         message: str = "Pooling volumes have been calculated for all artifacts!"
         LOG.info(message)
         click.echo(message)
@@ -5,6 +5,7 @@ from typing import Tuple
 import click
 from cg_lims.exceptions import LimsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 
 LOG = logging.getLogger(__name__)
 
@@ -43,6 +44,7 @@ def missing_reads_in_pool(ctx):
     try:
         artifacts = get_artifacts(process=process, input=False)
         passed_arts, failed_arts = sum_reads_in_pool(artifacts=artifacts)
+        flush_write_back(ctx.obj)
         message = f"Updated {passed_arts}. Ignored {failed_arts} due to missing Sample UDFs: 'Reads missing (M)'"
         if failed_arts:
             LOG.error(message)
@@ -4,7 +4,9 @@ from typing import List
 
 import click
 from cg_lims import options
+from cg_lims.exceptions import WriteBackError
 from cg_lims.get.artifacts import get_artifacts, get_latest_analyte
+from cg_lims.put.write_back import flush_write_back
 
 LOG = logging.getLogger(__name__)
 
@@ -42,6 +44,11 @@ def get_volumes_from_buffer(ctx, process_types: List[str]) -> None:
             artifact.udf["Volume (ul)"] = volume_buffer
             artifact.put()
 
+    try:
+        flush_write_back(ctx.obj)
+    except WriteBackError as e:
+        sys.exit(e.message)
+
     message = f"Updated {updated_count} samples with volume from Buffer step."
     LOG.info(message)
     click.echo(message)
@@ -3,11 +3,11 @@ import sys
 from typing import List
 
 import click
-from genologics.entities import Artifact
-
 from cg_lims.exceptions import LimsError, LowAmountError
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.objects import Pool
+from cg_lims.put.write_back import flush_write_back
+from genologics.entities import Artifact
 
 LOG = logging.getLogger(__name__)
 
@@ -102,5 +102,6 @@ def twist_pool(ctx):
     try:
         pools = get_artifacts(process=process, input=False)
         calculate_volumes_for_pooling(pools)
+        flush_write_back(ctx.obj)
     except LimsError as e:
         sys.exit(e.message)
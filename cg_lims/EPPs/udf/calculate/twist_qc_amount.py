@@ -8,6 +8,7 @@ from cg_lims.exceptions import FailingQCError, LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.samples import get_one_sample_from_artifact
 from cg_lims.get.udfs import get_maximum_amount
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 
 LOG = logging.getLogger(__name__)
@@ -80,6 +81,7 @@ def twist_qc_amount(
     try:
         artifacts = get_artifacts(process=process, measurement=True)
         calculate_amount_and_set_qc(artifacts=artifacts, subtract_volume=int(subtract_volume))
+        flush_write_back(ctx.obj)
         message = "Amounts have been calculated and qc flags set for all samples."
         LOG.info(message)
         click.echo(message)
@@ -1,20 +1,19 @@
 #!/usr/bin/env python
 
+from typing import Dict
+
 import click
+from cg_lims.lazy import LazyGroup
 
-# commands
-from cg_lims.EPPs.udf.check.check_artifact_udfs import check_artifact_udfs
-from cg_lims.EPPs.udf.check.check_process_udfs import check_process_udfs
-from cg_lims.EPPs.udf.check.validate_index_cycles import validate_index_cycles
+COMMANDS: Dict[str, str] = {
+    "check-artifact-udfs": "cg_lims.EPPs.udf.check.check_artifact_udfs:check_artifact_udfs",
+    "check-process-udfs": "cg_lims.EPPs.udf.check.check_process_udfs:check_process_udfs",
+    "validate-index-cycles": "cg_lims.EPPs.udf.check.validate_index_cycles:validate_index_cycles",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @click.pass_context
 def check(ctx):
     """Main entry point of check commands"""
     pass
-
-
-check.add_command(check_artifact_udfs)
-check.add_command(check_process_udfs)
-check.add_command(validate_index_cycles)
@@ -5,7 +5,8 @@ from typing import List, Optional, Tuple
 import click
 from cg_lims.exceptions import InvalidValueError, LimsError
 from cg_lims.get.artifacts import get_artifacts
-from genologics.entities import Artifact, Process, ReagentType
+from cg_lims.get.reagent_catalog import ReagentCatalog, get_reagent_catalog
+from genologics.entities import Artifact, Process
 from genologics.lims import Lims
 
 LOG = logging.getLogger(__name__)
@@ -29,13 +30,15 @@ def validate_per_reagent(process: Process) -> str:
     index_1_cycles, index_2_cycles = get_index_cycles(process=process)
     lane_pools: List[Artifact] = get_artifacts(process=process)
     lims: Lims = process.lims
+    reagent_catalog: ReagentCatalog = get_reagent_catalog(lims=lims)
+    reagent_catalog.sync()
     failed_index_1_lengths: List[int] = []
     failed_index_2_lengths: List[int] = []
     for pool in lane_pools:
         all_reagents: List[str] = pool.reagent_labels
         for reagent_name in all_reagents:
-            reagent: ReagentType = lims.get_reagent_types(name=reagent_name)[0]
-            index_sequences: List[str] = reagent.sequence.split("-")
+            sequence: str = reagent_catalog.get_sequences(label=reagent_name)[0]
+            index_sequences: List[str] = sequence.split("-")
             if len(index_sequences) > 2:
                 raise InvalidValueError(
                     f"There can at most be 2 index sequences! Please confirm that index {reagent_name} is valid."
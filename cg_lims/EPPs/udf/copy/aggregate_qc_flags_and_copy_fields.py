@@ -8,6 +8,7 @@ from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.processes import get_latest_process
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 from genologics.lims import Lims
 
@@ -124,6 +125,7 @@ def aggregate_qc_and_copy_fields(ctx, process_types: List[str]):
             lims=lims,
             reception_control=process_types,
         )
+        flush_write_back(ctx.obj)
         click.echo("Udfs have been set on all samples.")
     except LimsError as e:
         sys.exit(e.message)
@@ -6,6 +6,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import ArgumentError, LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts, get_latest_analyte
+from cg_lims.put.write_back import flush_write_back
 from cg_lims.set.udfs import copy_artifact_to_artifact
 from genologics.entities import Artifact
 from genologics.lims import Lims
@@ -111,6 +112,7 @@ def artifact_to_artifact(
             ignore_fail=ignore_fail,
             keep_failed_flags=keep_failed_flags,
         )
+        flush_write_back(ctx.obj)
         click.echo("Udfs have been set on all samples.")
     except LimsError as e:
         sys.exit(e.message)
@@ -5,6 +5,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 
 
 def udf_copy_artifact_to_sample(
@@ -58,8 +59,10 @@ def artifact_to_sample(ctx, sample_udf, artifact_udf, input, sample_qc_udf):
 
     process = ctx.obj["process"]
     try:
+        ctx.obj["snapshot"].load()
         artifacts = get_artifacts(process=process, input=input)
         udf_copy_artifact_to_sample(artifacts, sample_udf, artifact_udf, sample_qc_udf)
+        flush_write_back(ctx.obj)
         click.echo("Udfs have been set on all samples.")
     except LimsError as e:
         sys.exit(e.message)
@@ -1,36 +1,27 @@
 #!/usr/bin/env python
 
+from typing import Dict
+
 import click
-from cg_lims.EPPs.udf.copy.aggregate_qc_flags_and_copy_fields import aggregate_qc_and_copy_fields
-from cg_lims.EPPs.udf.copy.artifact_to_artifact import artifact_to_artifact
+from cg_lims.lazy import LazyGroup
 
-# commands
-from cg_lims.EPPs.udf.copy.artifact_to_sample import artifact_to_sample
-from cg_lims.EPPs.udf.copy.container_to_artifact import container_to_artifact
-from cg_lims.EPPs.udf.copy.measurement_to_analyte import measurement_to_analyte
-from cg_lims.EPPs.udf.copy.original_well_to_sample import original_position_to_sample
-from cg_lims.EPPs.udf.copy.process_to_artifact import process_to_artifact
-from cg_lims.EPPs.udf.copy.process_to_sample import process_to_sample
-from cg_lims.EPPs.udf.copy.qc_to_sample import qc_to_sample
-from cg_lims.EPPs.udf.copy.reads_to_sequence import reads_to_sequence
-from cg_lims.EPPs.udf.copy.sample_to_artifact import sample_to_artifact
+COMMANDS: Dict[str, str] = {
+    "artifact-to-sample": "cg_lims.EPPs.udf.copy.artifact_to_sample:artifact_to_sample",
+    "sample-to-artifact": "cg_lims.EPPs.udf.copy.sample_to_artifact:sample_to_artifact",
+    "process-to-sample": "cg_lims.EPPs.udf.copy.process_to_sample:process_to_sample",
+    "reads-to-sequence": "cg_lims.EPPs.udf.copy.reads_to_sequence:reads_to_sequence",
+    "artifact-to-artifact": "cg_lims.EPPs.udf.copy.artifact_to_artifact:artifact_to_artifact",
+    "process-to-artifact": "cg_lims.EPPs.udf.copy.process_to_artifact:process_to_artifact",
+    "qc-to-sample": "cg_lims.EPPs.udf.copy.qc_to_sample:qc_to_sample",
+    "original-position-to-sample": "cg_lims.EPPs.udf.copy.original_well_to_sample:original_position_to_sample",
+    "aggregate-qc-and-copy-fields": "cg_lims.EPPs.udf.copy.aggregate_qc_flags_and_copy_fields:aggregate_qc_and_copy_fields",
+    "measurement-to-analyte": "cg_lims.EPPs.udf.copy.measurement_to_analyte:measurement_to_analyte",
+    "container-to-artifact": "cg_lims.EPPs.udf.copy.container_to_artifact:container_to_artifact",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @click.pass_context
 def copy(ctx):
     """Main entry point of copy commands"""
     pass
-
-
-copy.add_command(artifact_to_sample)
-copy.add_command(sample_to_artifact)
-copy.add_command(process_to_sample)
-copy.add_command(reads_to_sequence)
-copy.add_command(artifact_to_artifact)
-copy.add_command(process_to_artifact)
-copy.add_command(qc_to_sample)
-copy.add_command(original_position_to_sample)
-copy.add_command(aggregate_qc_and_copy_fields)
-copy.add_command(measurement_to_analyte)
-copy.add_command(container_to_artifact)
@@ -6,6 +6,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError
 from cg_lims.get.artifacts import get_artifacts, get_latest_analyte
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 from genologics.lims import Lims
 
@@ -88,6 +89,7 @@ def container_to_artifact(
                     source_artifact=source_artifact,
                     udf_name=container_name_udf,
                 )
+        flush_write_back(ctx.obj)
         click.echo("UDFs have been set on all samples.")
     except LimsError as e:
         sys.exit(e.message)
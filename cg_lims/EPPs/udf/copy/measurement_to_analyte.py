@@ -6,6 +6,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from cg_lims.set.udfs import copy_artifact_to_artifact
 from genologics.entities import Artifact
 
@@ -57,6 +58,7 @@ def measurement_to_analyte(
             measurements=measurements,
             udfs=udfs,
         )
+        flush_write_back(ctx.obj)
         click.echo("Udfs have been set on all samples.")
     except LimsError as e:
         sys.exit(e.message)
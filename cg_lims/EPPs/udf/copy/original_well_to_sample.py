@@ -5,6 +5,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import InvalidValueError, LimsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 
 LOG = logging.getLogger(__name__)
 
@@ -66,6 +67,7 @@ def original_position_to_sample(ctx, input):
     try:
         artifacts = get_artifacts(process=process, input=input)
         original_well_to_sample(artifacts)
+        flush_write_back(ctx.obj)
         message = "Udfs have been set on all samples."
         LOG.info(message)
         click.echo("Udfs have been set on all samples.")
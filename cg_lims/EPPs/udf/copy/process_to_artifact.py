@@ -6,6 +6,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts, get_latest_analyte
+from cg_lims.put.write_back import flush_write_back
 from cg_lims.set.udfs import copy_udf_process_to_artifact
 from genologics.entities import Artifact
 from genologics.lims import Lims
@@ -79,6 +80,7 @@ def process_to_artifact(
             process_types=process_types,
             lims=lims,
         )
+        flush_write_back(ctx.obj)
         click.echo("Udfs have been set on all samples.")
     except LimsError as e:
         sys.exit(e.message)
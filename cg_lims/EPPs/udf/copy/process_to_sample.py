@@ -3,7 +3,9 @@ import sys
 
 import click
 from cg_lims import options
+from cg_lims.exceptions import WriteBackError
 from cg_lims.get.samples import get_process_samples
+from cg_lims.put.write_back import flush_write_back
 
 
 @click.command()
@@ -28,6 +30,11 @@ def process_to_sample(ctx, sample_udf, process_udf):
         except:
             failed_samples.append(sample)
 
+    try:
+        flush_write_back(ctx.obj)
+    except WriteBackError as e:
+        sys.exit(e.message)
+
     if not failed_samples:
         click.echo(f"Udf {sample_udf} have been set on all samples.")
     else:
@@ -5,6 +5,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 
 LOG = logging.getLogger(__name__)
 
@@ -52,6 +53,7 @@ def qc_to_sample(ctx, input, sample_qc_udf):
     try:
         artifacts = get_artifacts(process=process, input=input)
         artifacts_to_sample(artifacts=artifacts, sample_qc_udf=sample_qc_udf)
+        flush_write_back(ctx.obj)
         message = "Udfs have been set on all samples."
         LOG.info(message)
         click.echo(message)
@@ -5,6 +5,7 @@ from typing import Tuple
 
 import click
 from cg_lims.exceptions import LimsError
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 from genologics.lims import Lims
 
@@ -48,6 +49,7 @@ def reads_to_sequence(ctx):
 
     try:
         find_reads_to_sequence(process=process, lims=lims)
+        flush_write_back(ctx.obj)
         click.echo("Udfs have been set on all samples.")
     except LimsError as e:
         sys.exit(e.message)
@@ -8,6 +8,7 @@ from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.udfs import get_udf_type
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process, Sample
 from genologics.lims import Lims
 
@@ -82,6 +83,7 @@ def sample_to_artifact(ctx, sample_udf, artifact_udf, measurement, input, ignore
     lims: Lims = ctx.obj["lims"]
 
     try:
+        ctx.obj["snapshot"].load()
         artifacts: List[Artifact] = get_artifacts(
             process=process, input=input, measurement=measurement
         )
@@ -92,6 +94,7 @@ def sample_to_artifact(ctx, sample_udf, artifact_udf, measurement, input, ignore
             lims=lims,
             ignore_fail=ignore_fail,
         )
+        flush_write_back(ctx.obj)
         click.echo("UDFs have been set on all samples.")
     except LimsError as e:
         sys.exit(e.message)
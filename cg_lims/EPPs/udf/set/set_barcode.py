@@ -7,6 +7,7 @@ from cg_lims import options
 from cg_lims.exceptions import InvalidValueError, LimsError, MissingValueError
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.fields import get_barcode
+from cg_lims.put.write_back import flush_write_back
 from genologics.lims import Artifact
 
 LOG = logging.getLogger(__name__)
@@ -111,6 +112,7 @@ def assign_barcode(
             container_type=container_type,
             measurement=measurement,
         )
+        flush_write_back(ctx.obj)
         message = "Barcodes were successfully generated."
         LOG.info(message)
         click.echo(message)
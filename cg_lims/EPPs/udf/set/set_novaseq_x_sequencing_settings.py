@@ -7,6 +7,7 @@ from cg_lims.EPPs.udf.calculate.constants import FlowCellTypes
 from cg_lims.EPPs.udf.set.constants import DefaultIndexLength, DefaultReadLength
 from cg_lims.exceptions import LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.lims import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -86,6 +87,7 @@ def set_sequencing_settings(ctx):
     try:
         parent_process: Process = get_parent_process(process=process)
         set_process_udfs(process=process, parent_process=parent_process)
+        flush_write_back(ctx.obj)
         message: str = "Sequencing settings have been successfully set."
         LOG.info(message)
         click.echo(message)
@@ -5,6 +5,7 @@ from datetime import date
 import click
 from cg_lims.exceptions import LimsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Process
 
 LOG = logging.getLogger(__name__)
@@ -36,6 +37,7 @@ def set_ont_sequencing_settings(ctx):
 
     try:
         set_experiment_name(process=process)
+        flush_write_back(ctx.obj)
         message: str = "Sequencing settings have been successfully set."
         LOG.info(message)
         click.echo(message)
@@ -7,6 +7,7 @@ import click
 import numpy as np
 from cg_lims.exceptions import InvalidValueError, LimsError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Container, Process
 
 LOG = logging.getLogger(__name__)
@@ -83,6 +84,7 @@ def set_revio_sequencing_settings(ctx):
         set_run_name(process=process)
         set_plates(process=process)
         set_artifact_values(artifacts=artifacts)
+        flush_write_back(ctx.obj)
         message: str = "Revio sequencing settings have been successfully set."
         LOG.info(message)
         click.echo(message)
@@ -2,13 +2,15 @@
 """
 
 import logging
+import sys
 from datetime import datetime
 from typing import List, Literal
 
 import click
 from cg_lims import options
-from cg_lims.exceptions import MissingUDFsError
+from cg_lims.exceptions import MissingUDFsError, WriteBackError
 from cg_lims.get.samples import get_process_samples
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Process, Sample
 
 LOG = logging.getLogger(__name__)
@@ -80,3 +82,8 @@ def set_sample_date(
             set_sequenced(sample=sample)
         elif sample_udf == "Delivered at":
             set_delivered(sample=sample, process=process)
+
+    try:
+        flush_write_back(context.obj)
+    except WriteBackError as e:
+        sys.exit(e.message)
@@ -5,10 +5,12 @@ import sys
 from typing import List
 
 import click
+from cg_lims.clients.cg.async_status_db_api import gather_application_tags
 from cg_lims.clients.cg.status_db_api import StatusDBAPI
-from cg_lims.exceptions import LimsError, MissingUDFsError
+from cg_lims.exceptions import CgAPIClientConnectionError, LimsError, MissingUDFsError
 from cg_lims.get.samples import get_process_samples
 from cg_lims.get.udfs import get_udf
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Sample
 
 LOG = logging.getLogger(__name__)
@@ -16,7 +18,10 @@ LOG = logging.getLogger(__name__)
 
 def get_target_amount(app_tag: str, status_db: StatusDBAPI) -> int:
     """Gets the target amount of reads from clinical-api"""
-    return status_db.get_application_tag(tag_name=app_tag, key="target_reads")
+    try:
+        return status_db.get_application_tag(tag_name=app_tag, key="target_reads")
+    except CgAPIClientConnectionError as error:
+        raise LimsError(message=str(error))
 
 
 def set_reads_missing_on_sample(sample: Sample, status_db: StatusDBAPI) -> None:
@@ -55,9 +60,14 @@ def set_reads_missing_on_new_samples(context: click.Context):
     status_db = context.obj["status_db"]
 
     samples = get_process_samples(process=process)
+    gather_application_tags(
+        status_db=status_db,
+        tag_names=[sample.udf.get("Sequencing Analysis") for sample in samples],
+    )
 
     try:
         set_reads_missing(samples, status_db)
+        flush_write_back(context.obj)
         message = f"Reads Missing (M) udf set on all sample(s)."
         LOG.info(message)
         click.echo(message)
@@ -13,6 +13,7 @@ from cg_lims.exceptions import (
 )
 from cg_lims.get.artifacts import get_artifacts
 from cg_lims.get.fields import get_alternative_artifact_well
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact, Process
 
 LOG = logging.getLogger(__name__)
@@ -105,6 +106,7 @@ def smrt_cell_metrics(ctx):
             )
         set_smrt_cell_metrics(metrics=smrt_cell_values, artifact_dict=artifact_dict)
 
+        flush_write_back(ctx.obj)
         click.echo("SMRT Cell information was successfully fetched.")
     except LimsError as e:
         sys.exit(e.message)
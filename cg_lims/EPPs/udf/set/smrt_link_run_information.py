@@ -6,6 +6,7 @@ import click
 from cg_lims.clients.smrt_link.models import SmrtLinkConfig
 from cg_lims.clients.smrt_link.smrt_link_client import SmrtLinkClient
 from cg_lims.exceptions import InvalidValueError, LimsError
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Process
 
 LOG = logging.getLogger(__name__)
@@ -97,6 +98,7 @@ def fetch_smrtlink_run_information(ctx):
 
     try:
         set_run_udfs(client=smrt_link_client, process=process)
+        flush_write_back(ctx.obj)
         message: str = "Run information has been successfully fetched from SMRT Link!"
         LOG.info(message)
         click.echo(message)
@@ -6,6 +6,7 @@ import click
 from cg_lims import options
 from cg_lims.exceptions import LimsError, MissingArtifactError, MissingUDFsError
 from cg_lims.get.artifacts import get_artifacts, get_latest_analyte, get_sample_artifact
+from cg_lims.put.write_back import flush_write_back
 from genologics.entities import Artifact
 from genologics.lims import Lims
 
@@ -156,6 +157,7 @@ def updated_sample_volume(
                 added_volume=add_volume,
                 ignore_fail=ignore_fail,
             )
+        flush_write_back(ctx.obj)
         message = "UDFs have been set on all samples."
         LOG.info(message)
         click.echo(message)
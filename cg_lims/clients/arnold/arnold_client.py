@@ -0,0 +1,172 @@
+import gzip
+import json
+import logging
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import requests
+from cg_lims.exceptions import LimsError
+from cg_lims.get.batch import chunk_entities
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE: int = 500
+REQUEST_TIMEOUT: Tuple[int, int] = (10, 300)
+REQUEST_RETRIES: int = 3
+
+
+class BodyFormat(str, Enum):
+    JSON = "json"
+    NDJSON = "ndjson"
+
+
+CONTENT_TYPES: Dict[str, str] = {
+    BodyFormat.JSON: "application/json",
+    BodyFormat.NDJSON: "application/x-ndjson",
+}
+
+
+class ChunkError(NamedTuple):
+    first_document: int
+    document_count: int
+    message: str
+
+
+class UploadResult(NamedTuple):
+    uploaded_count: int
+    errors: List[ChunkError]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def get_error_summary(self) -> str:
+        return "; ".join(
+            f"documents {error.first_document}-{error.first_document + error.document_count - 1}: "
+            f"{error.message}"
+            for error in self.errors
+        )
+
+
+def create_session(retries: int = REQUEST_RETRIES) -> requests.Session:
+    """Return a keep-alive session that retries failing requests with backoff. Arnold upserts
+    documents by id, so POST and PUT requests are safe to repeat."""
+    retry = Retry(
+        total=retries,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST", "PUT"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class ArnoldClient:
+    """
+    Transport for the document collections of arnold.
+
+    Documents are consumed <chunk_size> at a time, so they may be given as a generator, and each
+    chunk is sent as its own request: a JSON array or newline delimited JSON, gzip compressed if
+    <compress> is set. A chunk that fails after the retries of the session does not stop the
+    others; the failures are reported per chunk in the result.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        body_format: BodyFormat = BodyFormat.JSON,
+        compress: bool = False,
+        timeout: Tuple[int, int] = REQUEST_TIMEOUT,
+        session: Optional[requests.Session] = None,
+    ):
+        self.host: str = host
+        self.chunk_size: int = chunk_size
+        self.body_format: BodyFormat = BodyFormat(body_format)
+        self.compress: bool = compress
+        self.timeout: Tuple[int, int] = timeout
+        self.session: requests.Session = session or create_session()
+
+    def _encode(self, documents: List[Dict]) -> bytes:
+        if self.body_format == BodyFormat.NDJSON:
+            body: bytes = b"".join(json.dumps(document).encode() + b"\n" for document in documents)
+        else:
+            body: bytes = json.dumps(documents).encode()
+        return gzip.compress(body, compresslevel=5) if self.compress else body
+
+    def _send(self, method: str, endpoint: str, body: bytes, content_type: str) -> Response:
+        headers: Dict[str, str] = {"Content-Type": content_type}
+        if self.compress:
+            headers["Content-Encoding"] = "gzip"
+        return self.session.request(
+            method=method,
+            url=f"{self.host}/{endpoint}",
+            headers=headers,
+            data=body,
+            timeout=self.timeout,
+        )
+
+    def send_documents(
+        self,
+        method: str,
+        endpoint: str,
+        documents: Iterable[Dict],
+        on_uploaded: Optional[Callable[[List[Dict]], None]] = None,
+    ) -> UploadResult:
+        """Send the documents chunk by chunk. <on_uploaded> is called with each accepted chunk."""
+        uploaded_count: int = 0
+        sent_count: int = 0
+        errors: List[ChunkError] = []
+        for chunk in chunk_entities(entities=documents, chunk_size=self.chunk_size):
+            message: Optional[str] = None
+            try:
+                response: Response = self._send(
+                    method=method,
+                    endpoint=endpoint,
+                    body=self._encode(chunk),
+                    content_type=CONTENT_TYPES[self.body_format],
+                )
+                if not response.ok:
+                    message = response.text
+            except requests.RequestException as error:
+                message = str(error)
+
+            if message is None:
+                LOG.info("Arnold output: %s", response.text)
+                uploaded_count += len(chunk)
+                if on_uploaded:
+                    on_uploaded(chunk)
+            else:
+                LOG.error(f"Failed to send documents {sent_count}-{sent_count + len(chunk) - 1}")
+                LOG.error(message)
+                errors.append(
+                    ChunkError(
+                        first_document=sent_count, document_count=len(chunk), message=message
+                    )
+                )
+            sent_count += len(chunk)
+        return UploadResult(uploaded_count=uploaded_count, errors=errors)
+
+    def send_document(self, method: str, endpoint: str, document: str) -> None:
+        """Send one serialized document. Raises LimsError if arnold does not accept it."""
+        body: bytes = document.encode()
+        try:
+            response: Response = self._send(
+                method=method,
+                endpoint=endpoint,
+                body=gzip.compress(body, compresslevel=5) if self.compress else body,
+                content_type=CONTENT_TYPES[BodyFormat.JSON],
+            )
+        except requests.RequestException as error:
+            raise LimsError(message=str(error))
+        if not response.ok:
+            LOG.info(response.text)
+            raise LimsError(response.text)
+        LOG.info("Arnold output: %s", response.text)
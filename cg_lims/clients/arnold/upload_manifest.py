@@ -0,0 +1,89 @@
+import fcntl
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from cg_lims.files.manage_json_files import write_json_atomically
+
+LOG = logging.getLogger(__name__)
+
+DOCUMENT_ID_KEY = "id"
+DEFAULT_MAX_ENTRIES = 100000
+
+
+def hash_document(document: Dict) -> str:
+    """Return a hash of the serialized document that does not depend on the order of its keys."""
+    serialized: str = json.dumps(document, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class UploadManifest:
+    """
+    Content hashes of the documents last uploaded to arnold, keyed by document id.
+
+    Documents whose hash is the same as in the manifest were already uploaded unchanged and can be
+    skipped. If a file path is given, the manifest is shared between EPP invocations: it is read
+    when created, and save() merges the recorded hashes into the file under an exclusive lock and
+    replaces it atomically. The file keeps the hashes of the <max_entries> most recently uploaded
+    documents; older documents are uploaded again the next time they are sent.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path: Optional[Path] = Path(path) if path else None
+        self.max_entries: int = max_entries
+        self._hashes: Dict[str, str] = self._read()
+        self._recorded: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, str]:
+        if not (self.path and self.path.is_file()):
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError) as error:
+            LOG.warning(f"Could not read arnold upload manifest {self.path}: {error}")
+            return {}
+
+    def _merge(self, hashes: Dict[str, str]) -> Dict[str, str]:
+        """Merge the hashes into those of the file, most recently uploaded last, and drop the
+        oldest past <max_entries>."""
+        merged: Dict[str, str] = self._read()
+        for document_id in hashes:
+            merged.pop(document_id, None)
+        merged.update(hashes)
+        return dict(list(merged.items())[-self.max_entries :])
+
+    def save(self) -> None:
+        """Write the hashes recorded since the last save to the file."""
+        with self._lock:
+            if not (self.path and self._recorded):
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path.with_name(f"{self.path.name}.lock"), "w") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    write_json_atomically(path=self.path, content=self._merge(self._recorded))
+                self._recorded = {}
+            except OSError as error:
+                LOG.warning(f"Could not write arnold upload manifest {self.path}: {error}")
+
+    def get_changed(self, documents: Iterable[Dict]) -> List[Dict]:
+        """Return the documents that are new or changed since they were last uploaded."""
+        with self._lock:
+            return [
+                document
+                for document in documents
+                if self._hashes.get(document[DOCUMENT_ID_KEY]) != hash_document(document)
+            ]
+
+    def record(self, documents: Iterable[Dict]) -> None:
+        """Store the hashes of successfully uploaded documents, to be written by save()."""
+        hashes: Dict[str, str] = {
+            document[DOCUMENT_ID_KEY]: hash_document(document) for document in documents
+        }
+        with self._lock:
+            self._hashes.update(hashes)
+            self._recorded.update(hashes)
@@ -0,0 +1,67 @@
+import fcntl
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from cg_lims.files.manage_json_files import write_json_atomically
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS: int = 3600
+
+
+class ApplicationTagCache:
+    """
+    Memoizes application tags fetched from clinical-api for <ttl> seconds.
+
+    If a file path is given, the cache is read from and written to that file, so that it is shared
+    between EPP invocations. Every write merges the new entry into the file under an exclusive
+    lock, so that concurrent EPPs do not drop each other's entries, and replaces it atomically.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: int = DEFAULT_TTL_SECONDS):
+        self.path: Optional[Path] = Path(path) if path else None
+        self.ttl: int = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._read()
+
+    def _read(self) -> Dict[str, Dict]:
+        if not (self.path and self.path.is_file()):
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError) as error:
+            LOG.warning(f"Could not read application tag cache {self.path}: {error}")
+            return {}
+
+    def _save(self, key: str, entry: Dict) -> None:
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_name(f"{self.path.name}.lock"), "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                write_json_atomically(path=self.path, content={**self._read(), key: entry})
+        except OSError as error:
+            LOG.warning(f"Could not write application tag cache {self.path}: {error}")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached application tag, or None if it is missing or expired."""
+        with self._lock:
+            entry: Optional[Dict] = self._entries.get(key)
+            if entry and time.time() - entry["fetched_at"] < self.ttl:
+                self.hits += 1
+                return entry["data"]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, application_tag: Dict) -> None:
+        with self._lock:
+            entry: Dict = {"fetched_at": time.time(), "data": application_tag}
+            self._entries[key] = entry
+            self._save(key=key, entry=entry)
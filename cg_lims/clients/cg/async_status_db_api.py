@@ -0,0 +1,144 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from cg_lims.clients.cg.models import (
+    PacbioSampleSequencingMetrics,
+    PacbioSequencingRun,
+    SampleLaneSequencingMetrics,
+)
+from cg_lims.clients.cg.status_db_api import POOL_SIZE, StatusDBAPI
+from cg_lims.exceptions import CgAPIClientConnectionError, CgAPIClientTimeoutError
+
+LOG = logging.getLogger(__name__)
+
+MAX_CONCURRENCY: int = POOL_SIZE
+REQUEST_DEADLINE: float = 150.0
+REQUEST_RETRIES: int = 2
+RETRY_BACKOFF: float = 0.5
+
+# A request past its deadline is not retried: its thread cannot be cancelled and keeps an
+# executor slot until the request timeout of the session, so a retry would queue behind it.
+RETRYABLE_ERRORS: Tuple = (CgAPIClientConnectionError, CgAPIClientTimeoutError)
+
+
+class AsyncStatusDBAPI:
+    """
+    Asyncio client for clinical-api with the same methods as StatusDBAPI, as coroutines.
+
+    Requests are made by the wrapped StatusDBAPI, so they share its keep-alive session,
+    token manager and application tag cache. At most <max_concurrency> requests are in flight
+    at a time, which by default is the connection pool size of the session. Each request gets
+    <deadline> seconds in total and is retried <retries> times with exponential backoff after
+    connection errors and request timeouts of the session.
+    """
+
+    def __init__(
+        self,
+        status_db: StatusDBAPI,
+        max_concurrency: int = MAX_CONCURRENCY,
+        deadline: float = REQUEST_DEADLINE,
+        retries: int = REQUEST_RETRIES,
+    ) -> None:
+        self.status_db: StatusDBAPI = status_db
+        self.max_concurrency: int = max_concurrency
+        self.deadline: float = deadline
+        self.retries: int = retries
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="status-db"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency limit of the running event loop."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def _run(self, function: Callable, **kwargs) -> Any:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        async with self._get_semaphore():
+            for attempt in range(self.retries + 1):
+                try:
+                    return await asyncio.wait_for(
+                        loop.run_in_executor(self._executor, partial(function, **kwargs)),
+                        timeout=self.deadline,
+                    )
+                except RETRYABLE_ERRORS as error:
+                    if attempt == self.retries:
+                        raise
+                    LOG.warning(f"Retrying {function.__name__} {kwargs} after: {error}")
+                    await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
+
+    async def get_application_tag(self, tag_name, key=None, entry_point="/applications"):
+        return await self._run(
+            self.status_db.get_application_tag,
+            tag_name=tag_name,
+            key=key,
+            entry_point=entry_point,
+        )
+
+    async def get_sequencing_metrics_for_illumina_flow_cell(
+        self, flow_cell_name: str
+    ) -> List[SampleLaneSequencingMetrics]:
+        return await self._run(
+            self.status_db.get_sequencing_metrics_for_illumina_flow_cell,
+            flow_cell_name=flow_cell_name,
+        )
+
+    async def get_pacbio_sequencing_run_from_run_id(self, run_id: str) -> List[PacbioSequencingRun]:
+        return await self._run(self.status_db.get_pacbio_sequencing_run_from_run_id, run_id=run_id)
+
+    async def get_pacbio_sequencing_metrics(
+        self, sample_id: Optional[str] = None, smrt_cell_ids: Optional[List[str]] = None
+    ) -> List[PacbioSampleSequencingMetrics]:
+        return await self._run(
+            self.status_db.get_pacbio_sequencing_metrics,
+            sample_id=sample_id,
+            smrt_cell_ids=smrt_cell_ids,
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+async def _gather(requests: Dict[Any, Awaitable]) -> Dict[Any, Any]:
+    results: List[Any] = await asyncio.gather(*requests.values(), return_exceptions=True)
+    return dict(zip(requests.keys(), results))
+
+
+def gather_application_tags(
+    status_db: StatusDBAPI,
+    tag_names: Iterable[Optional[str]],
+    key: Optional[str] = None,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Fetch each distinct application tag concurrently and return them, or their <key>, by tag
+    name. Fetched tags are also stored in the application tag cache of the client. Tags that fail
+    to load are logged and left out, so that later lookups report the error."""
+    async_status_db = AsyncStatusDBAPI(status_db=status_db, max_concurrency=max_concurrency)
+    unique_tag_names: List[str] = sorted({tag_name for tag_name in tag_names if tag_name})
+    try:
+        results: Dict[str, Any] = asyncio.run(
+            _gather(
+                {
+                    tag_name: async_status_db.get_application_tag(tag_name=tag_name, key=key)
+                    for tag_name in unique_tag_names
+                }
+            )
+        )
+    finally:
+        async_status_db.close()
+
+    application_tags: Dict[str, Any] = {}
+    for tag_name, result in results.items():
+        if isinstance(result, Exception):
+            LOG.warning(f"Failed to fetch application tag {tag_name}: {result}")
+            continue
+        application_tags[tag_name] = result
+    return application_tags
@@ -0,0 +1,89 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+WHITESPACE = " \t\n\r"
+NUMBER_CHARACTERS = "0123456789+-.eE"
+
+
+class JsonStreamReader:
+    """Reads JSON tokens and values from a stream of UTF-8 chunks, keeping only the undecoded
+    rest of the stream in memory."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self.buffer: str = ""
+        self.position: int = 0
+
+    def _read_more(self) -> bool:
+        chunk: Optional[bytes] = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self.buffer = self.buffer[self.position :] + self._text_decoder.decode(chunk)
+        self.position = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next character that is not whitespace, without consuming it."""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._read_more():
+                raise ValueError("Unexpected end of JSON stream.")
+
+    def expect(self, character: str) -> None:
+        if self.peek() != character:
+            raise ValueError(f"Expected '{character}' in JSON stream, got '{self.peek()}'.")
+        self.position += 1
+
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A number at the end of the buffer, eg. "2" of "2.5", may continue in the next chunk.
+            if (
+                isinstance(value, (int, float))
+                and not self.buffer[end:].strip(NUMBER_CHARACTERS)
+                and self._read_more()
+            ):
+                continue
+            self.position = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes], key: Optional[str] = None) -> Iterator[Any]:
+    """Decode a JSON array from a stream of UTF-8 chunks and yield its elements one by one.
+
+    If a key is given, the stream holds an object and the array is the value of that key.
+    Neither the whole body nor all decoded elements are ever held in memory."""
+    reader = JsonStreamReader(chunks=chunks)
+    if key is not None:
+        reader.expect("{")
+        while True:
+            if reader.peek() == "}":
+                raise ValueError(f"Key '{key}' not found in JSON stream.")
+            member: str = reader.decode_value()
+            reader.expect(":")
+            if member == key:
+                break
+            reader.decode_value()
+            if reader.peek() == ",":
+                reader.expect(",")
+
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.decode_value()
+        if reader.peek() == "]":
+            return
+        reader.expect(",")
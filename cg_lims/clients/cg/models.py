@@ -1,3 +1,5 @@
+from typing import Dict, NamedTuple
+
 from pydantic import BaseModel
 
 
@@ -18,6 +20,48 @@ class PacbioSampleSequencingMetrics(BaseModel):
     hifi_mean_read_length: float
 
 
+class SampleLaneSequencingMetricsRecord(NamedTuple):
+    """Compact, read-only sample lane metrics, as streamed from StatusDB."""
+
+    flow_cell_name: str
+    flow_cell_lane_number: int
+    sample_internal_id: str
+    sample_total_reads_in_lane: int
+    sample_base_percentage_passing_q30: float
+
+    @classmethod
+    def from_json(cls, metrics: Dict) -> "SampleLaneSequencingMetricsRecord":
+        return cls(
+            flow_cell_name=str(metrics["flow_cell_name"]),
+            flow_cell_lane_number=int(metrics["flow_cell_lane_number"]),
+            sample_internal_id=str(metrics["sample_internal_id"]),
+            sample_total_reads_in_lane=int(metrics["sample_total_reads_in_lane"]),
+            sample_base_percentage_passing_q30=float(metrics["sample_base_percentage_passing_q30"]),
+        )
+
+
+class PacbioSampleSequencingMetricsRecord(NamedTuple):
+    """Compact, read-only PacBio sample metrics, as streamed from StatusDB."""
+
+    smrt_cell_id: str
+    sample_id: str
+    hifi_yield: int
+    hifi_reads: int
+    hifi_median_read_quality: str
+    hifi_mean_read_length: float
+
+    @classmethod
+    def from_json(cls, metrics: Dict) -> "PacbioSampleSequencingMetricsRecord":
+        return cls(
+            smrt_cell_id=str(metrics["smrt_cell_id"]),
+            sample_id=str(metrics["sample_id"]),
+            hifi_yield=int(metrics["hifi_yield"]),
+            hifi_reads=int(metrics["hifi_reads"]),
+            hifi_median_read_quality=str(metrics["hifi_median_read_quality"]),
+            hifi_mean_read_length=float(metrics["hifi_mean_read_length"]),
+        )
+
+
 class PacbioSequencingRun(BaseModel):
     barcoded_hifi_mean_read_length: int
     barcoded_hifi_reads: int
@@ -1,13 +1,18 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import requests
+from cg_lims.clients.cg.application_tag_cache import ApplicationTagCache
+from cg_lims.clients.cg.json_stream import iter_json_array
 from cg_lims.clients.cg.models import (
     PacbioSampleSequencingMetrics,
+    PacbioSampleSequencingMetricsRecord,
     PacbioSequencingRun,
     SampleLaneSequencingMetrics,
+    SampleLaneSequencingMetricsRecord,
 )
 from cg_lims.clients.cg.token_manager import TokenManager
 from cg_lims.exceptions import (
@@ -15,17 +20,80 @@ from cg_lims.exceptions import (
     CgAPIClientDecodeError,
     CgAPIClientError,
     CgAPIClientTimeoutError,
-    LimsError,
 )
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 LOG = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT: Tuple[int, int] = (10, 120)
+REQUEST_RETRIES: int = 3
+POOL_SIZE: int = 20
+STREAM_CHUNK_SIZE: int = 64 * 1024
+
+
+def create_session(retries: int = REQUEST_RETRIES, pool_size: int = POOL_SIZE) -> requests.Session:
+    """Return a keep-alive session that retries failing GET requests with backoff."""
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class StatusDBAPI:
-    def __init__(self, base_url: str, token_manager: TokenManager = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        token_manager: TokenManager = None,
+        timeout: Tuple[int, int] = REQUEST_TIMEOUT,
+        application_tag_cache: Optional[ApplicationTagCache] = None,
+    ) -> None:
         self.base_url: str = base_url
         self._token_manager: TokenManager = token_manager
+        self.timeout: Tuple[int, int] = timeout
+        self.application_tag_cache: ApplicationTagCache = (
+            application_tag_cache or ApplicationTagCache()
+        )
+        self.session: requests.Session = create_session()
+        self.request_count: int = 0
+        self.request_seconds: float = 0.0
+        self._token_refreshes_before: int = 0
+
+    @property
+    def token_refresh_count(self) -> int:
+        return getattr(self._token_manager, "refresh_count", 0) - self._token_refreshes_before
+
+    def reset_statistics(self) -> None:
+        """Start counting requests and token refreshes from zero, eg. for the next command of a
+        worker."""
+        self._token_refreshes_before += self.token_refresh_count
+        self.request_count = 0
+        self.request_seconds = 0.0
+
+    def _timed_get(
+        self, url: str, headers: Optional[dict] = None, stream: bool = False
+    ) -> Response:
+        start: float = time.perf_counter()
+        try:
+            return self.session.get(url, headers=headers, timeout=self.timeout, stream=stream)
+        finally:
+            self.request_count += 1
+            self.request_seconds += time.perf_counter() - start
+
+    def log_statistics(self) -> None:
+        """Log the number of requests, their total latency and the number of token refreshes."""
+        LOG.info(
+            f"StatusDB: {self.request_count} requests in {self.request_seconds:.2f}s, "
+            f"{self.token_refresh_count} token refreshes"
+        )
 
     @property
     def auth_header(self) -> dict:
@@ -35,7 +103,7 @@ class StatusDBAPI:
     def _get(self, endpoint: str) -> Any:
         url = self.base_url + endpoint
         try:
-            response: Response = requests.get(url, headers=self.auth_header)
+            response: Response = self._timed_get(url, headers=self.auth_header)
             response.raise_for_status()
             return response.json()
 
@@ -55,15 +123,50 @@ class StatusDBAPI:
             LOG.error(f"Failed to decode JSON from {url}")
             raise CgAPIClientDecodeError(f"Received an invalid JSON response from {url}.")
 
-    def get_application_tag(self, tag_name, key=None, entry_point="/applications"):
+    def _stream(self, endpoint: str, key: Optional[str] = None) -> Iterator[Any]:
+        """Yield the elements of the JSON array returned by the endpoint, or of the array under
+        <key> in the returned object, decoding the response body as it is downloaded."""
+        url = self.base_url + endpoint
         try:
-            res = requests.get(self.base_url + entry_point + "/" + tag_name)
-            if key:
-                return json.loads(res.text)[key]
-            else:
-                return json.loads(res.text)
-        except ConnectionError:
-            raise LimsError(message="No connection to clinical-api!")
+            response: Response = self._timed_get(url, headers=self.auth_header, stream=True)
+            try:
+                response.raise_for_status()
+                yield from iter_json_array(
+                    chunks=response.iter_content(chunk_size=STREAM_CHUNK_SIZE), key=key
+                )
+            finally:
+                response.close()
+
+        except requests.ConnectionError:
+            LOG.error(f"Connection error when accessing {url}")
+            raise CgAPIClientConnectionError(f"Failed to connect to the server at {url}.")
+
+        except requests.Timeout:
+            LOG.error(f"Timeout error when accessing {url}")
+            raise CgAPIClientTimeoutError(f"Request to {url} timed out.")
+
+        except requests.RequestException as e:
+            LOG.error(f"Error when accessing {url}: {e}")
+            raise CgAPIClientError(f"An error occurred while making the request to {url}: {e}.")
+
+        except ValueError:
+            LOG.error(f"Failed to decode JSON from {url}")
+            raise CgAPIClientDecodeError(f"Received an invalid JSON response from {url}.")
+
+    def get_application_tag(self, tag_name, key=None, entry_point="/applications"):
+        endpoint: str = entry_point + "/" + tag_name
+        application_tag: Optional[Dict] = self.application_tag_cache.get(endpoint)
+        if application_tag is None:
+            try:
+                res = self._timed_get(self.base_url + endpoint)
+                application_tag = json.loads(res.text)
+            except (ConnectionError, requests.ConnectionError):
+                raise CgAPIClientConnectionError("No connection to clinical-api!")
+            if res.ok:
+                self.application_tag_cache.set(endpoint, application_tag)
+        if key:
+            return application_tag[key]
+        return application_tag
 
     def get_sequencing_metrics_for_illumina_flow_cell(
         self, flow_cell_name: str
@@ -72,6 +175,14 @@ class StatusDBAPI:
         metrics_data: List[Dict] = self._get(metrics_endpoint)
         return [SampleLaneSequencingMetrics.model_validate(metric) for metric in metrics_data]
 
+    def iter_sequencing_metrics_for_illumina_flow_cell(
+        self, flow_cell_name: str
+    ) -> Iterator[SampleLaneSequencingMetricsRecord]:
+        """Stream the sample lane metrics of a flow cell as compact records."""
+        metrics_endpoint: str = f"/flowcells/{flow_cell_name}/sequencing_metrics"
+        for metric in self._stream(endpoint=metrics_endpoint):
+            yield SampleLaneSequencingMetricsRecord.from_json(metric)
+
     def get_pacbio_sequencing_run_from_run_id(self, run_id: str) -> List[PacbioSequencingRun]:
         """
         API function for fetching PacBio sequencing runs from StatusDB.
@@ -81,14 +192,10 @@ class StatusDBAPI:
         runs_data: Dict[str, List[Dict]] = self._get(endpoint=runs_endpoint)
         return [PacbioSequencingRun.model_validate(run) for run in runs_data["runs"]]
 
-    def get_pacbio_sequencing_metrics(
-        self, sample_id: Optional[str] = None, smrt_cell_ids: Optional[List[str]] = None
-    ) -> List[PacbioSampleSequencingMetrics]:
-        """
-        API function for fetching PacBio sample sequencing metrics from StatusDB.
-        Returns a list of PacbioSampleSequencingMetrics objects given a sample ID
-        and/or a list of SMRT Cell IDs.
-        """
+    @staticmethod
+    def _get_pacbio_sequencing_metrics_endpoint(
+        sample_id: Optional[str] = None, smrt_cell_ids: Optional[List[str]] = None
+    ) -> str:
         query_params: List[Tuple[str, str]] = []
         if sample_id:
             query_params.append(("sample_id", sample_id))
@@ -97,9 +204,32 @@ class StatusDBAPI:
                 query_params.append(("smrt_cell_ids", smrt_cell_id))
 
         query_string: str = f"?{urlencode(query=query_params)}" if query_params else ""
-        metrics_endpoint: str = f"/pacbio_sample_sequencing_metrics{query_string}"
+        return f"/pacbio_sample_sequencing_metrics{query_string}"
+
+    def get_pacbio_sequencing_metrics(
+        self, sample_id: Optional[str] = None, smrt_cell_ids: Optional[List[str]] = None
+    ) -> List[PacbioSampleSequencingMetrics]:
+        """
+        API function for fetching PacBio sample sequencing metrics from StatusDB.
+        Returns a list of PacbioSampleSequencingMetrics objects given a sample ID
+        and/or a list of SMRT Cell IDs.
+        """
+        metrics_endpoint: str = self._get_pacbio_sequencing_metrics_endpoint(
+            sample_id=sample_id, smrt_cell_ids=smrt_cell_ids
+        )
         metrics_data: Dict[str, List[Dict]] = self._get(endpoint=metrics_endpoint)
         return [
             PacbioSampleSequencingMetrics.model_validate(metric)
             for metric in metrics_data["metrics"]
         ]
+
+    def iter_pacbio_sequencing_metrics(
+        self, sample_id: Optional[str] = None, smrt_cell_ids: Optional[List[str]] = None
+    ) -> Iterator[PacbioSampleSequencingMetricsRecord]:
+        """Stream the PacBio sample sequencing metrics of a sample and/or SMRT Cells as compact
+        records."""
+        metrics_endpoint: str = self._get_pacbio_sequencing_metrics_endpoint(
+            sample_id=sample_id, smrt_cell_ids=smrt_cell_ids
+        )
+        for metric in self._stream(endpoint=metrics_endpoint, key="metrics"):
+            yield PacbioSampleSequencingMetricsRecord.from_json(metric)
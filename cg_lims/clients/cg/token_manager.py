@@ -1,13 +1,20 @@
 import logging
+import threading
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional
 
-import google.auth.transport.requests
-from google.oauth2 import service_account
+if TYPE_CHECKING:
+    from google.oauth2.service_account import IDTokenCredentials
 
 LOG = logging.getLogger(__name__)
 
+TOKEN_EXPIRY_MARGIN = timedelta(minutes=5)
+
 
 class TokenManager:
-    """Manages generation and refreshing of JWT tokens."""
+    """Manages generation and refreshing of JWT tokens.
+
+    The token is cached and reused until shortly before it expires."""
 
     def __init__(
         self, service_account_email: str, service_account_auth_file: str, audience: str
@@ -15,14 +22,34 @@ class TokenManager:
         self._service_account_email = service_account_email
         self._service_account_auth_file = service_account_auth_file
         self.audience = audience
+        self.refresh_count: int = 0
+        self._credentials: Optional["IDTokenCredentials"] = None
+        self._lock = threading.Lock()
+
+    def _is_token_valid(self) -> bool:
+        if not (self._credentials and self._credentials.token):
+            return False
+        expiry: Optional[datetime] = self._credentials.expiry
+        return expiry is None or datetime.utcnow() < expiry - TOKEN_EXPIRY_MARGIN
 
     def get_token(self) -> str:
-        """Get a valid JWT token."""
-        credentials = service_account.IDTokenCredentials.from_service_account_file(
-            self._service_account_auth_file,
-            target_audience=self.audience,
-        )
-
-        request = google.auth.transport.requests.Request()
-        credentials.refresh(request)
-        return credentials.token
+        """Get a valid JWT token. google-auth is imported on the first refresh, so commands that
+        never call the StatusDB API do not pay for its import."""
+        import google.auth.transport.requests
+        from google.oauth2 import service_account
+
+        with self._lock:
+            if self._is_token_valid():
+                return self._credentials.token
+
+            if not self._credentials:
+                self._credentials = service_account.IDTokenCredentials.from_service_account_file(
+                    self._service_account_auth_file,
+                    target_audience=self.audience,
+                )
+
+            request = google.auth.transport.requests.Request()
+            self._credentials.refresh(request)
+            self.refresh_count += 1
+            LOG.debug(f"Refreshed JWT token, valid until {self._credentials.expiry}")
+            return self._credentials.token
@@ -0,0 +1,248 @@
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+from urllib.parse import urlparse
+from xml.etree import ElementTree
+
+import requests
+from genologics.lims import TIMEOUT, Lims
+
+LOG = logging.getLogger(__name__)
+
+DAY = 24 * 60 * 60
+
+# Seconds that a cached entity of each type is used without asking the lims, by the first segment
+# of the entity uri after the api version. Entity types not listed are never cached.
+DEFAULT_TTLS: Dict[str, int] = {
+    "reagenttypes": DAY,
+    "containertypes": 7 * DAY,
+    "processtypes": DAY,
+    "configuration": DAY,
+    "instruments": DAY,
+}
+
+DEFAULT_MAX_ENTRIES = 20000
+
+
+class CacheEntry(NamedTuple):
+    xml: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class LimsXmlCache:
+    """
+    Size bounded, persistent cache of entity XML keyed by uri, stored in an SQLite file.
+
+    Entries are fresh for the ttl of their entity type. Expired entries are kept, so that they
+    can be revalidated with a conditional request. The file is shared by all EPPs, so the times
+    entries are used or revalidated are kept in memory and written by flush(), which also evicts
+    the least recently used entries when there are more than <max_entries>.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[Dict[str, int]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path: Path = Path(path)
+        self.ttls: Dict[str, int] = DEFAULT_TTLS if ttls is None else ttls
+        self.max_entries: int = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidations: int = 0
+        self._accessed: Dict[str, float] = {}
+        self._revalidated: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "uri TEXT PRIMARY KEY, xml BLOB, etag TEXT, last_modified TEXT, "
+            "fetched_at REAL, accessed_at REAL)"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def get_entity_type(uri: str) -> Optional[str]:
+        """Return the entity type of a uri, eg. containertypes for .../api/v2/containertypes/1."""
+        segments = [segment for segment in urlparse(uri).path.split("/") if segment]
+        if "api" not in segments:
+            return None
+        type_index: int = segments.index("api") + 2
+        return segments[type_index] if type_index < len(segments) else None
+
+    def get_ttl(self, uri: str) -> int:
+        return self.ttls.get(self.get_entity_type(uri), 0)
+
+    def is_cacheable(self, uri: str) -> bool:
+        return self.get_ttl(uri) > 0
+
+    def lookup(self, uri: str) -> Optional[CacheEntry]:
+        """Return the cached entry of the uri, fresh or not, or None if there is none."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT xml, etag, last_modified, fetched_at FROM entries WHERE uri = ?", (uri,)
+            ).fetchone()
+            revalidated_at: Optional[float] = self._revalidated.get(uri)
+        if not row:
+            return None
+        entry = CacheEntry(*row)
+        return entry._replace(fetched_at=revalidated_at) if revalidated_at else entry
+
+    def is_fresh(self, uri: str, entry: CacheEntry) -> bool:
+        return time.time() - entry.fetched_at < self.get_ttl(uri)
+
+    def store(
+        self,
+        uri: str,
+        xml: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        now: float = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (uri, xml, etag, last_modified, now, now),
+            )
+            self._connection.commit()
+            self._accessed.pop(uri, None)
+            self._revalidated.pop(uri, None)
+
+    def touch(self, uri: str, revalidated: bool = False) -> None:
+        """Mark an entry as used, and as fetched now if it was revalidated against the lims."""
+        now: float = time.time()
+        with self._lock:
+            self._accessed[uri] = now
+            if revalidated:
+                self._revalidated[uri] = now
+
+    def invalidate(self, uri: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries WHERE uri = ?", (uri,))
+            self._connection.commit()
+            self._accessed.pop(uri, None)
+            self._revalidated.pop(uri, None)
+
+    def flush(self) -> None:
+        """Write the times entries were used and revalidated in one transaction, and evict the
+        least recently used entries past <max_entries>."""
+        with self._lock:
+            try:
+                self._connection.executemany(
+                    "UPDATE entries SET accessed_at = ? WHERE uri = ?",
+                    [(accessed_at, uri) for uri, accessed_at in self._accessed.items()],
+                )
+                self._connection.executemany(
+                    "UPDATE entries SET fetched_at = ? WHERE uri = ?",
+                    [(fetched_at, uri) for uri, fetched_at in self._revalidated.items()],
+                )
+                entry_count: int = self._connection.execute(
+                    "SELECT COUNT(*) FROM entries"
+                ).fetchone()[0]
+                if entry_count > self.max_entries:
+                    self._evict()
+                self._connection.commit()
+            except sqlite3.Error as error:
+                LOG.warning(f"Could not write LIMS XML cache {self.path}: {error}")
+                self._connection.rollback()
+            self._accessed.clear()
+            self._revalidated.clear()
+
+    def _evict(self) -> None:
+        self._connection.execute(
+            "DELETE FROM entries WHERE uri NOT IN "
+            "(SELECT uri FROM entries ORDER BY accessed_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def log_statistics(self) -> None:
+        LOG.info(
+            f"LIMS XML cache {self.path}: {self.hits} hits, {self.misses} misses, "
+            f"{self.revalidations} revalidated"
+        )
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+
+
+class CachingLims(Lims):
+    """
+    Lims that serves GET requests of slow-changing entity types from a LimsXmlCache.
+
+    Expired entries are revalidated with If-None-Match/If-Modified-Since when the lims gave an
+    ETag or Last-Modified header for them. Entries are dropped when their entity is updated.
+    """
+
+    def __init__(self, baseuri, username, password, xml_cache: LimsXmlCache, version="v2"):
+        super().__init__(baseuri, username, password, version=version)
+        self.xml_cache: LimsXmlCache = xml_cache
+
+    def get(self, uri, params=dict()):
+        if params or not self.xml_cache.is_cacheable(uri):
+            return super().get(uri, params=params)
+
+        try:
+            entry: Optional[CacheEntry] = self.xml_cache.lookup(uri)
+        except sqlite3.Error as error:
+            LOG.warning(f"Could not read LIMS XML cache {self.xml_cache.path}: {error}")
+            return super().get(uri, params=params)
+        if entry and self.xml_cache.is_fresh(uri=uri, entry=entry):
+            self.xml_cache.hits += 1
+            self.xml_cache.touch(uri)
+            return ElementTree.fromstring(entry.xml)
+
+        headers: Dict[str, str] = dict(accept="application/xml")
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        try:
+            response = self.request_session.get(
+                uri, auth=(self.username, self.password), headers=headers, timeout=TIMEOUT
+            )
+        except requests.exceptions.Timeout as e:
+            raise type(e)("{0}, Error trying to reach {1}".format(str(e), uri))
+
+        if entry and response.status_code == 304:
+            self.xml_cache.revalidations += 1
+            self.xml_cache.touch(uri, revalidated=True)
+            return ElementTree.fromstring(entry.xml)
+
+        self.xml_cache.misses += 1
+        root = self.parse_response(response)
+        try:
+            self.xml_cache.store(
+                uri=uri,
+                xml=response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        except sqlite3.Error as error:
+            LOG.warning(f"Could not write LIMS XML cache {self.xml_cache.path}: {error}")
+        return root
+
+    def _invalidate(self, uri: str) -> None:
+        try:
+            self.xml_cache.invalidate(uri)
+        except sqlite3.Error as error:
+            LOG.warning(f"Could not drop {uri} from LIMS XML cache {self.xml_cache.path}: {error}")
+
+    def put(self, uri, data, params=dict()):
+        self._invalidate(uri)
+        return super().put(uri, data, params=params)
+
+    def post(self, uri, data, params=dict()):
+        self._invalidate(uri)
+        return super().post(uri, data, params=params)
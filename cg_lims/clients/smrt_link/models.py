@@ -1,3 +1,5 @@
+from typing import Optional
+
 from cg_lims.clients.smrt_link.smrt_link_client import SmrtLinkClient
 
 DEFAULT_HTTPS = False
@@ -20,13 +22,17 @@ class SmrtLinkConfig:
         self.password = password
         self.port = port
         self.verify = verify
+        self._client: Optional[SmrtLinkClient] = None
 
-    def client(self):
-        """Initialize the SMRT Link API client."""
-        return SmrtLinkClient(
-            host=self.host,
-            port=self.port,
-            username=self.username,
-            password=self.password,
-            verify=self.verify,
-        )
+    def client(self) -> SmrtLinkClient:
+        """Return the SMRT Link API client, which is authenticated when first created and reused
+        after that. Its token is refreshed by the client when it expires."""
+        if not self._client:
+            self._client = SmrtLinkClient(
+                host=self.host,
+                port=self.port,
+                username=self.username,
+                password=self.password,
+                verify=self.verify,
+            )
+        return self._client
@@ -1,39 +1,128 @@
 #!/usr/bin/env python
-from typing import Dict
+import logging
+import sqlite3
+from typing import TYPE_CHECKING, Dict
 
 import click
 import yaml
 from cg_lims import options
-from cg_lims.clients.cg.status_db_api import StatusDBAPI
-from cg_lims.clients.cg.token_manager import TokenManager
+from cg_lims.clients.arnold.arnold_client import DEFAULT_CHUNK_SIZE, ArnoldClient, BodyFormat
+from cg_lims.clients.arnold.upload_manifest import UploadManifest
+from cg_lims.clients.lims_xml_cache import DEFAULT_TTLS, CachingLims, LimsXmlCache
 from cg_lims.clients.smrt_link.models import SmrtLinkConfig
-
-# commands
-from cg_lims.EPPs import epps
-from cg_lims.scripts.base import scripts
+from cg_lims.get.reagent_catalog import (
+    DEFAULT_MAX_AGE_SECONDS,
+    ReagentCatalog,
+    set_reagent_catalog,
+)
+from cg_lims.instrumentation import Instrumentation
+from cg_lims.lazy import LazyContextObject, LazyGroup
 from genologics.lims import Lims
 
+if TYPE_CHECKING:
+    from cg_lims.clients.cg.status_db_api import StatusDBAPI
 
-@click.group(invoke_without_command=True)
-@options.config()
-@click.pass_context
-def cli(ctx, config):
-    with open(config) as file:
-        config_data: Dict = yaml.load(file, Loader=yaml.FullLoader)
-    lims = Lims(config_data["BASEURI"], config_data["USERNAME"], config_data["PASSWORD"])
+LOG = logging.getLogger(__name__)
+
+COMMANDS: Dict[str, str] = {
+    "epps": "cg_lims.EPPs.base:epps",
+    "scripts": "cg_lims.scripts.base:scripts",
+    "worker": "cg_lims.worker.server:worker",
+}
+
+
+def create_status_db(config_data: Dict) -> "StatusDBAPI":
+    """Create the StatusDB API client. Its modules, and their pydantic models and google-auth, are
+    imported here as most commands never use it."""
+    from cg_lims.clients.cg.application_tag_cache import DEFAULT_TTL_SECONDS, ApplicationTagCache
+    from cg_lims.clients.cg.status_db_api import StatusDBAPI
+    from cg_lims.clients.cg.token_manager import TokenManager
+
+    token_manager = TokenManager(
+        service_account_email=config_data.get("SERVICE_ACCOUNT_EMAIL"),
+        service_account_auth_file=config_data.get("SERVICE_ACCOUNT_AUTH_FILE"),
+        audience=config_data.get("BASEURI"),
+    )
+    application_tag_cache = ApplicationTagCache(
+        path=config_data.get("APPLICATION_TAG_CACHE_FILE"),
+        ttl=config_data.get("APPLICATION_TAG_CACHE_TTL", DEFAULT_TTL_SECONDS),
+    )
+    return StatusDBAPI(
+        base_url=config_data.get("CG_URL"),
+        token_manager=token_manager,
+        application_tag_cache=application_tag_cache,
+    )
 
-    service_account_email: str = config_data.get("SERVICE_ACCOUNT_EMAIL")
-    service_account_auth_file: str = config_data.get("SERVICE_ACCOUNT_AUTH_FILE")
-    audience: str = config_data.get("BASEURI")
 
-    token_manager: TokenManager = TokenManager(
-        service_account_email=service_account_email,
-        service_account_auth_file=service_account_auth_file,
-        audience=audience,
+def create_arnold_client(config_data: Dict) -> ArnoldClient:
+    """Create the arnold client. Raises BadParameter if the chunk size of the config is not a
+    positive integer or its body format is unknown."""
+    configured_chunk_size = config_data.get("ARNOLD_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+    try:
+        chunk_size: int = int(configured_chunk_size)
+    except (TypeError, ValueError):
+        chunk_size = 0
+    if chunk_size < 1:
+        raise click.BadParameter(
+            f"ARNOLD_CHUNK_SIZE must be a positive integer, not {configured_chunk_size!r}",
+            param_hint="config",
+        )
+    configured_body_format = config_data.get("ARNOLD_BODY_FORMAT", BodyFormat.JSON)
+    try:
+        body_format = BodyFormat(configured_body_format)
+    except ValueError:
+        formats: str = ", ".join(body_format.value for body_format in BodyFormat)
+        raise click.BadParameter(
+            f"ARNOLD_BODY_FORMAT must be one of {formats}, not {configured_body_format!r}",
+            param_hint="config",
+        )
+    return ArnoldClient(
+        host=config_data.get("ARNOLD_HOST"),
+        chunk_size=chunk_size,
+        body_format=body_format,
+        compress=config_data.get("ARNOLD_COMPRESS", False),
     )
 
-    cg_url: str = config_data.get("CG_URL")
-    status_db: StatusDBAPI = StatusDBAPI(base_url=cg_url, token_manager=token_manager)
+
+def create_lims(config_data: Dict) -> Lims:
+    """Create the lims client, with a LIMS XML cache if the config has a cache file. The cache is
+    only an optimization, so a cache file that cannot be opened is logged and left out."""
+    lims_cache_file: str = config_data.get("LIMS_CACHE_FILE")
+    if lims_cache_file:
+        try:
+            xml_cache = LimsXmlCache(
+                path=lims_cache_file,
+                ttls={**DEFAULT_TTLS, **config_data.get("LIMS_CACHE_TTLS", {})},
+            )
+            return CachingLims(
+                config_data["BASEURI"],
+                config_data["USERNAME"],
+                config_data["PASSWORD"],
+                xml_cache=xml_cache,
+            )
+        except (OSError, sqlite3.Error) as error:
+            LOG.warning(f"Could not open LIMS XML cache {lims_cache_file}: {error}")
+    return Lims(config_data["BASEURI"], config_data["USERNAME"], config_data["PASSWORD"])
+
+
+def read_config(config: str) -> Dict:
+    with open(config) as file:
+        return yaml.load(file, Loader=yaml.FullLoader)
+
+
+def add_clients(context_object: LazyContextObject, config_data: Dict) -> None:
+    """Add the lims, StatusDB, SMRT Link and arnold clients and settings of the config to the
+    context object."""
+    lims: Lims = create_lims(config_data=config_data)
+
+    reagent_catalog_file: str = config_data.get("REAGENT_CATALOG_FILE")
+    if reagent_catalog_file:
+        reagent_catalog = ReagentCatalog(
+            lims=lims,
+            path=reagent_catalog_file,
+            max_age=config_data.get("REAGENT_CATALOG_MAX_AGE", DEFAULT_MAX_AGE_SECONDS),
+        )
+        set_reagent_catalog(reagent_catalog)
 
     smrt_link_host: str = config_data.get("SMRT_LINK_HOST")
     smrt_link_user: str = config_data.get("SMRT_LINK_USER")
@@ -42,15 +131,32 @@ def cli(ctx, config):
         host=smrt_link_host, username=smrt_link_user, password=smrt_link_pass
     )
 
-    ctx.ensure_object(dict)
-    ctx.obj["lims"] = lims
-    ctx.obj["status_db"] = status_db
-    ctx.obj["smrt_link"] = smrt_link_config
-    ctx.obj["arnold_host"] = config_data.get("ARNOLD_HOST")
-    ctx.obj["atlas_host"] = config_data.get("ATLAS_HOST")
-    ctx.obj["db_uri"] = config_data.get("DB_URI")
-    ctx.obj["db_name"] = config_data.get("DB_NAME")
+    context_object["lims"] = lims
+    context_object.set_factory("status_db", lambda: create_status_db(config_data=config_data))
+    context_object["smrt_link"] = smrt_link_config
+    context_object["arnold_client"] = create_arnold_client(config_data=config_data)
+    context_object.set_factory(
+        "arnold_upload_manifest",
+        lambda: UploadManifest(path=config_data.get("ARNOLD_UPLOAD_MANIFEST_FILE")),
+    )
+    context_object["instrumentation"] = Instrumentation(
+        service_hosts={
+            "lims": config_data.get("BASEURI"),
+            "status_db": config_data.get("CG_URL"),
+            "arnold": config_data.get("ARNOLD_HOST"),
+            "atlas": config_data.get("ATLAS_HOST"),
+            "smrt_link": config_data.get("SMRT_LINK_HOST"),
+        },
+        metrics_file=config_data.get("COMMAND_METRICS_FILE"),
+    )
+    context_object["atlas_host"] = config_data.get("ATLAS_HOST")
+    context_object["db_uri"] = config_data.get("DB_URI")
+    context_object["db_name"] = config_data.get("DB_NAME")
 
 
-cli.add_command(epps)
-cli.add_command(scripts)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
+@options.config()
+@click.pass_context
+def cli(ctx, config):
+    ctx.obj = LazyContextObject(ctx.obj or {})
+    add_clients(context_object=ctx.obj, config_data=read_config(config))
@@ -167,3 +167,9 @@ class ServiceAccountFileError(Exception):
     """
 
     pass
+
+
+class WriteBackError(LimsError):
+    """Raise when entities could not be written back to lims in a batch update."""
+
+    pass
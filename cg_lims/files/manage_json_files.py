@@ -0,0 +1,18 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def write_json_atomically(path: Path, content: Any) -> None:
+    """Write the content as JSON to a temporary file next to <path> and replace <path> with it, so
+    that readers never see a partly written file. The temporary file is removed if writing fails."""
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent)
+    try:
+        with os.fdopen(file_descriptor, "w") as file:
+            json.dump(content, file)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
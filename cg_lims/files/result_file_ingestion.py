@@ -0,0 +1,151 @@
+import csv
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from cg_lims.exceptions import FileError, MissingFileError
+from cg_lims.put.write_back import WriteBackSession
+from genologics.entities import Artifact
+from genologics.lims import Lims
+from openpyxl import load_workbook
+
+LOG = logging.getLogger(__name__)
+
+Row = Sequence[Any]
+Coercer = Callable[[Any], Any]
+
+# well -> {udf name: value}
+PatchTable = Dict[str, Dict[str, Any]]
+
+
+@contextmanager
+def open_csv_rows(result_file: Path, encoding: str = "latin1") -> Iterator[Iterator[Row]]:
+    """Open a CSV result file and yield an iterator over its rows, header row included."""
+    with open(result_file, newline="", encoding=encoding) as csv_file:
+        yield csv.reader(csv_file)
+
+
+@contextmanager
+def open_excel_rows(
+    result_file: Path, skip_rows: int = 0, sheet_name: Optional[str] = None
+) -> Iterator[Iterator[Row]]:
+    """Open an Excel result file in read-only mode and yield an iterator over the cell values
+    of its rows, starting after <skip_rows> rows. Rows are read from the file as they are
+    iterated, so the workbook is never loaded into memory as a whole. Without <sheet_name>,
+    the first sheet of the workbook is read."""
+    if result_file.suffix.lower() == ".xls":
+        raise FileError(
+            f"Legacy Excel files are not supported, save {result_file.name} as .xlsx and try again."
+        )
+    workbook = load_workbook(result_file, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        yield worksheet.iter_rows(min_row=skip_rows + 1, values_only=True)
+    finally:
+        workbook.close()
+
+
+def is_blank(value: Any) -> bool:
+    return value is None or value == "" or value != value
+
+
+class ResultFileIngestion:
+    """
+    Streams rows of instrument result files into a table of UDF values per well.
+
+    The column of each UDF is resolved once per file. Rows are matched to the artifacts of the
+    step on their well, and their values are coerced with one coercer per column. Several
+    files, eg. one per plate, can be ingested into the same table before it is applied to the
+    artifacts with one batch update:
+
+        ingestion = ResultFileIngestion(well_dict=well_dict)
+        with open_csv_rows(result_file=file) as rows:
+            ingestion.ingest_rows(rows=rows, well_column="Well", udf_columns={"Size": "Size bp"})
+        ingestion.apply(lims=lims)
+    """
+
+    def __init__(self, well_dict: Dict[str, Artifact]):
+        self.well_dict: Dict[str, Artifact] = well_dict
+        self.patches: PatchTable = {}
+        self.missing_values: int = 0
+        self.unknown_wells: int = 0
+
+    def ingest_rows(
+        self,
+        rows: Iterator[Row],
+        well_column: Any,
+        udf_columns: Dict[str, Any],
+        header: bool = True,
+        coercers: Optional[Dict[str, Coercer]] = None,
+        source: str = "result file",
+    ) -> int:
+        """Add the UDF values of the rows to the patch table and return the number of wells that
+        got at least one value.
+
+        If <header> is set, the first row names the columns and <well_column> and the values of
+        <udf_columns> are column names. Otherwise they are column indices. Columns missing in the
+        file are logged and skipped."""
+        coercers = coercers or {}
+        column_names: List[Any] = list(next(rows, [])) if header else []
+        well_index: Optional[int] = self._resolve_column(
+            column=well_column, column_names=column_names, header=header, source=source
+        )
+        if well_index is None:
+            return 0
+        udf_indices: Dict[str, int] = {}
+        for udf_name, column in udf_columns.items():
+            index: Optional[int] = self._resolve_column(
+                column=column, column_names=column_names, header=header, source=source
+            )
+            if index is not None:
+                udf_indices[udf_name] = index
+
+        patched_wells: int = 0
+        for row in rows:
+            well: Any = row[well_index] if well_index < len(row) else None
+            if well not in self.well_dict:
+                LOG.info(f"Well {well} is not used by a sample in the step, skipping.")
+                self.unknown_wells += 1
+                continue
+            patch: Dict[str, Any] = {}
+            for udf_name, index in udf_indices.items():
+                value: Any = row[index] if index < len(row) else None
+                if is_blank(value):
+                    LOG.info(f"Missing value for {udf_name} in well {well}, skipping.")
+                    self.missing_values += 1
+                    continue
+                coerce: Optional[Coercer] = coercers.get(udf_name)
+                patch[udf_name] = coerce(value) if coerce else value
+            if patch:
+                self.patches.setdefault(well, {}).update(patch)
+                patched_wells += 1
+        return patched_wells
+
+    @staticmethod
+    def _resolve_column(
+        column: Any, column_names: List[Any], header: bool, source: str
+    ) -> Optional[int]:
+        if not header:
+            return column
+        if column not in column_names:
+            LOG.info(f"Column {column} does not exist in {source}, skipping.")
+            return None
+        return column_names.index(column)
+
+    def apply(self, lims: Lims) -> List[Artifact]:
+        """Set the collected UDF values on the artifacts and write them back in batches."""
+        updated_artifacts: List[Artifact] = []
+        with WriteBackSession(lims=lims) as session:
+            for well, patch in self.patches.items():
+                artifact: Artifact = self.well_dict[well]
+                for udf_name, value in patch.items():
+                    artifact.udf[udf_name] = value
+                session.add(artifact)
+                updated_artifacts.append(artifact)
+        return updated_artifacts
+
+
+def check_result_file(result_file: Path) -> None:
+    if not result_file.is_file():
+        raise MissingFileError(f"No such file: {result_file}")
@@ -0,0 +1,90 @@
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from cg_lims.get.artifacts import get_latest_artifact
+from cg_lims.get.batch import batch_retrieve, chunk_entities
+from genologics.entities import Artifact
+from genologics.lims import Lims
+
+LOG = logging.getLogger(__name__)
+
+SAMPLE_QUERY_CHUNK_SIZE = 100
+
+_active_indexes: "WeakKeyDictionary[Lims, AnalyteIndex]" = WeakKeyDictionary()
+
+
+class AnalyteIndex:
+    """
+    Analytes of a set of samples, grouped by sample and by the process types that produced them.
+
+    Instead of one artifact search per sample and process type, the index makes one search per
+    process type for all samples (in chunks of sample ids), groups the found analytes by sample and
+    resolves the latest analyte in memory.
+
+    Used as a context manager the index is activated for its lims instance, so that every
+    BaseAnalyte created for that lims draws from it:
+
+        with AnalyteIndex(lims=lims, sample_ids=sample_ids):
+            documents = build_twist_documents(sample_id=sample_id, process_id=process_id, lims=lims)
+    """
+
+    def __init__(
+        self, lims: Lims, sample_ids: List[str], chunk_size: int = SAMPLE_QUERY_CHUNK_SIZE
+    ):
+        self.lims: Lims = lims
+        self.sample_ids: List[str] = sorted(set(sample_ids))
+        self.chunk_size: int = chunk_size
+        self._analytes: Dict[Tuple[str, ...], Dict[str, List[Artifact]]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "AnalyteIndex":
+        _active_indexes[self.lims] = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if _active_indexes.get(self.lims) is self:
+            _active_indexes.pop(self.lims, None)
+
+    def covers(self, sample_id: str) -> bool:
+        return sample_id in self.sample_ids
+
+    def get_analytes(self, sample_id: str, process_types: List[str]) -> List[Artifact]:
+        """Return all analytes of the sample produced by any of the process types."""
+        key: Tuple[str, ...] = tuple(sorted(process_types))
+        with self._lock:
+            if key not in self._analytes:
+                self._analytes[key] = self._search_analytes(process_types=list(key))
+        return self._analytes[key].get(sample_id, [])
+
+    def get_latest_analyte(self, sample_id: str, process_types: List[str]) -> Optional[Artifact]:
+        """Return the analyte with the latest parent_process.date_run, or None if there is none."""
+        analytes: List[Artifact] = self.get_analytes(
+            sample_id=sample_id, process_types=process_types
+        )
+        if not analytes:
+            return None
+        return get_latest_artifact(lims_artifacts=analytes)
+
+    def _search_analytes(self, process_types: List[str]) -> Dict[str, List[Artifact]]:
+        analytes: Dict[str, List[Artifact]] = {}
+        for sample_ids in chunk_entities(entities=self.sample_ids, chunk_size=self.chunk_size):
+            artifacts: List[Artifact] = self.lims.get_artifacts(
+                samplelimsid=sample_ids, type="Analyte", process_type=process_types
+            )
+            batch_retrieve(lims=self.lims, entities=artifacts)
+            for artifact in artifacts:
+                for sample in artifact.samples:
+                    if sample.id in sample_ids:
+                        analytes.setdefault(sample.id, []).append(artifact)
+        LOG.info(
+            f"Indexed analytes of {len(analytes)} of {len(self.sample_ids)} samples "
+            f"for process types: {', '.join(process_types)}"
+        )
+        return analytes
+
+
+def get_active_analyte_index(lims: Lims) -> Optional[AnalyteIndex]:
+    """Return the analyte index activated for the lims instance, if any."""
+    return _active_indexes.get(lims)
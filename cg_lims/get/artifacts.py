@@ -4,7 +4,9 @@ from enum import Enum
 from typing import Dict, List, Literal, Optional, Set, Tuple
 
 from cg_lims.exceptions import FileError, InvalidValueError, MissingArtifactError
+from cg_lims.get.batch import batch_retrieve
 from cg_lims.get.fields import get_alternative_artifact_well, get_artifact_well
+from cg_lims.get.pool_resolver import PoolResolver
 from genologics.entities import Artifact, Process, Sample
 from genologics.lims import Lims
 
@@ -33,15 +35,21 @@ def get_artifact_lane(artifact: Artifact) -> int:
 def get_lane_sample_artifacts(process: Process) -> List[Tuple[int, Artifact]]:
     """Return a list of tuples (lane number, Artifact) detailing the artifacts on each lane in a BCL Convert step."""
     lane_sample_artifacts: Set = set()
+    per_reagent_maps: List[Tuple[Dict, Dict]] = [
+        (input_map, output_map)
+        for input_map, output_map in process.input_output_maps
+        if output_map
+        and output_map.get("output-generation-type") == OutputGenerationType.PER_REAGENT
+    ]
+    prefetch_map_artifacts(lims=process.lims, io_maps=per_reagent_maps)
 
-    for input_map, output_map in process.input_output_maps:
+    for input_map, output_map in per_reagent_maps:
         try:
-            if is_output_type_per_reagent(output_map):
-                output_artifact: Artifact = get_artifact_from_map(output_map)
-                input_artifact: Artifact = get_artifact_from_map(input_map)
-                lane: int = get_artifact_lane(input_artifact)
+            output_artifact: Artifact = get_artifact_from_map(output_map)
+            input_artifact: Artifact = get_artifact_from_map(input_map)
+            lane: int = get_artifact_lane(input_artifact)
 
-                lane_sample_artifacts.add((lane, output_artifact))
+            lane_sample_artifacts.add((lane, output_artifact))
         except KeyError:
             continue
 
@@ -81,6 +89,22 @@ def get_artifact_from_map(map: Dict) -> Artifact:
     return map[ARTIFACT_KEY]
 
 
+def prefetch_artifacts(lims: Lims, artifacts: List[Artifact]) -> List[Artifact]:
+    """Load all artifacts with batch calls instead of one GET per artifact."""
+    return batch_retrieve(lims=lims, entities=artifacts)
+
+
+def prefetch_map_artifacts(lims: Lims, io_maps: List[Tuple[Dict, Dict]]) -> None:
+    """Load the input and output artifacts of the given input_output_maps with batch calls."""
+    artifacts: List[Artifact] = [
+        io_map[ARTIFACT_KEY]
+        for io_map_pair in io_maps
+        for io_map in io_map_pair
+        if io_map and io_map.get(ARTIFACT_KEY) is not None
+    ]
+    prefetch_artifacts(lims=lims, artifacts=artifacts)
+
+
 def get_sample_artifact(lims: Lims, sample: Sample) -> Artifact:
     """
     Return the initial artifact related to a sample.
@@ -111,7 +135,7 @@ def get_output_artifacts(
         if output["output-generation-type"] in output_generation_types
         and output["output-type"] == output_type
     ]
-    return list(frozenset(artifacts))
+    return prefetch_artifacts(lims=lims, artifacts=list(frozenset(artifacts)))
 
 
 def get_artifacts(
@@ -122,11 +146,12 @@ def get_artifacts(
 ) -> List[Artifact]:
     """
     If inputs is True, returning all input analytes of the process,
-    otherwise returning all output analytes of the process
+    otherwise returning all output analytes of the process.
+    The returned artifacts are loaded with batch calls.
     """
 
     if input:
-        return process.all_inputs(unique=True)
+        return prefetch_artifacts(lims=process.lims, artifacts=process.all_inputs(unique=True))
     elif measurement:
         return get_output_artifacts(
             lims=process.lims,
@@ -273,15 +298,7 @@ def get_latest_result_files(
 
 def get_non_pooled_artifacts(artifact: Artifact) -> List[Artifact]:
     """Return the parent artifact of the sample. Should hold the reagent_label"""
-    artifacts: List[Artifact] = []
-
-    if len(artifact.samples) == 1:
-        artifacts.append(artifact)
-        return artifacts
-
-    for artifact in artifact.input_artifact_list():
-        artifacts.extend(get_non_pooled_artifacts(artifact))
-    return artifacts
+    return PoolResolver(lims=artifact.lims).get_non_pooled_artifacts(artifact=artifact)
 
 
 def create_well_dict(
@@ -297,11 +314,15 @@ def create_well_dict(
 
     well_dict: Dict[str, Artifact] = {}
     lims: Lims = process.lims
-    for input, output in process.input_output_maps:
-        if output.get("output-generation-type") == "PerAllInputs":
-            continue
-        input_artifact = Artifact(lims, id=input["limsid"])
-        output_artifact = Artifact(lims, id=output["limsid"])
+    artifact_pairs: List[Tuple[Artifact, Artifact]] = [
+        (Artifact(lims, id=input["limsid"]), Artifact(lims, id=output["limsid"]))
+        for input, output in process.input_output_maps
+        if output.get("output-generation-type") != "PerAllInputs"
+    ]
+    prefetch_artifacts(
+        lims=lims, artifacts=[artifact for pair in artifact_pairs for artifact in pair]
+    )
+    for input_artifact, output_artifact in artifact_pairs:
         source_artifact: Artifact = input_artifact if input_flag else output_artifact
         if native_well_format:
             well: str = source_artifact.location[1]
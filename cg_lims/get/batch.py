@@ -0,0 +1,54 @@
+import logging
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+from genologics.entities import Entity
+from genologics.lims import Lims
+from requests.exceptions import HTTPError
+
+LOG = logging.getLogger(__name__)
+
+BATCH_CHUNK_SIZE = 500
+
+
+def chunk_entities(entities: Iterable, chunk_size: int = BATCH_CHUNK_SIZE) -> Iterator[List]:
+    """Yield consecutive chunks of at most <chunk_size> entities. The entities may be a generator,
+    which is then consumed one chunk at a time."""
+
+    iterator: Iterator = iter(entities)
+    chunk: List = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def batch_retrieve(
+    lims: Lims, entities: Sequence[Entity], chunk_size: int = BATCH_CHUNK_SIZE
+) -> List[Entity]:
+    """Load the XML of all unloaded entities with the lims batch/retrieve endpoints.
+
+    Entities are grouped by type and fetched <chunk_size> at a time. Entity objects sharing lims
+    id but not uri (eg. artifacts with and without ?state=) all get the same XML.
+    If a batch call fails, the remaining entities are left to load lazily.
+    Returns the given entities."""
+
+    unloaded: Dict[type, Dict[str, List[Entity]]] = {}
+    for entity in entities:
+        if entity.root is None:
+            unloaded.setdefault(type(entity), {}).setdefault(entity.id, []).append(entity)
+
+    for entity_type, entities_by_id in unloaded.items():
+        representatives: List[Entity] = [same_id[0] for same_id in entities_by_id.values()]
+        for chunk in chunk_entities(entities=representatives, chunk_size=chunk_size):
+            try:
+                lims.get_batch(chunk)
+            except (HTTPError, TypeError) as error:
+                LOG.warning(
+                    f"Batch retrieve of {entity_type.__name__} failed, loading lazily instead: {error}"
+                )
+                break
+        for same_id in entities_by_id.values():
+            for entity in same_id[1:]:
+                entity.root = same_id[0].root
+
+    return list(entities)
@@ -0,0 +1,83 @@
+import logging
+from typing import Dict, Iterable, List, TypeVar
+
+from cg_lims.get.batch import batch_retrieve
+from genologics.entities import Artifact, Process
+from genologics.lims import Lims
+
+LOG = logging.getLogger(__name__)
+
+PoolKey = TypeVar("PoolKey")
+
+
+class PoolResolver:
+    """
+    Resolves pools into the non pooled artifacts they were made from.
+
+    All pools of a step are resolved together, breadth first: the artifacts of each level of the
+    pooling tree are fetched with batch calls, and the parent process of each level is fetched
+    once even when it made several of the pools. The leaves of every artifact in the tree are
+    memoized by artifact id, so that a pool placed on several lanes is only resolved once.
+    """
+
+    def __init__(self, lims: Lims):
+        self.lims: Lims = lims
+        self._inputs: Dict[str, List[Artifact]] = {}
+        self._leaves: Dict[str, List[Artifact]] = {}
+
+    def _load_tree(self, pools: Iterable[Artifact]) -> None:
+        frontier: Dict[str, Artifact] = {
+            pool.id: pool for pool in pools if pool.id not in self._inputs
+        }
+        while frontier:
+            artifacts: List[Artifact] = list(frontier.values())
+            batch_retrieve(lims=self.lims, entities=artifacts)
+            pooled_artifacts: Dict[str, Artifact] = {
+                artifact.id: artifact for artifact in artifacts if len(artifact.samples) != 1
+            }
+            parent_processes: Dict[str, Process] = {
+                artifact.parent_process.id: artifact.parent_process
+                for artifact in pooled_artifacts.values()
+                if artifact.parent_process
+            }
+            for process in parent_processes.values():
+                process.get()
+
+            next_frontier: Dict[str, Artifact] = {}
+            for artifact in artifacts:
+                inputs: List[Artifact] = (
+                    artifact.input_artifact_list() if artifact.id in pooled_artifacts else []
+                )
+                self._inputs[artifact.id] = inputs
+                for input_artifact in inputs:
+                    if input_artifact.id not in self._inputs:
+                        next_frontier[input_artifact.id] = input_artifact
+            frontier = next_frontier
+
+    def _get_leaves(self, artifact: Artifact) -> List[Artifact]:
+        if artifact.id not in self._leaves:
+            if len(artifact.samples) == 1:
+                self._leaves[artifact.id] = [artifact]
+            else:
+                self._leaves[artifact.id] = [
+                    leaf
+                    for input_artifact in self._inputs[artifact.id]
+                    for leaf in self._get_leaves(input_artifact)
+                ]
+        return self._leaves[artifact.id]
+
+    def resolve(self, pools: Dict[PoolKey, Artifact]) -> Dict[PoolKey, List[Artifact]]:
+        """Return the non pooled artifacts of each pool, eg. per lane or per well."""
+        self._load_tree(pools=pools.values())
+        resolved: Dict[PoolKey, List[Artifact]] = {
+            key: self._get_leaves(pool) for key, pool in pools.items()
+        }
+        LOG.info(
+            f"Resolved {len(pools)} pools into {sum(len(leaves) for leaves in resolved.values())} "
+            f"non pooled artifacts."
+        )
+        return resolved
+
+    def get_non_pooled_artifacts(self, artifact: Artifact) -> List[Artifact]:
+        """Return the non pooled artifacts of a single pool."""
+        return self.resolve(pools={artifact.id: artifact})[artifact.id]
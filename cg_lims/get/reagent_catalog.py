@@ -0,0 +1,168 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from cg_lims.clients.lims_xml_cache import DEFAULT_TTLS
+from cg_lims.files.manage_json_files import write_json_atomically
+from genologics.entities import ReagentType
+from genologics.lims import Lims
+
+LOG = logging.getLogger(__name__)
+
+# Sequence edits do not show in the reagent type listing, so persisted catalogs are rebuilt as
+# often as the LIMS XML cache revalidates reagent types.
+DEFAULT_MAX_AGE_SECONDS: int = DEFAULT_TTLS["reagenttypes"]
+
+_catalogs: "WeakKeyDictionary[Lims, ReagentCatalog]" = WeakKeyDictionary()
+
+
+class ReagentCatalog:
+    """
+    Index sequences of reagent types, keyed by reagent label.
+
+    Without a file, labels are looked up in lims the first time they are asked for and memoized
+    for the rest of the run. With a file, sync() pages through the reagent type listing once to
+    compute a version stamp of the catalog. Only reagent types that are new or changed since the
+    persisted version are fetched, and every label is then answered from memory. The version only
+    changes when reagent types are added, removed or renamed, so a sequence edited in lims is
+    served from the file until the catalog is rebuilt, at the latest after <max_age> seconds.
+    """
+
+    def __init__(
+        self, lims: Lims, path: Optional[str] = None, max_age: int = DEFAULT_MAX_AGE_SECONDS
+    ):
+        self.lims: Lims = lims
+        self.path: Optional[Path] = Path(path) if path else None
+        self.max_age: int = max_age
+        self.version: Optional[str] = None
+        self.built_at: float = 0.0
+        self.synced: bool = False
+        self._uris: Dict[str, List[str]] = {}
+        self._sequences: Dict[str, List[Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not (self.path and self.path.is_file()):
+            return
+        try:
+            content: Dict = json.loads(self.path.read_text())
+            self.version = content["version"]
+            self.built_at = content["built_at"]
+            self._uris = content["uris"]
+            self._sequences = content["sequences"]
+        except (OSError, ValueError, KeyError) as error:
+            LOG.warning(f"Could not read reagent catalog {self.path}: {error}")
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        content: Dict = {
+            "version": self.version,
+            "built_at": self.built_at,
+            "uris": self._uris,
+            "sequences": self._sequences,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomically(path=self.path, content=content)
+        except OSError as error:
+            LOG.warning(f"Could not write reagent catalog {self.path}: {error}")
+
+    def _list_reagent_types(self) -> List[Tuple[str, str]]:
+        """Return the name and uri of all reagent types, one request per page of the listing."""
+        reagent_types: List[Tuple[str, str]] = []
+        root = self.lims.get(self.lims.get_uri(ReagentType._URI))
+        while root is not None:
+            for node in root.findall(ReagentType._TAG):
+                reagent_types.append((node.attrib["name"], node.attrib["uri"]))
+            next_page = root.find("next-page")
+            root = self.lims.get(next_page.attrib["uri"]) if next_page is not None else None
+        return reagent_types
+
+    @staticmethod
+    def _get_version(reagent_types: List[Tuple[str, str]]) -> str:
+        return hashlib.sha1(json.dumps(sorted(reagent_types)).encode()).hexdigest()
+
+    def sync(self) -> None:
+        """Bring a persisted catalog up to date with the reagent types in lims, unless already
+        done. Catalogs without a file are only filled by lookups."""
+        with self._lock:
+            if self.synced or not self.path:
+                return
+            reagent_types: List[Tuple[str, str]] = self._list_reagent_types()
+            version: str = self._get_version(reagent_types)
+            expired: bool = time.time() - self.built_at > self.max_age
+            if version == self.version and not expired:
+                self.synced = True
+                return
+
+            uris: Dict[str, List[str]] = {}
+            for name, uri in reagent_types:
+                uris.setdefault(name, []).append(uri)
+            sequences: Dict[str, List[Optional[str]]] = {}
+            fetched: int = 0
+            for name, name_uris in uris.items():
+                if not expired and self._uris.get(name) == name_uris:
+                    sequences[name] = self._sequences[name]
+                    continue
+                sequences[name] = [ReagentType(self.lims, uri=uri).sequence for uri in name_uris]
+                fetched += 1
+            LOG.info(f"Synced reagent catalog: {len(uris)} labels, {fetched} fetched from lims.")
+
+            self._uris = uris
+            self._sequences = sequences
+            self.version = version
+            if expired:
+                self.built_at = time.time()
+            self.synced = True
+            self._save()
+
+    def reset(self) -> None:
+        """Forget what was looked up and synced so far, eg. between the commands of a worker.
+        A persisted catalog is synced again on its next use, starting from the version it holds."""
+        with self._lock:
+            self.synced = False
+            if not self.path:
+                self._sequences = {}
+
+    def get_sequences(self, label: str) -> List[Optional[str]]:
+        """Return the index sequences of all reagent types with the label."""
+        with self._lock:
+            if label in self._sequences:
+                return self._sequences[label]
+            if self.synced:
+                return []
+            reagent_types: List[ReagentType] = self.lims.get_reagent_types(name=label)
+            sequences: List[Optional[str]] = [
+                reagent_type.sequence for reagent_type in reagent_types
+            ]
+            if sequences:
+                self._sequences[label] = sequences
+            return sequences
+
+
+def get_reagent_catalog(lims: Lims) -> ReagentCatalog:
+    """Return the reagent catalog of the lims instance, creating an in-memory one if needed."""
+    catalog: Optional[ReagentCatalog] = _catalogs.get(lims)
+    if catalog is None:
+        catalog = ReagentCatalog(lims=lims)
+        _catalogs[lims] = catalog
+    return catalog
+
+
+def set_reagent_catalog(catalog: ReagentCatalog) -> None:
+    """Use the catalog for all reagent label lookups of its lims instance."""
+    _catalogs[catalog.lims] = catalog
+
+
+def reset_reagent_catalog(lims: Lims) -> None:
+    """Reset the reagent catalog of the lims instance, if it has one."""
+    catalog: Optional[ReagentCatalog] = _catalogs.get(lims)
+    if catalog:
+        catalog.reset()
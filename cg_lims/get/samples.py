@@ -1,9 +1,11 @@
 import logging
-from typing import List
+from typing import Dict, Iterable, List
 from xml.etree.ElementTree import ParseError
 
 from cg_lims.exceptions import MissingSampleError
+from cg_lims.get.batch import batch_retrieve
 from genologics.entities import Artifact, Process, Sample
+from genologics.lims import Lims
 
 LOG = logging.getLogger(__name__)
 
@@ -51,3 +53,19 @@ def is_negative_control(sample: Sample) -> bool:
         error_message = f"Sample {sample} can't be found in the database."
         LOG.error(error_message)
         raise MissingSampleError(error_message)
+
+
+def get_negative_controls(lims: Lims, sample_ids: Iterable[str]) -> Dict[str, bool]:
+    """Return whether each of the samples is a negative control, fetching the distinct samples
+    with batch calls. Samples that are not in lims are not considered negative controls."""
+    samples: List[Sample] = [
+        Sample(lims=lims, id=sample_id) for sample_id in sorted(set(sample_ids))
+    ]
+    batch_retrieve(lims=lims, entities=samples)
+    negative_controls: Dict[str, bool] = {}
+    for sample in samples:
+        try:
+            negative_controls[sample.id] = is_negative_control(sample=sample)
+        except MissingSampleError:
+            negative_controls[sample.id] = False
+    return negative_controls
@@ -0,0 +1,118 @@
+import logging
+from typing import Dict, List, Optional, Set
+
+from cg_lims.get.batch import batch_retrieve
+from genologics.entities import Artifact, Container, Containertype, Entity, Process, Sample
+from genologics.lims import Lims
+
+LOG = logging.getLogger(__name__)
+
+
+class ProcessSnapshot:
+    """
+    In-memory index of the entities of a process, keyed by lims id.
+
+    On first lookup the process, its input and output artifacts, their samples and containers
+    are loaded with batch calls and the container types with one GET per type. Since genologics
+    caches entity objects per lims instance, the loaded entities are the same objects that are
+    reached by walking the process lazily, eg. process.all_inputs()[0].samples[0].udf.
+    """
+
+    def __init__(self, process: Process):
+        self.process: Process = process
+        self.lims: Lims = process.lims
+        self._loaded: bool = False
+        self._input_artifact_ids: List[str] = []
+        self._output_artifact_ids: List[str] = []
+        self._artifacts: Dict[str, Artifact] = {}
+        self._samples: Dict[str, Sample] = {}
+        self._containers: Dict[str, Container] = {}
+        self._container_types: Dict[str, Containertype] = {}
+
+    def load(self) -> "ProcessSnapshot":
+        """Fetch all entities of the process, unless already done."""
+        if self._loaded:
+            return self
+
+        for input_map, output_map in self.process.input_output_maps:
+            self._add_artifact(io_map=input_map, artifact_ids=self._input_artifact_ids)
+            self._add_artifact(io_map=output_map, artifact_ids=self._output_artifact_ids)
+        self._load_entities(entities=list(self._artifacts.values()))
+
+        for artifact in self._artifacts.values():
+            for sample in artifact.samples:
+                self._samples[sample.id] = sample
+            if artifact.container:
+                self._containers[artifact.container.id] = artifact.container
+        self._load_entities(entities=list(self._samples.values()))
+        self._load_entities(entities=list(self._containers.values()))
+
+        for container in self._containers.values():
+            container_type: Containertype = container.type
+            if container_type and container_type.id not in self._container_types:
+                container_type.get()
+                self._container_types[container_type.id] = container_type
+
+        LOG.info(
+            f"Loaded snapshot of process {self.process.id}: {len(self._artifacts)} artifacts, "
+            f"{len(self._samples)} samples, {len(self._containers)} containers."
+        )
+        self._loaded = True
+        return self
+
+    def _load_entities(self, entities: List[Entity]) -> None:
+        """Batch load the entities, and get any that the batch calls did not load one by one."""
+        batch_retrieve(lims=self.lims, entities=entities)
+        for entity in entities:
+            entity.get()
+
+    def _add_artifact(self, io_map: Optional[Dict], artifact_ids: List[str]) -> None:
+        if not io_map or not io_map.get("limsid"):
+            return
+        artifact_id: str = io_map["limsid"]
+        if artifact_id not in self._artifacts:
+            self._artifacts[artifact_id] = Artifact(self.lims, id=artifact_id)
+        if artifact_id not in artifact_ids:
+            artifact_ids.append(artifact_id)
+
+    @property
+    def input_artifacts(self) -> List[Artifact]:
+        self.load()
+        return [self._artifacts[artifact_id] for artifact_id in self._input_artifact_ids]
+
+    @property
+    def output_artifacts(self) -> List[Artifact]:
+        self.load()
+        return [self._artifacts[artifact_id] for artifact_id in self._output_artifact_ids]
+
+    @property
+    def samples(self) -> List[Sample]:
+        self.load()
+        return list(self._samples.values())
+
+    def get_artifact(self, artifact_id: str) -> Optional[Artifact]:
+        self.load()
+        return self._artifacts.get(artifact_id)
+
+    def get_sample(self, sample_id: str) -> Optional[Sample]:
+        self.load()
+        return self._samples.get(sample_id)
+
+    def get_container(self, container_id: str) -> Optional[Container]:
+        self.load()
+        return self._containers.get(container_id)
+
+    def get_container_type(self, container_type_id: str) -> Optional[Containertype]:
+        self.load()
+        return self._container_types.get(container_type_id)
+
+    def get_artifact_samples(self, artifact_id: str) -> List[Sample]:
+        """Return the samples of an artifact in the process."""
+        artifact: Optional[Artifact] = self.get_artifact(artifact_id)
+        if not artifact:
+            return []
+        return [self._samples[sample.id] for sample in artifact.samples]
+
+    def get_sample_ids(self) -> Set[str]:
+        self.load()
+        return set(self._samples.keys())
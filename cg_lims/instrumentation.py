@@ -0,0 +1,212 @@
+import json
+import logging
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+import click
+from cg_lims.lazy import COMMAND_PATH_KEY
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+LOG = logging.getLogger(__name__)
+
+LIMS = "lims"
+OTHER = "other"
+LIMS_METHODS = ["GET", "PUT", "POST"]
+LIMS_ENTITY_TYPES: Dict[str, str] = {
+    "artifacts": "artifact",
+    "samples": "sample",
+    "processes": "process",
+    "containers": "container",
+    "reagenttypes": "reagenttype",
+}
+
+
+def get_host(address: Optional[str]) -> Optional[str]:
+    """The host name of an url, or of a bare host name as in the SMRT Link config."""
+    if not address:
+        return None
+    return urlparse(address if "//" in address else f"//{address}").hostname
+
+
+def get_lims_entity_type(url: str) -> str:
+    """The entity type of a lims api url, eg. artifact for .../api/v2/artifacts/batch/retrieve."""
+    segments: List[str] = urlparse(url).path.split("/")
+    if "v2" not in segments[:-1]:
+        return OTHER
+    return LIMS_ENTITY_TYPES.get(segments[segments.index("v2") + 1], OTHER)
+
+
+def get_body_size(request: PreparedRequest) -> int:
+    if isinstance(request.body, (bytes, str)):
+        return len(request.body)
+    return 0
+
+
+def get_response_size(response: Response, stream: bool) -> int:
+    """The size of the response body. Streamed bodies are not read here, so they are only counted
+    when their length is given."""
+    content_length: Optional[str] = response.headers.get("Content-Length")
+    if content_length:
+        return int(content_length)
+    return 0 if stream else len(response.content)
+
+
+@contextmanager
+def record_requests(on_response: Callable[[PreparedRequest, Response, bool], None]) -> Iterator:
+    """Call on_response with every http request sent through requests while in the context, its
+    response and whether it is streamed. HTTPAdapter.send is wrapped, as all requests, from
+    sessions or module level calls, go through it."""
+    send: Callable = HTTPAdapter.send
+
+    def recording_send(adapter: HTTPAdapter, request: PreparedRequest, *args, **kwargs) -> Response:
+        response: Response = send(adapter, request, *args, **kwargs)
+        on_response(request, response, kwargs.get("stream", False))
+        return response
+
+    HTTPAdapter.send = recording_send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = send
+
+
+class RequestStatistics:
+    """
+    Counts of the http requests made while recording, from any requests session or module level
+    call, by service. Lims requests are counted by method and entity type, with their bytes
+    by method.
+
+    """
+
+    def __init__(self, service_hosts: Dict[str, Optional[str]]):
+        self.service_hosts: Dict[str, str] = {
+            get_host(address): service for service, address in service_hosts.items() if address
+        }
+        self.service_calls: Dict[str, int] = {
+            service: 0 for service in service_hosts if service != LIMS
+        }
+        self.lims_calls: Dict[str, Dict[str, int]] = {method: {} for method in LIMS_METHODS}
+        self.lims_bytes: Dict[str, int] = {method: 0 for method in LIMS_METHODS}
+        self._lock = threading.Lock()
+        self._recording: Optional[ContextManager] = None
+
+    def add(self, request: PreparedRequest, response: Response, stream: bool) -> None:
+        service: str = self.service_hosts.get(urlparse(request.url).hostname, OTHER)
+        with self._lock:
+            if service != LIMS:
+                self.service_calls[service] = self.service_calls.get(service, 0) + 1
+                return
+            entity_calls: Dict[str, int] = self.lims_calls.setdefault(request.method, {})
+            entity_type: str = get_lims_entity_type(request.url)
+            entity_calls[entity_type] = entity_calls.get(entity_type, 0) + 1
+            self.lims_bytes[request.method] = (
+                self.lims_bytes.get(request.method, 0)
+                + get_body_size(request)
+                + get_response_size(response=response, stream=stream)
+            )
+
+    def __enter__(self) -> "RequestStatistics":
+        self._recording = record_requests(on_response=self.add)
+        self._recording.__enter__()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._recording.__exit__(*args)
+
+    def get_summary(self) -> Dict[str, Any]:
+        return {
+            "lims": {
+                method: {
+                    "calls": sum(entity_calls.values()),
+                    "bytes": self.lims_bytes[method],
+                    "entities": entity_calls,
+                }
+                for method, entity_calls in self.lims_calls.items()
+            },
+            "services": self.service_calls,
+        }
+
+
+class CommandRecorder:
+    """
+    Records wall time, cpu time, peak rss and the http requests of a command. When it exits, a
+    summary line is logged and, if a metrics file is given, appended to it as a line of JSON.
+
+    Peak rss is that of the process, which includes earlier commands in a worker.
+    """
+
+    def __init__(
+        self, ctx: click.Context, service_hosts: Dict[str, Optional[str]], metrics_file: str = None
+    ):
+        self.ctx: click.Context = ctx
+        self.metrics_file: Optional[str] = metrics_file
+        self.requests = RequestStatistics(service_hosts=service_hosts)
+        self._wall_start: float = 0.0
+        self._cpu_start: float = 0.0
+
+    def __enter__(self) -> "CommandRecorder":
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self.requests.__enter__()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.requests.__exit__(*args)
+        summary: Dict[str, Any] = {
+            "command": self.ctx.meta.get(COMMAND_PATH_KEY, self.ctx.command_path),
+            "wall_seconds": round(time.perf_counter() - self._wall_start, 3),
+            "cpu_seconds": round(time.process_time() - self._cpu_start, 3),
+            "peak_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            **self.requests.get_summary(),
+        }
+        LOG.info(get_summary_line(summary))
+        if self.metrics_file:
+            self.write_metrics(summary)
+
+    def write_metrics(self, summary: Dict[str, Any]) -> None:
+        line: str = json.dumps({"time": datetime.now().isoformat(timespec="seconds"), **summary})
+        try:
+            with open(self.metrics_file, "a") as file:
+                file.write(f"{line}\n")
+        except OSError as error:
+            LOG.warning(f"Could not write command metrics to {self.metrics_file}: {error}")
+
+
+def get_summary_line(summary: Dict[str, Any]) -> str:
+    lims_calls: List[str] = []
+    for method, calls in summary["lims"].items():
+        entities: str = ", ".join(
+            f"{entity} {count}" for entity, count in calls["entities"].items()
+        )
+        lims_calls.append(
+            f"{method} {calls['calls']}"
+            + (f" ({entities})" if entities else "")
+            + f" {calls['bytes'] / 1024:.1f} KiB"
+        )
+    services: str = ", ".join(
+        f"{service} {count}" for service, count in summary["services"].items()
+    )
+    return (
+        f"Performance of {summary['command']}: {summary['wall_seconds']} s wall, "
+        f"{summary['cpu_seconds']} s cpu, {summary['peak_rss_mib']} MiB peak rss; "
+        f"lims {', '.join(lims_calls)}; {services}"
+    )
+
+
+class Instrumentation:
+    """Settings to record the performance of commands with, from the config."""
+
+    def __init__(self, service_hosts: Dict[str, Optional[str]], metrics_file: str = None):
+        self.service_hosts: Dict[str, Optional[str]] = service_hosts
+        self.metrics_file: Optional[str] = metrics_file
+
+    def record(self, ctx: click.Context) -> CommandRecorder:
+        return CommandRecorder(
+            ctx=ctx, service_hosts=self.service_hosts, metrics_file=self.metrics_file
+        )
@@ -0,0 +1,100 @@
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import click
+
+COMMAND_PATH_KEY = "cg_lims.command_path"
+
+
+class LazyGroup(click.Group):
+    """
+    Click group with subcommands registered by import path, as "module:attribute".
+
+    A subcommand module is only imported when the subcommand is looked up, so invoking one EPP
+    does not import the modules, and their third party dependencies, of all the others.
+
+        @click.group(cls=LazyGroup, lazy_subcommands={"copy": "cg_lims.EPPs.udf.copy.base:copy"})
+        def udf(ctx):
+            ...
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: Dict[str, str] = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._import_command(cmd_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(
+        self, ctx: click.Context, args: List[str]
+    ) -> Tuple[Optional[str], Optional[click.Command], List[str]]:
+        """Resolve the subcommand, and keep its full command path in the meta data shared by all
+        contexts, so that groups can tell which command they ran."""
+        cmd_name, command, args = super().resolve_command(ctx, args)
+        if command:
+            ctx.meta[COMMAND_PATH_KEY] = f"{ctx.command_path} {command.name}"
+        return cmd_name, command, args
+
+    def import_subcommands(self, ctx: click.Context) -> None:
+        """Import all subcommands, and those of lazy subgroups, eg. before forking processes that
+        run them."""
+        for name in self.list_commands(ctx):
+            command: Optional[click.Command] = self.get_command(ctx, name)
+            if isinstance(command, LazyGroup):
+                command.import_subcommands(ctx)
+
+    def _import_command(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy subcommand {cmd_name} of {self.name} is not a click command: "
+                f"{self.lazy_subcommands[cmd_name]}"
+            )
+        return command
+
+
+class LazyContextObject(dict):
+    """
+    Context object of the cli, where expensive objects can be registered as factories.
+
+    A factory is called on the first lookup of its key and the object it returns is kept, so
+    clients that only some commands use are not created, nor their modules imported, by the others.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._factories: Dict[str, Callable[[], Any]] = {}
+
+    def set_factory(self, key: str, factory: Callable[[], Any]) -> None:
+        self.pop(key, None)
+        self._factories[key] = factory
+
+    def __missing__(self, key: str) -> Any:
+        if key not in self._factories:
+            raise KeyError(key)
+        self[key] = self._factories.pop(key)()
+        return self[key]
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or key in self._factories
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def get_created(self, key: str) -> Any:
+        """The object of the key if it is set or was created, without calling its factory."""
+        return super().get(key)
+
+    def child(self) -> "LazyContextObject":
+        """A copy to run one command with. It shares the objects of this one, and objects it
+        creates from the factories of this one are kept here as well, for the next copy."""
+        child = LazyContextObject(self)
+        for key in self._factories:
+            child.set_factory(key, lambda key=key: self[key])
+        return child
@@ -0,0 +1,62 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from cg_lims.exceptions import LimsError
+from cg_lims.get.analyte_index import AnalyteIndex
+from cg_lims.models.arnold.base_step import BaseStep
+from genologics.lims import Lims
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 8
+
+DocumentBuilder = Callable[..., List[BaseStep]]
+
+
+def build_documents_concurrently(
+    build_function: DocumentBuilder,
+    sample_ids: List[str],
+    process_id: str,
+    lims: Lims,
+    workers: int = DEFAULT_WORKERS,
+) -> List[BaseStep]:
+    """Build the step documents of all samples over a pool of <workers> threads.
+
+    The documents are returned sorted by sample id, in the order the build function returns them.
+    Analytes are looked up in an AnalyteIndex shared by all samples. A sample that fails does not
+    stop the others from being built. All failures are logged and reported together in one
+    LimsError once every sample has been tried."""
+
+    sorted_sample_ids: List[str] = sorted(set(sample_ids))
+    documents: Dict[str, List[BaseStep]] = {}
+    failures: Dict[str, str] = {}
+
+    with AnalyteIndex(lims=lims, sample_ids=sorted_sample_ids), ThreadPoolExecutor(
+        max_workers=max(workers, 1)
+    ) as executor:
+        futures = {
+            sample_id: executor.submit(
+                build_function,
+                sample_id=sample_id,
+                process_id=process_id,
+                lims=lims,
+            )
+            for sample_id in sorted_sample_ids
+        }
+        for sample_id, future in futures.items():
+            error: Optional[BaseException] = future.exception()
+            if error:
+                message: str = getattr(error, "message", None) or str(error)
+                LOG.error(f"Failed to build step documents for sample {sample_id}: {message}")
+                failures[sample_id] = message
+                continue
+            documents[sample_id] = future.result()
+
+    if failures:
+        raise LimsError(
+            message=f"Failed to build step documents for samples: {', '.join(failures)}. "
+            "See the log for details."
+        )
+
+    return [document for sample_id in sorted_sample_ids for document in documents[sample_id]]
@@ -13,6 +13,7 @@ from cg_lims.exceptions import (
     MissingUDFsError,
     ZeroReadsError,
 )
+from cg_lims.get.analyte_index import AnalyteIndex, get_active_analyte_index
 from cg_lims.get.artifacts import get_latest_analyte, get_sample_artifact
 
 LOG = logging.getLogger(__name__)
@@ -43,6 +44,7 @@ class BaseAnalyte:
     sample_id: The submitted sample from which the analyte is derived.
     process_types: The process in which the analyte was generated (the artifact.parent_process).
                   If process_types is None, then the analyte is the original submitted sample.
+    analyte_index: Index to look the analyte up in. Defaults to the index activated for lims.
     """
 
     def __init__(
@@ -51,11 +53,13 @@ class BaseAnalyte:
         sample_id: str,
         process_type: str = None,
         optional_step: bool = False,
+        analyte_index: Optional[AnalyteIndex] = None,
     ):
         self.lims: Lims = lims
         self.sample_id: str = sample_id
         self.process_type: str = process_type
         self.optional_step: bool = optional_step
+        self.analyte_index: Optional[AnalyteIndex] = analyte_index or get_active_analyte_index(lims)
         self.artifact: Optional[Artifact] = self.get_artifact()
         self.process = self.get_process()
 
@@ -118,6 +122,12 @@ class BaseAnalyte:
         if not self.process_type:
             sample = Sample(self.lims, id=self.sample_id)
             return get_sample_artifact(sample=sample, lims=self.lims)
+        if self.analyte_index and self.analyte_index.covers(self.sample_id):
+            artifact: Optional[Artifact] = self.analyte_index.get_latest_analyte(
+                sample_id=self.sample_id, process_types=[self.process_type]
+            )
+            if artifact:
+                return artifact
         try:
             return get_latest_analyte(
                 lims=self.lims, sample_id=self.sample_id, process_types=[self.process_type]
@@ -851,3 +851,67 @@ def times_sequenced_udf(
     help: str = "UDF name for the value documenting the amount of times the sample has been sequenced.",
 ) -> click.option:
     return click.option("-t", "--times-sequenced-udf", required=True, multiple=False, help=help)
+
+
+def batch_write(
+    help: str = "Collect artifact and sample updates and write them back with batch calls.",
+) -> click.option:
+    return click.option(
+        "--batch-write",
+        default=False,
+        is_flag=True,
+        help=help,
+    )
+
+
+def workers(default: int, help: str = "Number of worker threads.") -> click.option:
+    return click.option("--workers", default=default, show_default=True, type=int, help=help)
+
+
+def batch_size(default: int, help: str = "Number of entities per batch call.") -> click.option:
+    return click.option(
+        "--batch-size", default=default, show_default=True, type=click.IntRange(min=1), help=help
+    )
+
+
+def force_upload(
+    help: str = "Upload all documents, also those unchanged since the last upload.",
+) -> click.option:
+    return click.option(
+        "--force-upload",
+        default=False,
+        is_flag=True,
+        help=help,
+    )
+
+
+def state_file(
+    help: str = "File to checkpoint processes in. Defaults to <command name>_<parameter hash>"
+    "_state.jsonl.",
+) -> click.option:
+    return click.option("--state-file", required=False, help=help)
+
+
+def resume(
+    help: str = "Resume the backfill from its state file, skipping the processes already loaded. "
+    "Without it, the backfill starts over.",
+) -> click.option:
+    return click.option("--resume", default=False, is_flag=True, help=help)
+
+
+def since(
+    help: str = "Only processes modified since this date, as YEAR-MONTH-DAY.",
+) -> click.option:
+    return click.option(
+        "--since", required=False, type=click.DateTime(formats=["%Y-%m-%d"]), help=help
+    )
+
+
+def retries(default: int, help: str = "Number of times to retry failed processes.") -> click.option:
+    return click.option("--retries", default=default, show_default=True, type=int, help=help)
+
+
+def max_requests(
+    help: str = "Number of commands a worker process runs before it is replaced.",
+) -> click.option:
+    return click.option("--max-requests", default=1000, show_default=True, type=int, help=help)
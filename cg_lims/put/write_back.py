@@ -0,0 +1,131 @@
+import logging
+import sys
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+import click
+from cg_lims.exceptions import WriteBackError
+from cg_lims.get.batch import BATCH_CHUNK_SIZE, chunk_entities
+from genologics.entities import Artifact, Entity, Sample
+from genologics.lims import Lims
+from requests.exceptions import HTTPError
+
+LOG = logging.getLogger(__name__)
+
+BATCH_UPDATE_TYPES = (Artifact, Sample)
+WRITE_BACK_SESSION = "write_back_session"
+
+
+class WriteBackSession:
+    """
+    Collects artifacts and samples that are put to the lims and writes them back with the
+    artifacts/batch/update and samples/batch/update endpoints when the session is committed or
+    exits.
+
+    While the session is open, every artifact.put() and sample.put() on the session's lims
+    instance is deferred. Several puts of the same entity are written once. Other entities
+    are put immediately as usual.
+
+        with WriteBackSession(lims=lims):
+            for artifact in artifacts:
+                artifact.udf["Concentration"] = 1.0
+                artifact.put()
+    """
+
+    def __init__(self, lims: Lims, chunk_size: int = BATCH_CHUNK_SIZE):
+        self.lims: Lims = lims
+        self.chunk_size: int = chunk_size
+        self.failed: List[Tuple[Entity, str]] = []
+        self._dirty: Dict[type, Dict[str, Entity]] = {}
+        self._lims_put: Optional[Callable] = None
+        self._had_instance_put: bool = False
+
+    def __enter__(self) -> "WriteBackSession":
+        self._had_instance_put = "put" in vars(self.lims)
+        self._lims_put = self.lims.put
+        self.lims.put = self._put
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._restore_lims_put()
+        if exc_type is None:
+            self.commit()
+            return
+        self.flush()
+        if self.failed:
+            LOG.error(f"Failed to update the following entities: {self._get_failed_ids()}")
+
+    def _restore_lims_put(self) -> None:
+        if self._had_instance_put:
+            self.lims.put = self._lims_put
+        else:
+            del self.lims.put
+
+    def _put(self, uri: str, data, params=dict()):
+        entity: Optional[Entity] = self.lims.cache.get(uri)
+        if not isinstance(entity, BATCH_UPDATE_TYPES):
+            return self._lims_put(uri, data, params=params)
+        self.add(entity)
+
+    def add(self, entity: Entity) -> None:
+        """Mark an artifact or sample to be written back when the session is flushed."""
+        self._dirty.setdefault(type(entity), {})[entity.id] = entity
+
+    def flush(self) -> None:
+        """Write back all collected entities, chunk by chunk. Entities in a failing chunk are
+        put one by one to find out which of them failed."""
+        put: Callable = self._lims_put or self.lims.put
+        for entity_type, entities in self._dirty.items():
+            LOG.info(f"Writing back {len(entities)} {entity_type.__name__.lower()}(s) to lims.")
+            for chunk in chunk_entities(
+                entities=list(entities.values()), chunk_size=self.chunk_size
+            ):
+                try:
+                    self.lims.put_batch(chunk)
+                except HTTPError as error:
+                    LOG.warning(f"Batch update failed, updating one by one instead: {error}")
+                    self._put_one_by_one(entities=chunk, put=put)
+        self._dirty = {}
+
+    def commit(self) -> None:
+        """Flush the session and raise a WriteBackError naming the entities that failed."""
+        self.flush()
+        if self.failed:
+            failed_ids: str = self._get_failed_ids()
+            self.failed = []
+            raise WriteBackError(message=f"Failed to update the following entities: {failed_ids}")
+
+    def _get_failed_ids(self) -> str:
+        return ", ".join(entity.id for entity, _ in self.failed)
+
+    def _put_one_by_one(self, entities: List[Entity], put: Callable) -> None:
+        for entity in entities:
+            try:
+                put(entity.uri, self.lims.tostring(ElementTree.ElementTree(entity.root)))
+            except HTTPError as error:
+                LOG.error(f"Failed to update {entity}: {error}")
+                self.failed.append((entity, str(error)))
+
+
+@contextmanager
+def write_back_session(context_object: Dict) -> Iterator[WriteBackSession]:
+    """Open a write-back session for the commands of a group, kept in the context object so that
+    the commands can flush it with flush_write_back before reporting success. Updates that are
+    left when the group exits are written back there, and failures end the command with exit
+    code 1."""
+    try:
+        with WriteBackSession(lims=context_object["lims"]) as session:
+            context_object[WRITE_BACK_SESSION] = session
+            yield session
+    except WriteBackError as error:
+        click.echo(error.message, err=True)
+        sys.exit(1)
+
+
+def flush_write_back(context_object: Dict) -> None:
+    """Write back the updates of the command's write-back session, if --batch-write was given.
+    Raises a WriteBackError naming the entities that could not be updated."""
+    session: Optional[WriteBackSession] = context_object.get(WRITE_BACK_SESSION)
+    if session:
+        session.commit()
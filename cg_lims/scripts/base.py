@@ -1,18 +1,21 @@
 #!/usr/bin/env python
 import logging
 import pathlib
+from typing import Dict
 
 import click
 from cg_lims import options
+from cg_lims.lazy import LazyGroup
 
-# commands
-from .check_config import check_config
-from .fetch_sample_info import fetch_sample_info
-from .one_time_scripts.base import one_time
-from .prepare_fixture import make_fixture
+COMMANDS: Dict[str, str] = {
+    "check-config": "cg_lims.scripts.check_config:check_config",
+    "make-fixture": "cg_lims.scripts.prepare_fixture:make_fixture",
+    "one-time": "cg_lims.scripts.one_time_scripts.base:one_time",
+    "fetch-sample-info": "cg_lims.scripts.fetch_sample_info:fetch_sample_info",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @options.log()
 @click.pass_context
 def scripts(ctx, log: str):
@@ -20,9 +23,4 @@ def scripts(ctx, log: str):
 
     log_path = pathlib.Path(log)
     logging.basicConfig(filename=str(log_path.absolute()), filemode="a", level=logging.INFO)
-
-
-scripts.add_command(check_config)
-scripts.add_command(make_fixture)
-scripts.add_command(one_time)
-scripts.add_command(fetch_sample_info)
+    ctx.with_resource(ctx.obj["instrumentation"].record(ctx))
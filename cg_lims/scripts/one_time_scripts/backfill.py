@@ -0,0 +1,231 @@
+import hashlib
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+
+import click
+from genologics.entities import Process
+from genologics.lims import Lims
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_RETRIES = 2
+PROGRESS_INTERVAL_SECONDS = 30.0
+
+ProcessLoader = Callable[[Process], int]
+
+
+class BackfillState:
+    """
+    Checkpoint of a backfill: the ids of the processes that are loaded, and the last error of those
+    that failed. Every completed or failed process is appended to the state file as a line of
+    JSON, and the lines are folded together when the state is loaded, so a backfill that is
+    stopped can be resumed from it without loading any completed process again. Unless
+    <resume> is set, an existing state file is started over.
+    """
+
+    def __init__(self, path: str, resume: bool = True):
+        self.path: Path = Path(path)
+        self.completed: Set[str] = set()
+        self.failed: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if resume:
+            self._load()
+        elif self.path.is_file():
+            LOG.info(f"Starting over, replacing the state in {self.path}")
+            self.path.unlink()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _load(self) -> None:
+        if not self.path.is_file():
+            return
+        with open(self.path) as file:
+            for line in file:
+                try:
+                    entry: Dict = json.loads(line)
+                except json.JSONDecodeError:
+                    LOG.warning(f"Skipping incomplete line in {self.path}: {line!r}")
+                    continue
+                self._apply(process_id=entry["id"], error=entry.get("error"))
+        LOG.info(f"Resuming from {self.path}: {len(self.completed)} processes already loaded")
+
+    def _apply(self, process_id: str, error: Optional[str]) -> None:
+        if error is None:
+            self.completed.add(process_id)
+            self.failed.pop(process_id, None)
+        else:
+            self.failed[process_id] = error
+
+    def _append(self, process_id: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._apply(process_id=process_id, error=error)
+            with open(self.path, "a") as file:
+                file.write(json.dumps({"id": process_id, "error": error}) + "\n")
+
+    def mark_completed(self, process_id: str) -> None:
+        self._append(process_id=process_id)
+
+    def mark_failed(self, process_id: str, error: str) -> None:
+        self._append(process_id=process_id, error=error)
+
+
+class BackfillSummary(NamedTuple):
+    loaded: int
+    skipped: int
+    failed: List[str]
+    documents: int
+    seconds: float
+
+
+class BackfillRunner:
+    """
+    Loads lims processes over a pool of <workers> threads, with a loader that returns the number of
+    documents it loaded for a process or raises if it failed.
+
+    Processes already completed in the state are skipped. Failed processes are retried up to
+    <retries> times, after all other processes have been tried. Throughput is echoed every
+    <progress_interval> seconds while the backfill runs.
+    """
+
+    def __init__(
+        self,
+        loader: ProcessLoader,
+        state: BackfillState,
+        workers: int = DEFAULT_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+        progress_interval: float = PROGRESS_INTERVAL_SECONDS,
+    ):
+        self.loader: ProcessLoader = loader
+        self.state: BackfillState = state
+        self.workers: int = max(workers, 1)
+        self.retries: int = retries
+        self.progress_interval: float = progress_interval
+        self.loaded_count: int = 0
+        self.document_count: int = 0
+        self._started_at: float = 0.0
+        self._last_progress_at: float = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self, process: Process) -> None:
+        try:
+            documents: int = self.loader(process)
+        except Exception as error:
+            message: str = getattr(error, "message", None) or str(error) or type(error).__name__
+            LOG.error(f"Failed to load process {process.id}: {message}")
+            self.state.mark_failed(process_id=process.id, error=message)
+            return
+        LOG.info(f"process loaded: {process.id}")
+        self.state.mark_completed(process_id=process.id)
+        with self._lock:
+            self.loaded_count += 1
+            self.document_count += documents
+
+    def get_progress(self, total: int) -> str:
+        minutes: float = max(time.perf_counter() - self._started_at, 1e-9) / 60
+        return (
+            f"{self.loaded_count}/{total} processes loaded, {len(self.state.failed)} failed, "
+            f"{self.loaded_count / minutes:.1f} processes/min, "
+            f"{self.document_count / minutes:.1f} docs/min"
+        )
+
+    def _echo_progress(self, total: int, force: bool = False) -> None:
+        now: float = time.perf_counter()
+        if force or now - self._last_progress_at >= self.progress_interval:
+            self._last_progress_at = now
+            click.echo(self.get_progress(total=total))
+
+    def _run_round(self, processes: List[Process], total: int) -> None:
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self._load, process) for process in processes]
+            for future in as_completed(futures):
+                future.result()
+                self._echo_progress(total=total)
+
+    def run(self, processes: List[Process]) -> BackfillSummary:
+        self._started_at = self._last_progress_at = time.perf_counter()
+        pending: List[Process] = [
+            process for process in processes if process.id not in self.state.completed
+        ]
+        skipped: int = len(processes) - len(pending)
+        total: int = len(pending)
+        click.echo(f"Loading {total} processes, {skipped} already loaded")
+
+        self._run_round(processes=pending, total=total)
+        for attempt in range(1, self.retries + 1):
+            pending = [process for process in pending if process.id in self.state.failed]
+            if not pending:
+                break
+            click.echo(f"Retrying {len(pending)} failed processes, attempt {attempt}")
+            self._run_round(processes=pending, total=total)
+
+        self._echo_progress(total=total, force=True)
+        return BackfillSummary(
+            loaded=self.loaded_count,
+            skipped=skipped,
+            failed=[process.id for process in pending if process.id in self.state.failed],
+            documents=self.document_count,
+            seconds=time.perf_counter() - self._started_at,
+        )
+
+
+def get_backfill_processes(
+    lims: Lims, process_types: List[str], since: Optional[datetime] = None
+) -> List[Process]:
+    """Return the processes of the process types, modified since the date if given."""
+    last_modified: Optional[str] = since.strftime("%Y-%m-%dT%H:%M:%SZ") if since else None
+    return lims.get_processes(type=process_types, last_modified=last_modified)
+
+
+def get_default_state_file(ctx: click.Context) -> str:
+    """Return the default state file of a backfill command, named after the command and a hash of
+    the parameters that select and load its processes, so that backfills with other parameters
+    are not resumed from it."""
+    parameters: Dict = {
+        name: value
+        for name, value in ctx.params.items()
+        if name not in {"state_file", "resume", "workers", "retries"}
+    }
+    digest: str = hashlib.sha1(
+        json.dumps(parameters, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"{ctx.command.name}_{digest[:8]}_state.jsonl"
+
+
+def run_backfill(
+    lims: Lims,
+    process_types: List[str],
+    loader: ProcessLoader,
+    state_file: str,
+    resume: bool,
+    since: Optional[datetime],
+    workers: int,
+    retries: int,
+) -> None:
+    """Backfill all matching processes and echo a summary. Failed process ids are kept in the
+    state file, to be retried when the backfill is resumed. Exits with an error if any process
+    failed."""
+    processes: List[Process] = get_backfill_processes(
+        lims=lims, process_types=process_types, since=since
+    )
+    LOG.info(f"loading {len(processes)} processes")
+    click.echo(f"{'Resuming' if resume else 'Checkpointing'} the backfill in {state_file}")
+    runner = BackfillRunner(
+        loader=loader,
+        state=BackfillState(path=state_file, resume=resume),
+        workers=workers,
+        retries=retries,
+    )
+    summary: BackfillSummary = runner.run(processes=processes)
+    click.echo(
+        f"Done in {summary.seconds:.0f}s: {summary.loaded} processes and {summary.documents} "
+        f"documents loaded, {summary.skipped} already loaded, {len(summary.failed)} failed."
+    )
+    if summary.failed:
+        sys.exit(f"Failed processes: {', '.join(summary.failed)}. See log file for details.")
@@ -1,22 +1,21 @@
 #!/usr/bin/env python
 
+from typing import Dict
+
 import click
+from cg_lims.lazy import LazyGroup
 
-from .fetch_tga_samples import fetch_tga_samples
-from .load_arnold_flowcells import update_arnold_flow_cells
-from .load_arnold_steps import update_arnold_preps, update_arnold_runs
-from .topup_summary import create_topup_summary
+COMMANDS: Dict[str, str] = {
+    "update-arnold-preps": "cg_lims.scripts.one_time_scripts.load_arnold_steps:update_arnold_preps",
+    "update-arnold-runs": "cg_lims.scripts.one_time_scripts.load_arnold_steps:update_arnold_runs",
+    "update-arnold-flow-cells": "cg_lims.scripts.one_time_scripts.load_arnold_flowcells:update_arnold_flow_cells",
+    "fetch-tga-samples": "cg_lims.scripts.one_time_scripts.fetch_tga_samples:fetch_tga_samples",
+    "create-topup-summary": "cg_lims.scripts.one_time_scripts.topup_summary:create_topup_summary",
+}
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, invoke_without_command=True)
 @click.pass_context
 def one_time(ctx):
     """Main load commands."""
     pass
-
-
-one_time.add_command(update_arnold_preps)
-one_time.add_command(update_arnold_runs)
-one_time.add_command(update_arnold_flow_cells)
-one_time.add_command(fetch_tga_samples)
-one_time.add_command(create_topup_summary)
@@ -1,24 +1,54 @@
-import json
 import logging
-from typing import List, Literal
+from datetime import datetime
+from typing import List, Literal, Optional
 
 import click
-import requests
 from cg_lims import options
+from cg_lims.clients.arnold.arnold_client import ArnoldClient, UploadResult
 from cg_lims.EPPs.arnold import prep, sequencing
+from cg_lims.exceptions import LimsError
 from cg_lims.models.arnold.base_step import BaseStep
-from genologics.lims import Lims
-from requests import Response
+from cg_lims.scripts.one_time_scripts.backfill import (
+    DEFAULT_RETRIES,
+    DEFAULT_WORKERS,
+    get_default_state_file,
+    run_backfill,
+)
+from genologics.lims import Lims, Process
 
 LOG = logging.getLogger(__name__)
 
 
+def put_step_documents(arnold_client: ArnoldClient, step_documents: List[BaseStep]) -> int:
+    """Put the step documents in arnold and return their number. Raises LimsError on failure."""
+    result: UploadResult = arnold_client.send_documents(
+        method="put",
+        endpoint="steps",
+        documents=(doc.dict(exclude_none=True) for doc in step_documents),
+    )
+    if not result.ok:
+        raise LimsError(result.get_error_summary())
+    return result.uploaded_count
+
+
 @click.command()
 @options.prep(help="Prep type.")
 @options.process_types()
+@options.since()
+@options.state_file()
+@options.resume()
+@options.workers(default=DEFAULT_WORKERS)
+@options.retries(default=DEFAULT_RETRIES)
 @click.pass_context
 def update_arnold_preps(
-    ctx, prep_type: Literal["wgs", "twist", "micro", "cov", "rna"], process_types: List[str]
+    ctx,
+    prep_type: Literal["wgs", "twist", "micro", "cov", "rna"],
+    process_types: List[str],
+    since: Optional[datetime],
+    state_file: Optional[str],
+    resume: bool,
+    workers: int,
+    retries: int,
 ):
     """For ALL preps defined by prep_type and process_types, updating ALL Step documents.
     This script should in other words be run with care."""
@@ -26,58 +56,66 @@ def update_arnold_preps(
     LOG.info(f"Running {ctx.command_path} with params: {ctx.params}")
 
     lims: Lims = ctx.obj["lims"]
-    arnold_host: str = ctx.obj["arnold_host"]
-    processes = lims.get_processes(type=process_types)
-    LOG.info(f"loading {len(processes)} processes")
-    for process in processes:
-        try:
-            all_step_documents: List[BaseStep] = prep.build_step_documents(
-                prep_type=prep_type, process=process, lims=lims
-            )
-            response: Response = requests.put(
-                url=f"{arnold_host}/steps",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps([doc.dict(exclude_none=True) for doc in all_step_documents]),
-            )
-            if not response.ok:
-                LOG.error(response.text)
-            else:
-                LOG.info(f"process loaded: {process.id}")
-        except:
-            LOG.error(f"faild with process {process.id}")
-
-    click.echo("Done. See log file for details.")
+    arnold_client: ArnoldClient = ctx.obj["arnold_client"]
+
+    def load_process(process: Process) -> int:
+        all_step_documents: List[BaseStep] = prep.build_step_documents(
+            prep_type=prep_type, process=process, lims=lims, workers=1
+        )
+        return put_step_documents(arnold_client=arnold_client, step_documents=all_step_documents)
+
+    run_backfill(
+        lims=lims,
+        process_types=process_types,
+        loader=load_process,
+        state_file=state_file or get_default_state_file(ctx),
+        resume=resume,
+        since=since,
+        workers=workers,
+        retries=retries,
+    )
 
 
 @click.command()
 @options.sequencing_method(help="Sequencing Method.")
 @options.process_types()
+@options.since()
+@options.state_file()
+@options.resume()
+@options.workers(default=DEFAULT_WORKERS)
+@options.retries(default=DEFAULT_RETRIES)
 @click.pass_context
-def update_arnold_runs(ctx, sequencing_method: Literal["novaseq"], process_types: List[str]):
+def update_arnold_runs(
+    ctx,
+    sequencing_method: Literal["novaseq-6000", "novaseq-x"],
+    process_types: List[str],
+    since: Optional[datetime],
+    state_file: Optional[str],
+    resume: bool,
+    workers: int,
+    retries: int,
+):
     """For ALL sequencing runs defined by sequencing_method and process_types, updating ALL Step documents.
     This script should in other words be run with care."""
 
     LOG.info(f"Running {ctx.command_path} with params: {ctx.params}")
 
     lims: Lims = ctx.obj["lims"]
-    arnold_host: str = ctx.obj["arnold_host"]
-    processes = lims.get_processes(type=process_types)
-    LOG.info(f"loading {len(processes)} processes")
-    for process in processes:
-        try:
-            all_step_documents: List[BaseStep] = sequencing.build_step_documents(
-                sequencing_method=sequencing_method, process=process, lims=lims
-            )
-            response: Response = requests.put(
-                url=f"{arnold_host}/steps",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps([doc.dict(exclude_none=True) for doc in all_step_documents]),
-            )
-            if not response.ok:
-                LOG.error(response.text)
-            else:
-                LOG.info(f"process loaded: {process.id}")
-        except:
-            LOG.error(f"faild with process {process.id}")
-
-    click.echo("Done. See log file for details.")
+    arnold_client: ArnoldClient = ctx.obj["arnold_client"]
+
+    def load_process(process: Process) -> int:
+        all_step_documents: List[BaseStep] = sequencing.build_step_documents(
+            sequencing_method=sequencing_method, process=process, lims=lims, workers=1
+        )
+        return put_step_documents(arnold_client=arnold_client, step_documents=all_step_documents)
+
+    run_backfill(
+        lims=lims,
+        process_types=process_types,
+        loader=load_process,
+        state_file=state_file or get_default_state_file(ctx),
+        resume=resume,
+        since=since,
+        workers=workers,
+        retries=retries,
+    )
@@ -4,8 +4,9 @@ from typing import Any, Dict, List, Tuple
 
 import click
 from cg_lims import options
+from cg_lims.clients.cg.async_status_db_api import gather_application_tags
 from cg_lims.clients.cg.status_db_api import StatusDBAPI
-from cg_lims.exceptions import LimsError
+from cg_lims.exceptions import CgAPIClientConnectionError, LimsError
 from genologics.entities import Artifact, Container, Process, Sample
 from genologics.lims import Lims
 
@@ -110,7 +111,10 @@ def get_bcl_conv_artifacts(lims: Lims, sample: Sample) -> Dict[str, Any]:
 
 def get_target_amount(app_tag: str, status_db: StatusDBAPI) -> int:
     """Return the target amount of reads from clinical-api"""
-    return status_db.get_application_tag(tag_name=app_tag, key="target_reads")
+    try:
+        return status_db.get_application_tag(tag_name=app_tag, key="target_reads")
+    except CgAPIClientConnectionError as error:
+        raise LimsError(message=str(error))
 
 
 def get_times_sequenced(artifact_dict: Dict) -> int:
@@ -203,6 +207,10 @@ def create_topup_summary(
         )
         print(f"Found {len(samples)} matching samples!")
         LOG.info(f"Found {len(samples)} matching samples!")
+        gather_application_tags(
+            status_db=status_db,
+            tag_names=[sample.udf.get("Sequencing Analysis") for sample in samples],
+        )
         with open(file, "w") as file:
             file.write(header + "\n")
             for sample in samples:
@@ -0,0 +1,65 @@
+"""
+Thin client of the lims worker, installed as lims-client.
+
+It takes the same arguments as lims, and sends them with the working directory to a warm worker
+on the unix socket in $LIMS_WORKER_SOCKET. The output and exit code of the command are passed on
+as if it ran here. When no worker listens on the socket, the command is run in this process.
+
+    lims-client -c config.yaml epps -l <log> -p <process> udf copy process-to-sample ...
+"""
+
+import os
+import socket
+import sys
+from typing import Dict, List, Optional
+
+from cg_lims.worker.protocol import (
+    DEFAULT_SOCKET_PATH,
+    SOCKET_ENVIRONMENT_VARIABLE,
+    receive_message,
+    send_message,
+)
+
+
+def connect(socket_path: str) -> Optional[socket.socket]:
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        connection.close()
+        return None
+    return connection
+
+
+def run_in_worker(connection: socket.socket, args: List[str]) -> Dict:
+    """Send the command to the worker and wait for its result."""
+    with connection:
+        try:
+            send_message(connection, {"args": args, "cwd": os.getcwd()})
+            response: Optional[Dict] = receive_message(connection)
+        except ConnectionError:
+            response = None
+    if response is None:
+        return {"stdout": "", "stderr": "The lims worker closed the connection\n", "exit_code": 1}
+    return response
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    args: List[str] = sys.argv[1:] if args is None else args
+    connection: Optional[socket.socket] = connect(
+        os.environ.get(SOCKET_ENVIRONMENT_VARIABLE, DEFAULT_SOCKET_PATH)
+    )
+    if not connection:
+        from cg_lims.commands.base import cli
+
+        cli.main(args=args, prog_name="lims")
+        return
+
+    response: Dict = run_in_worker(connection=connection, args=args)
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["exit_code"])
+
+
+if __name__ == "__main__":
+    main()
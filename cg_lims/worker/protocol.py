@@ -0,0 +1,18 @@
+import json
+import socket
+from typing import Dict, Optional
+
+SOCKET_ENVIRONMENT_VARIABLE = "LIMS_WORKER_SOCKET"
+DEFAULT_SOCKET_PATH = "/tmp/lims-worker.sock"
+
+
+def send_message(connection: socket.socket, message: Dict) -> None:
+    """Send a message as one line of JSON."""
+    connection.sendall(json.dumps(message).encode() + b"\n")
+
+
+def receive_message(connection: socket.socket) -> Optional[Dict]:
+    """Receive one line of JSON, or None if the connection was closed before a message."""
+    with connection.makefile("rb") as file:
+        line: bytes = file.readline()
+    return json.loads(line) if line else None
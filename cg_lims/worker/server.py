@@ -0,0 +1,279 @@
+import io
+import logging
+import os
+import signal
+import socket
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Union
+
+import click
+from cg_lims import options
+from cg_lims.commands.base import COMMANDS, add_clients, read_config
+from cg_lims.get.reagent_catalog import reset_reagent_catalog
+from cg_lims.lazy import LazyContextObject, LazyGroup
+from cg_lims.worker.client import connect
+from cg_lims.worker.protocol import (
+    DEFAULT_SOCKET_PATH,
+    SOCKET_ENVIRONMENT_VARIABLE,
+    receive_message,
+    send_message,
+)
+
+LOG = logging.getLogger(__name__)
+
+BACKLOG = 64
+DEFAULT_WORKERS = 8
+RESPAWN_DELAY_SECONDS = 1.0
+MAX_FAILED_STARTS = 5
+SOCKET_MODE = 0o600
+STARTUP_FAILURE_EXIT_CODE = 3
+
+
+class CommandResult(NamedTuple):
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+class WarmContext:
+    """
+    The clients of one worker process, created once from the config and shared by all commands
+    it runs: the lims and its xml cache, the StatusDB API with its token and application tag
+    cache, the SMRT Link client and the arnold client.
+    """
+
+    def __init__(self, config: str):
+        self.config: Path = Path(config).resolve()
+        self.context_object = LazyContextObject()
+        add_clients(context_object=self.context_object, config_data=read_config(config))
+
+    def new_context_object(self) -> LazyContextObject:
+        """Context object for one command. The entity objects of the lims are dropped, as they
+        hold udfs that earlier commands may have changed, the reagent catalog is synced again
+        and the request statistics of the StatusDB client start from zero."""
+        lims = self.context_object["lims"]
+        lims.cache.clear()
+        reset_reagent_catalog(lims=lims)
+        status_db = self.context_object.get_created("status_db")
+        if status_db:
+            status_db.reset_statistics()
+        return self.context_object.child()
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={name: path for name, path in COMMANDS.items() if name != "worker"},
+)
+@options.config()
+@click.pass_context
+def warm_cli(ctx, config):
+    """Root of the commands run by a worker, with the clients of the worker."""
+    warm_context: WarmContext = ctx.obj
+    if Path(config).resolve() != warm_context.config:
+        raise click.BadParameter(f"the worker runs with {warm_context.config}", param_hint="config")
+    ctx.obj = warm_context.new_context_object()
+
+
+def get_exit_code(code: Union[int, str, None]) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    click.echo(code, err=True)
+    return 1
+
+
+def reset_logging() -> None:
+    """Remove the log file handlers a command added, so that the next command logs to its own."""
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
+
+
+def run_command(warm_context: WarmContext, args: List[str], cwd: str) -> CommandResult:
+    """Run a lims command in this process, in the working directory of the client, and capture
+    its output and exit code."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code: int = 0
+    working_directory: str = os.getcwd()
+    try:
+        os.chdir(cwd)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                warm_cli.main(args=args, prog_name="lims", obj=warm_context)
+            except SystemExit as error:
+                exit_code = get_exit_code(error.code)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        os.chdir(working_directory)
+        reset_logging()
+    return CommandResult(exit_code=exit_code, stdout=stdout.getvalue(), stderr=stderr.getvalue())
+
+
+def handle_connection(connection: socket.socket, warm_context: WarmContext) -> None:
+    request: Optional[Dict] = receive_message(connection)
+    if not request:
+        return
+    result: CommandResult = run_command(
+        warm_context=warm_context, args=request["args"], cwd=request["cwd"]
+    )
+    send_message(connection, result._asdict())
+
+
+def serve_connections(
+    listener: socket.socket, warm_context: WarmContext, max_requests: int
+) -> None:
+    """Run the commands sent to the socket one at a time, until max_requests have been run."""
+    for _ in range(max_requests):
+        connection, _ = listener.accept()
+        with connection:
+            handle_connection(connection=connection, warm_context=warm_context)
+
+
+def stop(signal_number: int, frame) -> None:
+    raise SystemExit(0)
+
+
+class WorkerPool:
+    """
+    Pre-forked worker processes that run lims commands sent to a unix socket by lims-client.
+
+    All command modules are imported before forking, so that the workers start warm. Each worker
+    creates its own clients and runs one command at a time, so concurrent automations are spread
+    over the workers. A worker is replaced when it has run <max_requests> commands or died.
+    Replacing workers that fail to start is delayed exponentially, and the pool stops after
+    MAX_FAILED_STARTS of them in a row, as with a lims that can not be reached.
+    """
+
+    def __init__(self, config: str, socket_path: str, workers: int, max_requests: int):
+        self.config: str = config
+        self.socket_path: str = socket_path
+        self.workers: int = max(workers, 1)
+        self.max_requests: int = max_requests
+        self.pids: Set[int] = set()
+        self.listener: Optional[socket.socket] = None
+        self.failed_starts: int = 0
+
+    def _fork_worker(self) -> None:
+        pid: int = os.fork()
+        if pid:
+            self.pids.add(pid)
+            return
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        exit_code: int = 1
+        try:
+            exit_code = self._run_worker()
+        finally:
+            os._exit(exit_code)
+
+    def _run_worker(self) -> int:
+        """Serve commands in a forked worker and return its exit code."""
+        try:
+            warm_context = WarmContext(config=self.config)
+        except Exception:
+            LOG.exception("Worker failed to start")
+            return STARTUP_FAILURE_EXIT_CODE
+        try:
+            serve_connections(
+                listener=self.listener, warm_context=warm_context, max_requests=self.max_requests
+            )
+        except Exception:
+            LOG.exception("Worker failed")
+            return 1
+        return 0
+
+    def _listen(self) -> None:
+        """Listen on the socket, readable and writable by the user of the pool only, as the
+        commands sent to it run as that user. A socket left by a stopped pool is replaced, but
+        not one that a running pool listens on."""
+        if os.path.exists(self.socket_path):
+            connection: Optional[socket.socket] = connect(self.socket_path)
+            if connection:
+                connection.close()
+                raise click.ClickException(f"A lims worker already listens on {self.socket_path}")
+            os.unlink(self.socket_path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask: int = os.umask(0o777 & ~SOCKET_MODE)
+        try:
+            self.listener.bind(self.socket_path)
+        finally:
+            os.umask(umask)
+        os.chmod(self.socket_path, SOCKET_MODE)
+        self.listener.listen(BACKLOG)
+
+    def _on_worker_exit(self, pid: int, status: int) -> None:
+        """Wait before a worker is replaced after a failure, longer for every worker in a row
+        that failed to start. Raises a ClickException after MAX_FAILED_STARTS of them."""
+        if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
+            self.failed_starts = 0
+            return
+        LOG.error(f"Worker {pid} exited with status {status}")
+        if not (os.WIFEXITED(status) and os.WEXITSTATUS(status) == STARTUP_FAILURE_EXIT_CODE):
+            self.failed_starts = 0
+            time.sleep(RESPAWN_DELAY_SECONDS)
+            return
+        self.failed_starts += 1
+        if self.failed_starts >= MAX_FAILED_STARTS:
+            raise click.ClickException(
+                f"{self.failed_starts} lims workers in a row failed to start, see the log"
+            )
+        time.sleep(RESPAWN_DELAY_SECONDS * 2 ** (self.failed_starts - 1))
+
+    def _stop_workers(self) -> None:
+        for pid in self.pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                continue
+        for pid in self.pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                continue
+        self.pids.clear()
+
+    def serve(self) -> None:
+        read_config(self.config)
+        warm_cli.import_subcommands(click.Context(warm_cli))
+        self._listen()
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        try:
+            for _ in range(self.workers):
+                self._fork_worker()
+            click.echo(f"{self.workers} lims workers listening on {self.socket_path}")
+            while True:
+                pid, status = os.wait()
+                self.pids.discard(pid)
+                self._on_worker_exit(pid=pid, status=status)
+                self._fork_worker()
+        finally:
+            self._stop_workers()
+            self.listener.close()
+            os.unlink(self.socket_path)
+
+
+@click.command()
+@click.option(
+    "--socket-path",
+    default=DEFAULT_SOCKET_PATH,
+    envvar=SOCKET_ENVIRONMENT_VARIABLE,
+    show_default=True,
+    help="Unix socket to listen on.",
+)
+@options.workers(default=DEFAULT_WORKERS, help="Number of pre-forked worker processes.")
+@options.max_requests()
+@click.pass_context
+def worker(ctx, socket_path: str, workers: int, max_requests: int):
+    """Run warm worker processes for the lims commands sent by lims-client."""
+    config: str = ctx.find_root().params["config"]
+    WorkerPool(
+        config=config, socket_path=socket_path, workers=workers, max_requests=max_requests
+    ).serve()
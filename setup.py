@@ -26,7 +26,10 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     entry_points={
-        "console_scripts": ["lims=cg_lims.commands:cli"],
+        "console_scripts": [
+            "lims=cg_lims.commands:cli",
+            "lims-client=cg_lims.worker.client:main",
+        ],
     },
     classifiers=[
         "Programming Language :: Python :: 3",
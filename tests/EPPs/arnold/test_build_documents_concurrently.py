@@ -0,0 +1,59 @@
+import pytest
+from mock import Mock
+from cg_lims.exceptions import LimsError
+from cg_lims.models.arnold.base_step import BaseStep
+from cg_lims.models.arnold.build import build_documents_concurrently
+
+
+def build_documents(sample_id: str, process_id: str, lims) -> list:
+    if sample_id == "failing_sample":
+        raise LimsError(message="Missing artifact")
+    return [
+        BaseStep(
+            prep_id=f"{sample_id}_{process_id}",
+            step_type=step_type,
+            sample_id=sample_id,
+            workflow="WGS",
+        )
+        for step_type in ["reception_control", "buffer_exchange"]
+    ]
+
+
+def test_build_documents_concurrently_is_deterministic():
+    # GIVEN a list of unsorted sample ids
+    sample_ids = ["S3", "S1", "S2"]
+
+    # WHEN building the documents over several workers
+    documents = build_documents_concurrently(
+        build_function=build_documents,
+        sample_ids=sample_ids,
+        process_id="24-1",
+        lims=Mock(),
+        workers=3,
+    )
+
+    # THEN the documents are returned ordered by sample id and in step order
+    assert [(document.sample_id, document.step_type) for document in documents] == [
+        ("S1", "reception_control"),
+        ("S1", "buffer_exchange"),
+        ("S2", "reception_control"),
+        ("S2", "buffer_exchange"),
+        ("S3", "reception_control"),
+        ("S3", "buffer_exchange"),
+    ]
+
+
+def test_build_documents_concurrently_reports_failing_samples(caplog):
+    # GIVEN a sample for which building the documents fails
+    sample_ids = ["S1", "failing_sample", "S2"]
+
+    # WHEN building the documents
+    # THEN a LimsError naming only the failing sample is raised
+    with pytest.raises(LimsError) as error:
+        build_documents_concurrently(
+            build_function=build_documents, sample_ids=sample_ids, process_id="24-1", lims=Mock()
+        )
+
+    assert "failing_sample" in error.value.message
+    assert "S1" not in error.value.message
+    assert "Missing artifact" in caplog.text
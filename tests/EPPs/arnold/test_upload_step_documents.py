@@ -0,0 +1,134 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+from cg_lims.clients.arnold.arnold_client import ArnoldClient
+from cg_lims.clients.arnold.upload_manifest import UploadManifest, hash_document
+from cg_lims.EPPs.arnold.upload import upload_step_documents
+from cg_lims.exceptions import LimsError
+from cg_lims.models.arnold.base_step import BaseStep
+from mock import Mock
+
+
+def build_steps(container_name: str = "plate_1") -> List[BaseStep]:
+    return [
+        BaseStep(
+            prep_id=f"ACC{number}A1_24-1",
+            step_type="aliquot",
+            sample_id=f"ACC{number}A1",
+            workflow="WGS",
+            container_name=container_name,
+        )
+        for number in range(3)
+    ]
+
+
+def test_hash_document_ignores_key_order():
+    # GIVEN the same document with its keys in different orders
+    # WHEN hashing them
+    # THEN the hashes are equal
+    assert hash_document({"a": 1, "b": [1, 2]}) == hash_document({"b": [1, 2], "a": 1})
+    assert hash_document({"a": 1}) != hash_document({"a": 2})
+
+
+def test_upload_step_documents_skips_unchanged(mocker, tmp_path: Path):
+    # GIVEN step documents that were uploaded once with a file backed manifest
+    arnold_client = ArnoldClient(host="http://arnold")
+    post = mocker.patch.object(arnold_client.session, "request", return_value=Mock(ok=True))
+    manifest_file: Path = tmp_path / "manifest.json"
+    upload_step_documents(
+        arnold_client=arnold_client,
+        step_documents=build_steps(),
+        manifest=UploadManifest(path=str(manifest_file)),
+    )
+
+    # WHEN uploading them again in a new run, where one document changed
+    step_documents: List[BaseStep] = build_steps()
+    step_documents[1].container_name = "plate_2"
+    message: str = upload_step_documents(
+        arnold_client=arnold_client,
+        step_documents=step_documents,
+        manifest=UploadManifest(path=str(manifest_file)),
+    )
+
+    # THEN only the changed document is posted, and the others are reported as skipped
+    assert post.call_count == 2
+    posted: List = json.loads(post.call_args.kwargs["data"])
+    assert [document["container_name"] for document in posted] == ["plate_2"]
+    assert message == (
+        "1 step documents inserted to arnold database, 2 unchanged documents skipped"
+    )
+
+
+def test_upload_step_documents_nothing_changed(mocker):
+    # GIVEN step documents that are all in the manifest
+    arnold_client = ArnoldClient(host="http://arnold")
+    post = mocker.patch.object(arnold_client.session, "request", return_value=Mock(ok=True))
+    manifest = UploadManifest()
+    manifest.record([document.dict(exclude_none=True) for document in build_steps()])
+
+    # WHEN uploading them
+    upload_step_documents(
+        arnold_client=arnold_client, step_documents=build_steps(), manifest=manifest
+    )
+
+    # THEN nothing is posted
+    post.assert_not_called()
+
+    # WHEN forcing the upload
+    upload_step_documents(
+        arnold_client=arnold_client, step_documents=build_steps(), manifest=manifest, force=True
+    )
+
+    # THEN all documents are posted
+    assert len(json.loads(post.call_args.kwargs["data"])) == 3
+
+
+def test_upload_step_documents_failure_not_recorded(mocker):
+    # GIVEN arnold rejecting the upload
+    arnold_client = ArnoldClient(host="http://arnold")
+    mocker.patch.object(arnold_client.session, "request", return_value=Mock(ok=False, text="error"))
+    manifest = UploadManifest()
+
+    # WHEN uploading step documents
+    with pytest.raises(LimsError):
+        upload_step_documents(
+            arnold_client=arnold_client, step_documents=build_steps(), manifest=manifest
+        )
+
+    # THEN the documents are still to be uploaded
+    documents = [document.dict(exclude_none=True) for document in build_steps()]
+    assert len(manifest.get_changed(documents)) == 3
+
+
+def test_manifest_file_keeps_hashes_of_concurrent_manifests(tmp_path: Path):
+    # GIVEN two manifests, as in two concurrent EPPs, created from the same file
+    manifest_file: Path = tmp_path / "manifest.json"
+    first_manifest = UploadManifest(path=str(manifest_file))
+    second_manifest = UploadManifest(path=str(manifest_file))
+
+    # WHEN each manifest records and saves a different document
+    first_manifest.record([{"id": "1", "value": 1}])
+    first_manifest.save()
+    second_manifest.record([{"id": "2", "value": 2}])
+    second_manifest.save()
+
+    # THEN the file holds the hashes of both documents
+    assert set(json.loads(manifest_file.read_text())) == {"1", "2"}
+
+
+def test_manifest_file_keeps_most_recent_documents(tmp_path: Path):
+    # GIVEN a manifest file that holds at most two documents, with two documents
+    manifest_file: Path = tmp_path / "manifest.json"
+    manifest = UploadManifest(path=str(manifest_file), max_entries=2)
+    manifest.record([{"id": "1", "value": 1}, {"id": "2", "value": 2}])
+    manifest.save()
+
+    # WHEN the first document is uploaded again, followed by a third
+    manifest.record([{"id": "1", "value": 1}])
+    manifest.record([{"id": "3", "value": 3}])
+    manifest.save()
+
+    # THEN the least recently uploaded document is dropped from the file
+    assert list(json.loads(manifest_file.read_text())) == ["1", "3"]
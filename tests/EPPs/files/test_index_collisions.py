@@ -0,0 +1,91 @@
+import random
+from typing import List, Optional
+
+from cg_lims.EPPs.files.sample_sheet.index_collisions import LaneIndexCollisions
+from cg_lims.EPPs.files.sample_sheet.models import IlluminaIndex, IndexType
+
+
+def reference_hamming_distance(index_1: IlluminaIndex, index_2: IlluminaIndex) -> Optional[int]:
+    """Pairwise distance on the common prefix (i7) or suffix (i5) of two indexes."""
+    if index_1.type != index_2.type:
+        return None
+    length: int = min(len(index_1.sequence), len(index_2.sequence))
+    if index_1.type == IndexType.INDEX_1:
+        sequence_1, sequence_2 = index_1.sequence[:length], index_2.sequence[:length]
+    else:
+        sequence_1, sequence_2 = index_1.sequence[-length:], index_2.sequence[-length:]
+    return sum(n1 != n2 for n1, n2 in zip(sequence_1, sequence_2))
+
+
+def reference_barcode_mismatches(index: IlluminaIndex, all_indexes: List[IlluminaIndex]) -> int:
+    for comparison_index in all_indexes:
+        distance: Optional[int] = reference_hamming_distance(index, comparison_index)
+        if comparison_index.sequence == index.sequence or distance is None:
+            continue
+        if distance < 3:
+            return 0
+    return 1
+
+
+def test_prefix_and_suffix_comparison():
+    # GIVEN an i7 index that is a prefix of a longer i7, and an i5 index that is a suffix of a
+    # longer i5 index, and one distant index of each type
+    indexes: List[IlluminaIndex] = [
+        IlluminaIndex(sequence="ACGTACGT", type=IndexType.INDEX_1),
+        IlluminaIndex(sequence="ACGTACGTAA", type=IndexType.INDEX_1),
+        IlluminaIndex(sequence="TTTTTTTT", type=IndexType.INDEX_1),
+        IlluminaIndex(sequence="GGCCGGCC", type=IndexType.INDEX_2),
+        IlluminaIndex(sequence="TTGGCCGGCC", type=IndexType.INDEX_2),
+        IlluminaIndex(sequence="AAAAAAAAAA", type=IndexType.INDEX_2),
+    ]
+
+    # WHEN computing the index collisions of the lane
+    index_collisions = LaneIndexCollisions(indexes=indexes)
+
+    # THEN the overlapping indexes collide and get no barcode mismatches
+    mismatches = [index_collisions.get_barcode_mismatches(index=index) for index in indexes]
+    assert mismatches == [0, 0, 1, 0, 0, 1]
+    assert {
+        (collision.sequence_1, collision.distance) for collision in index_collisions.collisions
+    } == {
+        ("ACGTACGT", 0),
+        ("GGCCGGCC", 0),
+    }
+
+
+def test_equal_sequences_do_not_collide():
+    # GIVEN two libraries sharing an i7 index with different i5 indexes
+    indexes: List[IlluminaIndex] = [
+        IlluminaIndex(sequence="ACGTACGT", type=IndexType.INDEX_1),
+        IlluminaIndex(sequence="ACGTACGT", type=IndexType.INDEX_1),
+        IlluminaIndex(sequence="GGCCGGCC", type=IndexType.INDEX_2),
+        IlluminaIndex(sequence="TTAATTAA", type=IndexType.INDEX_2),
+    ]
+
+    # WHEN computing the index collisions of the lane
+    index_collisions = LaneIndexCollisions(indexes=indexes)
+
+    # THEN all indexes keep one barcode mismatch
+    assert [index_collisions.get_barcode_mismatches(index=index) for index in indexes] == [1] * 4
+    assert not index_collisions.collisions
+
+
+def test_matches_pairwise_comparison():
+    # GIVEN a lane of random dual indexes of mixed lengths
+    random.seed(1)
+    indexes: List[IlluminaIndex] = [
+        IlluminaIndex(
+            sequence="".join(random.choice("ACGT") for _ in range(random.choice([4, 5, 6]))),
+            type=random.choice([IndexType.INDEX_1, IndexType.INDEX_2]),
+        )
+        for _ in range(300)
+    ]
+
+    # WHEN computing the index collisions in small blocks
+    index_collisions = LaneIndexCollisions(indexes=indexes, block_size=7)
+
+    # THEN the barcode mismatches are the same as when comparing every pair of indexes
+    for index in indexes:
+        assert index_collisions.get_barcode_mismatches(index=index) == (
+            reference_barcode_mismatches(index=index, all_indexes=indexes)
+        )
@@ -0,0 +1,47 @@
+from io import StringIO
+from typing import Dict, List
+
+from cg_lims.EPPs.files.sample_sheet.create_sample_sheet import iter_bcl_data_section
+from cg_lims.EPPs.files.sample_sheet.models import NovaSeqXRun
+from mock import Mock
+
+RUN_UDFS: Dict = {
+    "Read 1 Cycles": 151,
+    "Read 2 Cycles": 151,
+    "Index Read 1": 10,
+    "Index Read 2": 10,
+}
+
+
+def make_library(sample_id: str, sequence: str) -> Mock:
+    lims = Mock()
+    lims.get_reagent_types.return_value = [Mock(sequence=sequence)]
+    return Mock(lims=lims, reagent_labels=[f"UDI ({sequence})"], samples=[Mock(id=sample_id)])
+
+
+def test_stream_bcl_data_section():
+    # GIVEN a run with two lanes of two dual indexed libraries
+    run_settings = NovaSeqXRun(process=Mock(udf=RUN_UDFS))
+    libraries: List[Mock] = [
+        make_library(sample_id="ACC1A1", sequence="AACCGGTTAA-CCGGTTAACC"),
+        make_library(sample_id="ACC2A1", sequence="GGTTAACCGG-TTAACCGGTT"),
+    ]
+    lane_leaves: Dict[int, List[Mock]] = {1: libraries, 2: libraries}
+
+    # WHEN streaming the BCLConvert_Data section to a buffer
+    buffer = StringIO()
+    NovaSeqXRun.write_sample_sheet(
+        content=iter_bcl_data_section(run_settings=run_settings, lane_leaves=lane_leaves),
+        file=buffer,
+    )
+
+    # THEN the section has a header row and one row per library and lane
+    rows: List[str] = buffer.getvalue().strip().split("\n")
+    assert rows[0] == "[BCLConvert_Data]"
+    assert rows[1].startswith("Lane,Sample_ID,Index,Index2")
+    assert rows[2:] == [
+        "1,ACC1A1,AACCGGTTAA,CCGGTTAACC,Y151;I10;I10;Y151,1,1",
+        "1,ACC2A1,GGTTAACCGG,TTAACCGGTT,Y151;I10;I10;Y151,1,1",
+        "2,ACC1A1,AACCGGTTAA,CCGGTTAACC,Y151;I10;I10;Y151,1,1",
+        "2,ACC2A1,GGTTAACCGG,TTAACCGGTT,Y151;I10;I10;Y151,1,1",
+    ]
@@ -1,6 +1,11 @@
 from typing import List
 
+import pytest
+from cg_lims.clients.cg.status_db_api import StatusDBAPI
+from cg_lims.EPPs.qc import sequencing_quality_checker as quality_checker_module
+from cg_lims.EPPs.qc.illumina_sequencing_quality_control import sequencing_quality_control
 from cg_lims.EPPs.qc.sequencing_quality_checker import IlluminaSequencingQualityChecker
+from click.testing import CliRunner, Result
 from genologics.lims import Lims
 from mock import Mock
 
@@ -9,10 +14,13 @@ def test_quality_control_of_flow_cell_with_all_passing(
     sequencing_quality_checker: IlluminaSequencingQualityChecker,
     novaseq_passing_metrics_response: Mock,
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
     # GIVEN a flow cell with one negative control where all samples passes the quality control
-    mocker.patch("requests.get", return_value=novaseq_passing_metrics_response)
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=novaseq_passing_metrics_response
+    )
 
     # WHEN validating the sequencing quality
     sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -27,10 +35,11 @@ def test_all_samples_fail_q30(
     novaseq_sample_ids: List[str],
     novaseq_lanes,
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
     # GIVEN a flow cell with one negative control where all samples fail the quality control on Q30
-    mocker.patch("requests.get", return_value=novaseq_q30_fail_response)
+    mocker.patch.object(status_db_api_client.session, "get", return_value=novaseq_q30_fail_response)
 
     # WHEN validating the sequencing quality
     sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -46,10 +55,13 @@ def test_all_samples_have_too_few_reads(
     novaseq_sample_ids: List[str],
     novaseq_lanes: int,
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
     # GIVEN a flow cell with one negative control where all samples in all lanes have too few reads
-    mocker.patch("requests.get", return_value=novaseq_reads_fail_response)
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=novaseq_reads_fail_response
+    )
 
     # WHEN validating the sequencing quality
     sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -63,10 +75,13 @@ def test_some_samples_fail_quality_control(
     sequencing_quality_checker: IlluminaSequencingQualityChecker,
     novaseq_two_failing_metrics_response: Mock,
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
     # GIVEN a flow cell with one negative control where some samples (not the NTC) fail the quality control
-    mocker.patch("requests.get", return_value=novaseq_two_failing_metrics_response)
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=novaseq_two_failing_metrics_response
+    )
 
     # WHEN validating the sequencing quality
     sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -81,10 +96,15 @@ def test_metrics_missing_for_samples_in_lane(
     missing_sample_id: str,
     missing_lane: int,
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
     # GIVEN metrics missing data for a sample in lims
-    mocker.patch("requests.get", return_value=novaseq_missing_metrics_for_sample_in_lane_response)
+    mocker.patch.object(
+        status_db_api_client.session,
+        "get",
+        return_value=novaseq_missing_metrics_for_sample_in_lane_response,
+    )
 
     # WHEN validating the sequencing quality
     summary: str = sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -102,10 +122,13 @@ def test_sample_missing_in_lims(
     novaseq_metrics_with_extra_sample_response: Mock,
     sample_id_missing_in_lims: str,
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
     # GIVEN metrics with a sample not in lims
-    mocker.patch("requests.get", return_value=novaseq_metrics_with_extra_sample_response)
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=novaseq_metrics_with_extra_sample_response
+    )
 
     # WHEN validating the sequencing quality
     summary: str = sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -115,3 +138,42 @@ def test_sample_missing_in_lims(
 
     # THEN the missing sample should be reported
     assert sample_id_missing_in_lims in summary
+
+
+def test_samples_resolved_once_per_flow_cell(
+    sequencing_quality_checker: IlluminaSequencingQualityChecker,
+    novaseq_passing_metrics_response: Mock,
+    novaseq_sample_ids: List[str],
+    mocker,
+    status_db_api_client: StatusDBAPI,
+    lims: Lims,
+):
+    # GIVEN a flow cell with metrics for each sample in every lane
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=novaseq_passing_metrics_response
+    )
+    resolve = mocker.spy(quality_checker_module, "resolve_negative_controls")
+
+    # WHEN validating the sequencing quality
+    sequencing_quality_checker.validate_sequencing_quality(lims=lims)
+
+    # THEN the control status of all samples is resolved in one go
+    assert resolve.call_count == 1
+    assert set(sequencing_quality_checker.negative_controls) == set(novaseq_sample_ids)
+
+    # THEN exactly one of the samples is a negative control
+    assert sum(sequencing_quality_checker.negative_controls.values()) == 1
+
+
+@pytest.mark.parametrize("batch_size", ["0", "-1"])
+def test_sequencing_quality_control_rejects_invalid_batch_size(batch_size: str):
+    # GIVEN a batch size that is not a positive integer
+
+    # WHEN running the sequencing quality control with the batch size
+    result: Result = CliRunner().invoke(
+        sequencing_quality_control, ["--batch-size", batch_size], obj={}
+    )
+
+    # THEN the batch size is rejected before any metrics are fetched
+    assert result.exit_code == 2
+    assert "--batch-size" in result.output
@@ -1,5 +1,6 @@
 from typing import Dict, List
 
+from cg_lims.clients.cg.status_db_api import StatusDBAPI
 from cg_lims.EPPs.qc.sequencing_quality_checker import PacBioSequencingQualityChecker
 from genologics.lims import Lims
 from mock import Mock
@@ -9,10 +10,13 @@ def test_quality_control_with_all_samples_passing(
     pacbio_sequencing_quality_checker: PacBioSequencingQualityChecker,
     pacbio_passing_metrics_response: Mock,
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
     # GIVEN a run where all samples pass the quality control
-    mocker.patch("requests.get", return_value=pacbio_passing_metrics_response)
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=pacbio_passing_metrics_response
+    )
 
     # WHEN validating the sequencing quality
     pacbio_sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -25,10 +29,13 @@ def test_quality_control_with_all_samples_failing(
     pacbio_sequencing_quality_checker: PacBioSequencingQualityChecker,
     pacbio_failing_metrics_response: Mock,
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
     # GIVEN a run where all samples fail the quality control
-    mocker.patch("requests.get", return_value=pacbio_failing_metrics_response)
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=pacbio_failing_metrics_response
+    )
 
     # WHEN validating the sequencing quality
     pacbio_sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -44,11 +51,14 @@ def test_metrics_missing_for_sample(
     pacbio_missing_sample_metrics_response: Mock,
     missing_pacbio_sample_id: str,
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
 
     # GIVEN missing metrics data for a sample in lims
-    mocker.patch("requests.get", return_value=pacbio_missing_sample_metrics_response)
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=pacbio_missing_sample_metrics_response
+    )
 
     # WHEN validating the sequencing quality
     summary: str = pacbio_sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -67,10 +77,13 @@ def test_metrics_missing_for_smrt_cell(
     missing_smrt_cell_id: str,
     pacbio_smrt_cell_sample_ids: Dict[str, List[str]],
     mocker,
+    status_db_api_client: StatusDBAPI,
     lims: Lims,
 ):
     # GIVEN missing metrics data for a SMRT Cell in lims
-    mocker.patch("requests.get", return_value=pacbio_missing_smrt_cell_metrics_response)
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=pacbio_missing_smrt_cell_metrics_response
+    )
 
     # WHEN validating the sequencing quality
     summary: str = pacbio_sequencing_quality_checker.validate_sequencing_quality(lims=lims)
@@ -85,3 +98,32 @@ def test_metrics_missing_for_smrt_cell(
         f"No metrics were found for the following sample sequencing artifacts: [('{missing_smrt_cell_id}"
         in summary
     )
+
+
+def test_results_written_back_in_batches(
+    pacbio_sequencing_quality_checker: PacBioSequencingQualityChecker,
+    pacbio_passing_metrics_response: Mock,
+    mocker,
+    status_db_api_client: StatusDBAPI,
+    lims: Lims,
+):
+    # GIVEN a run where all samples pass the quality control, checked in batches of two
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=pacbio_passing_metrics_response
+    )
+    pacbio_sequencing_quality_checker.batch_size = 2
+    put_batch = mocker.patch.object(lims, "put_batch")
+
+    # WHEN validating the sequencing quality
+    pacbio_sequencing_quality_checker.validate_sequencing_quality(lims=lims)
+
+    # THEN the control status of every sample was resolved before the quality control
+    sample_ids = {
+        sample_id for _, sample_id in pacbio_sequencing_quality_checker.cell_samples_in_metrics
+    }
+    assert set(pacbio_sequencing_quality_checker.negative_controls) == sample_ids
+
+    # THEN the updated artifacts were written back in batches of at most two
+    updated_artifacts = [artifact for call in put_batch.call_args_list for artifact in call.args[0]]
+    assert len(updated_artifacts) == len(pacbio_sequencing_quality_checker.cell_samples_in_metrics)
+    assert all(len(call.args[0]) <= 2 for call in put_batch.call_args_list)
@@ -1,7 +1,15 @@
 from pathlib import Path
+from typing import Dict
 
-from cg_lims.commands.base import cli
+import click
+import pytest
+from cg_lims.clients.arnold.arnold_client import ArnoldClient, BodyFormat
+from cg_lims.clients.arnold.upload_manifest import UploadManifest
+from cg_lims.clients.lims_xml_cache import CachingLims
+from cg_lims.commands.base import add_clients, cli, create_arnold_client, create_lims
+from cg_lims.lazy import LazyContextObject
 from click.testing import CliRunner
+from genologics.lims import Lims
 
 
 def test_cli_existing_log_file(config):
@@ -29,3 +37,67 @@ def test_cli_not_existing_log_file(config):
 
     # THEN assert no error
     assert result.exit_code == 0
+
+
+def test_create_arnold_client_from_config():
+    # GIVEN a config with the arnold chunk size as a string
+    config_data: Dict = {"ARNOLD_HOST": "http://arnold", "ARNOLD_CHUNK_SIZE": "50"}
+
+    # WHEN creating the arnold client
+    arnold_client: ArnoldClient = create_arnold_client(config_data=config_data)
+
+    # THEN the chunk size is cast to an integer and the body format is the default
+    assert arnold_client.chunk_size == 50
+    assert arnold_client.body_format == BodyFormat.JSON
+
+
+@pytest.mark.parametrize(
+    "config_data",
+    [
+        {"ARNOLD_CHUNK_SIZE": 0},
+        {"ARNOLD_CHUNK_SIZE": "many"},
+        {"ARNOLD_BODY_FORMAT": "xml"},
+    ],
+)
+def test_create_arnold_client_invalid_config(config_data: Dict):
+    # WHEN creating the arnold client with an invalid chunk size or body format
+    # THEN the config is rejected
+    with pytest.raises(click.BadParameter):
+        create_arnold_client(config_data=config_data)
+
+
+def test_create_lims_with_unreadable_cache_file(tmp_path: Path):
+    # GIVEN a config with a LIMS XML cache file that is not an SQLite database
+    cache_file: Path = tmp_path / "lims_cache.sqlite"
+    cache_file.write_text("not a database")
+    config_data: Dict = {
+        "BASEURI": "https://lims",
+        "USERNAME": "user",
+        "PASSWORD": "password",
+        "LIMS_CACHE_FILE": str(cache_file),
+    }
+
+    # WHEN creating the lims client
+    lims: Lims = create_lims(config_data=config_data)
+
+    # THEN a lims without the cache is created
+    assert not isinstance(lims, CachingLims)
+
+
+def test_add_clients_creates_upload_manifest_when_used(tmp_path: Path):
+    # GIVEN a config with an arnold upload manifest file
+    config_data: Dict = {
+        "BASEURI": "https://lims",
+        "USERNAME": "user",
+        "PASSWORD": "password",
+        "ARNOLD_HOST": "http://arnold",
+        "ARNOLD_UPLOAD_MANIFEST_FILE": str(tmp_path / "manifest.json"),
+    }
+    context_object = LazyContextObject()
+
+    # WHEN adding the clients of the config to a context object
+    add_clients(context_object=context_object, config_data=config_data)
+
+    # THEN the upload manifest is only created when it is looked up
+    assert context_object.get_created("arnold_upload_manifest") is None
+    assert isinstance(context_object["arnold_upload_manifest"], UploadManifest)
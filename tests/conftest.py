@@ -1,8 +1,10 @@
 import datetime as dt
+import json
+import socket
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Any, Callable, Dict, Iterator, List
 
 import pandas as pd
 import pytest
@@ -21,8 +23,8 @@ from genologics.entities import Artifact, Process, Sample
 from genologics.lims import Lims
 from limsmock.server import run_server
 from mock import MagicMock, Mock
-
 from tests.fixtures.flowcell_document import FLOW_CELL_DOCUMENT
+from tests.request_budget import LimsRequests, record_lims_requests
 
 PORT = 8000
 HOST = "127.0.0.1"
@@ -43,6 +45,47 @@ def server(file_name: str):
     thread.daemon = True
     thread.start()
     time.sleep(0.1)
+    wait_for_server()
+
+
+def wait_for_server(timeout: float = 5.0):
+    """Wait until the server accepts connections. Only the first server started needs this."""
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((HOST, PORT), timeout=0.1):
+                return
+        except OSError:
+            time.sleep(0.05)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "max_requests(**budget): fail the test if it makes more lims mock server requests of a "
+        "pattern, eg. artifact_get, or in total, than its budget",
+    )
+
+
+@pytest.fixture
+def lims_requests() -> Iterator[LimsRequests]:
+    """Requests to the lims mock server made by the test, by pattern and call site."""
+
+    yield from record_lims_requests(base_url=f"http://{HOST}:{PORT}")
+
+
+@pytest.fixture(autouse=True)
+def lims_request_budget(request) -> Iterator[None]:
+    """Enforce the budget of a max_requests marker on the test."""
+
+    marker = request.node.get_closest_marker("max_requests")
+    if not marker:
+        yield
+        return
+    lims_requests: LimsRequests = request.getfixturevalue("lims_requests")
+    yield
+    lims_requests.max_requests(**marker.kwargs)
 
 
 @pytest.fixture
@@ -225,10 +268,19 @@ def sequencing_metrics_json() -> List[Dict]:
     ]
 
 
+def iter_json_chunks(value: Any, chunk_size: int = 7) -> Iterator[bytes]:
+    """Return the value as JSON, split in small chunks like a streamed response body."""
+    content: bytes = json.dumps(value, ensure_ascii=False).encode()
+    return (content[start : start + chunk_size] for start in range(0, len(content), chunk_size))
+
+
 @pytest.fixture
 def mock_sequencing_metrics_get_response(sequencing_metrics_json) -> Mock:
     mock_response = Mock()
     mock_response.json.return_value = sequencing_metrics_json
+    mock_response.iter_content.side_effect = lambda **kwargs: iter_json_chunks(
+        sequencing_metrics_json
+    )
     mock_response.raise_for_status.return_value = None
     return mock_response
 
@@ -253,6 +305,9 @@ def mock_response() -> Callable:
     def _mock_response(json_return_value):
         mock_response = Mock()
         mock_response.json.return_value = json_return_value
+        mock_response.iter_content.side_effect = lambda **kwargs: iter_json_chunks(
+            json_return_value
+        )
         mock_response.raise_for_status.return_value = None
         return mock_response
 
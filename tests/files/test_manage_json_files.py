@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+
+import pytest
+from cg_lims.files.manage_json_files import write_json_atomically
+
+
+def test_write_json_atomically(tmp_path: Path):
+    # GIVEN an existing JSON file
+    json_file: Path = tmp_path / "cache.json"
+    json_file.write_text(json.dumps({"old": 1}))
+
+    # WHEN writing new content to it
+    write_json_atomically(path=json_file, content={"new": 2})
+
+    # THEN the file holds the new content and no temporary file is left
+    assert json.loads(json_file.read_text()) == {"new": 2}
+    assert list(tmp_path.iterdir()) == [json_file]
+
+
+def test_write_json_atomically_failure_leaves_no_temporary_file(tmp_path: Path):
+    # GIVEN an existing JSON file
+    json_file: Path = tmp_path / "cache.json"
+    json_file.write_text(json.dumps({"old": 1}))
+
+    # WHEN writing content that cannot be serialized
+    # THEN the error is raised
+    with pytest.raises(TypeError):
+        write_json_atomically(path=json_file, content={"new": object()})
+
+    # THEN the file is unchanged and the temporary file is removed
+    assert json.loads(json_file.read_text()) == {"old": 1}
+    assert list(tmp_path.iterdir()) == [json_file]
@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from cg_lims.exceptions import FileError, MissingFileError
+from cg_lims.files.result_file_ingestion import (
+    ResultFileIngestion,
+    check_result_file,
+    open_csv_rows,
+    open_excel_rows,
+)
+from mock import Mock
+from openpyxl import Workbook
+
+
+@pytest.fixture
+def well_dict() -> Dict[str, Mock]:
+    return {"A1": Mock(udf={}), "B1": Mock(udf={}), "C1": Mock(udf={})}
+
+
+def test_ingest_csv_rows(tmp_path: Path, well_dict: Dict[str, Mock]):
+    # GIVEN a CSV result file with a header, an unused well and a missing value
+    result_file: Path = tmp_path / "result.csv"
+    result_file.write_text(
+        "Well,Size,Concentration\nA1,350,1.5\nB1,,2.5\nD1,400,3.5\nC1,300,0.5\n",
+        encoding="latin1",
+    )
+    ingestion = ResultFileIngestion(well_dict=well_dict)
+
+    # WHEN ingesting the rows of the file, with one column that does not exist
+    with open_csv_rows(result_file=result_file) as rows:
+        patched_wells: int = ingestion.ingest_rows(
+            rows=rows,
+            well_column="Well",
+            udf_columns={"Size (bp)": "Size", "Concentration": "Concentration", "Ratio": "Ratio"},
+            coercers={"Concentration": float},
+        )
+
+    # THEN all wells of the step got values and the values are coerced per column
+    assert patched_wells == 3
+    assert ingestion.patches == {
+        "A1": {"Size (bp)": "350", "Concentration": 1.5},
+        "B1": {"Concentration": 2.5},
+        "C1": {"Size (bp)": "300", "Concentration": 0.5},
+    }
+
+    # THEN the missing value and the unused well are counted
+    assert ingestion.missing_values == 1
+    assert ingestion.unknown_wells == 1
+
+
+def test_ingest_excel_rows_of_several_plates(tmp_path: Path, well_dict: Dict[str, Mock]):
+    # GIVEN two Excel result files without headers, one per plate, after two rows of metadata
+    ingestion = ResultFileIngestion(well_dict=well_dict)
+    plates = {
+        "plate_1.xlsx": [["A1", "x", 1.0], ["B1", "x", 2.0]],
+        "plate_2.xlsx": [["C1", "x", 3]],
+    }
+
+    for file_name, plate_rows in plates.items():
+        workbook = Workbook()
+        workbook.active.append(["Instrument", "Quant-iT"])
+        workbook.active.append(["Date", "2024-01-01"])
+        for row in plate_rows:
+            workbook.active.append(row)
+        workbook.save(tmp_path / file_name)
+
+        # WHEN ingesting the rows of each file into the same table
+        with open_excel_rows(result_file=tmp_path / file_name, skip_rows=2) as rows:
+            ingestion.ingest_rows(
+                rows=rows, well_column=0, udf_columns={"Concentration": 2}, header=False
+            )
+
+    # THEN the wells of both plates are in the table
+    assert ingestion.patches == {
+        "A1": {"Concentration": 1.0},
+        "B1": {"Concentration": 2.0},
+        "C1": {"Concentration": 3},
+    }
+
+
+def test_open_excel_rows_reads_first_sheet(tmp_path: Path):
+    # GIVEN an Excel result file saved with its second sheet selected
+    result_file: Path = tmp_path / "result.xlsx"
+    workbook = Workbook()
+    workbook.active.append(["A1", 1.0])
+    summary_sheet = workbook.create_sheet("Summary")
+    summary_sheet.append(["Total", 1.0])
+    workbook.active = summary_sheet
+    workbook.save(result_file)
+
+    # WHEN opening the rows of the file without a sheet name
+    with open_excel_rows(result_file=result_file) as rows:
+        result = list(rows)
+
+    # THEN the rows of the first sheet are read
+    assert result == [("A1", 1.0)]
+
+
+def test_open_excel_rows_rejects_legacy_excel_files(tmp_path: Path):
+    # GIVEN a legacy .xls result file
+    result_file: Path = tmp_path / "result.xls"
+    result_file.write_bytes(b"legacy")
+
+    # WHEN opening the rows of the file
+    # THEN a FileError is raised
+    with pytest.raises(FileError):
+        with open_excel_rows(result_file=result_file):
+            pass
+
+
+def test_check_result_file_missing(tmp_path: Path):
+    # GIVEN a path to a file that does not exist
+    result_file: Path = tmp_path / "missing.csv"
+
+    # WHEN checking the result file
+    # THEN a MissingFileError is raised
+    with pytest.raises(MissingFileError):
+        check_result_file(result_file=result_file)
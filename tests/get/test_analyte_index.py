@@ -0,0 +1,55 @@
+import pytest
+from cg_lims.get.analyte_index import AnalyteIndex, get_active_analyte_index
+from cg_lims.objects import BaseAnalyte
+from genologics.entities import Artifact
+from genologics.lims import Lims
+from tests.conftest import server
+
+SAMPLE_ID = "ACC7236A52"
+PROCESS_TYPE = "CG002 - Sort HiSeq Samples"
+
+
+@pytest.mark.max_requests(artifact_batch_retrieve=1, process_get=2, total=7)
+def test_analyte_index_latest_analyte(lims: Lims):
+    # GIVEN a sample that has been run through the same type of process three times
+    server("test_get_artifacts")
+    analyte_index = AnalyteIndex(lims=lims, sample_ids=[SAMPLE_ID])
+
+    # WHEN getting the latest analyte from the index
+    latest_artifact = analyte_index.get_latest_analyte(
+        sample_id=SAMPLE_ID, process_types=[PROCESS_TYPE]
+    )
+
+    # THEN the artifact from the latest process is returned
+    assert latest_artifact.parent_process.date_run == "2020-12-28"
+
+
+def test_analyte_index_searches_once_per_process_type(lims: Lims, mocker):
+    # GIVEN an index of two samples
+    server("test_get_artifacts")
+    get_artifacts = mocker.spy(lims, "get_artifacts")
+    analyte_index = AnalyteIndex(lims=lims, sample_ids=[SAMPLE_ID, "ACC0000A1"])
+
+    # WHEN looking up analytes of both samples for the same process type
+    for sample_id in [SAMPLE_ID, "ACC0000A1"]:
+        analyte_index.get_analytes(sample_id=sample_id, process_types=[PROCESS_TYPE])
+
+    # THEN one artifact search with both sample ids is made
+    get_artifacts.assert_called_once_with(
+        samplelimsid=["ACC0000A1", SAMPLE_ID], type="Analyte", process_type=[PROCESS_TYPE]
+    )
+
+
+def test_base_analyte_draws_from_active_index(lims: Lims, mocker):
+    # GIVEN an active analyte index with an analyte for the sample
+    artifact = Artifact(lims, id="2-1")
+    mocker.patch.object(AnalyteIndex, "get_latest_analyte", return_value=artifact)
+    mocker.patch.object(BaseAnalyte, "get_process", return_value=None)
+
+    # WHEN creating a BaseAnalyte within the index context
+    with AnalyteIndex(lims=lims, sample_ids=[SAMPLE_ID]):
+        analyte = BaseAnalyte(lims=lims, sample_id=SAMPLE_ID, process_type=PROCESS_TYPE)
+
+    # THEN the analyte artifact is taken from the index, which is deactivated afterwards
+    assert analyte.artifact is artifact
+    assert get_active_analyte_index(lims) is None
@@ -0,0 +1,45 @@
+from cg_lims.get.artifacts import get_artifacts
+from cg_lims.get.batch import batch_retrieve, chunk_entities
+from genologics.entities import Artifact, Process
+from genologics.lims import Lims
+from tests.conftest import server
+
+
+def test_chunk_entities():
+    # GIVEN a list of five entities
+    entities = ["1", "2", "3", "4", "5"]
+
+    # WHEN chunking them two at a time
+    chunks = list(chunk_entities(entities=entities, chunk_size=2))
+
+    # THEN three chunks are returned, covering all entities in order
+    assert chunks == [["1", "2"], ["3", "4"], ["5"]]
+
+
+def test_batch_retrieve_chunks_unloaded_entities(lims: Lims, mocker):
+    # GIVEN three unloaded artifacts and one already loaded artifact
+    artifacts = [Artifact(lims, id=f"batch_{index}") for index in range(3)]
+    loaded_artifact = Artifact(lims, id="batch_loaded")
+    loaded_artifact.root = "<artifact/>"
+    get_batch = mocker.patch.object(Lims, "get_batch")
+
+    # WHEN retrieving the artifacts two at a time
+    batch_retrieve(lims=lims, entities=artifacts + [loaded_artifact], chunk_size=2)
+
+    # THEN only the unloaded artifacts are fetched, in two batch calls
+    assert get_batch.call_count == 2
+    fetched = [artifact for call in get_batch.call_args_list for artifact in call.args[0]]
+    assert fetched == artifacts
+
+
+def test_batch_retrieve_falls_back_to_lazy_loading(lims: Lims):
+    # GIVEN a lims server without the batch endpoints
+    server("test_get_artifacts")
+    process = Process(lims, id="24-160122")
+
+    # WHEN getting the output artifacts of a process
+    output_artifacts = get_artifacts(process=process)
+
+    # THEN the artifacts are still returned and can be loaded lazily
+    assert output_artifacts
+    assert all(artifact.name for artifact in output_artifacts)
@@ -0,0 +1,44 @@
+from typing import List
+
+from cg_lims.get.pool_resolver import PoolResolver
+from mock import Mock
+
+
+def make_artifact(artifact_id: str, samples: List[str], inputs: List[Mock] = []) -> Mock:
+    artifact = Mock(id=artifact_id, samples=samples)
+    artifact.input_artifact_list.return_value = inputs
+    return artifact
+
+
+def test_pool_on_several_lanes_resolved_once():
+    # GIVEN a pool of a library and a sub pool of two libraries, placed on two lanes
+    library_1 = make_artifact("2-1", samples=["S1"])
+    library_2 = make_artifact("2-2", samples=["S2"])
+    library_3 = make_artifact("2-3", samples=["S3"])
+    sub_pool = make_artifact("2-4", samples=["S2", "S3"], inputs=[library_2, library_3])
+    pool = make_artifact("2-5", samples=["S1", "S2", "S3"], inputs=[library_1, sub_pool])
+    lane_1 = make_artifact("2-6", samples=["S1", "S2", "S3"], inputs=[pool])
+    lane_2 = make_artifact("2-7", samples=["S1", "S2", "S3"], inputs=[pool])
+
+    # WHEN resolving the lanes
+    lane_leaves = PoolResolver(lims=Mock()).resolve(pools={1: lane_1, 2: lane_2})
+
+    # THEN both lanes hold the libraries in pooling order
+    assert lane_leaves[1] == [library_1, library_2, library_3]
+    assert lane_leaves[2] == [library_1, library_2, library_3]
+
+    # THEN the shared pool was only walked once
+    assert pool.input_artifact_list.call_count == 1
+    assert sub_pool.input_artifact_list.call_count == 1
+    library_1.input_artifact_list.assert_not_called()
+
+
+def test_non_pooled_artifact_is_its_own_leaf():
+    # GIVEN an artifact of a single sample
+    library = make_artifact("2-1", samples=["S1"])
+
+    # WHEN getting its non pooled artifacts
+    artifacts = PoolResolver(lims=Mock()).get_non_pooled_artifacts(artifact=library)
+
+    # THEN the artifact itself is returned
+    assert artifacts == [library]
@@ -0,0 +1,94 @@
+from pathlib import Path
+from xml.etree import ElementTree
+
+from cg_lims.get.reagent_catalog import DEFAULT_MAX_AGE_SECONDS, ReagentCatalog
+from mock import Mock
+
+REAGENT_TYPES_XML = """<rtp:reagent-types xmlns:rtp="http://genologics.com/ri/reagenttype">
+<reagent-type uri="http://lims/api/v2/reagenttypes/1" name="IDT_10nt_UDI_1 (AAA-CCC)"/>
+<reagent-type uri="http://lims/api/v2/reagenttypes/2" name="IDT_10nt_UDI_2 (GGG-TTT)"/>
+</rtp:reagent-types>"""
+
+
+def test_label_looked_up_once():
+    # GIVEN a reagent catalog without a file and a lims with one reagent type for a label
+    lims = Mock()
+    lims.get_reagent_types.return_value = [Mock(sequence="AAA-CCC")]
+    catalog = ReagentCatalog(lims=lims)
+
+    # WHEN looking up the label twice
+    catalog.get_sequences(label="IDT_10nt_UDI_1 (AAA-CCC)")
+    sequences = catalog.get_sequences(label="IDT_10nt_UDI_1 (AAA-CCC)")
+
+    # THEN the sequence is returned and lims is only asked once
+    assert sequences == ["AAA-CCC"]
+    assert lims.get_reagent_types.call_count == 1
+
+
+def test_reset_catalog_looks_up_label_again():
+    # GIVEN a reagent catalog without a file where a label was looked up
+    lims = Mock()
+    lims.get_reagent_types.return_value = [Mock(sequence="AAA-CCC")]
+    catalog = ReagentCatalog(lims=lims)
+    catalog.get_sequences(label="IDT_10nt_UDI_1 (AAA-CCC)")
+
+    # WHEN the sequence is edited in lims and the catalog is reset
+    lims.get_reagent_types.return_value = [Mock(sequence="AAA-CCG")]
+    catalog.reset()
+
+    # THEN the label is looked up again
+    assert catalog.get_sequences(label="IDT_10nt_UDI_1 (AAA-CCC)") == ["AAA-CCG"]
+    assert lims.get_reagent_types.call_count == 2
+
+
+def test_persisted_catalog_reused_while_version_unchanged(tmp_path: Path, mocker):
+    # GIVEN a lims with two reagent types, and a catalog synced to a file
+    lims = Mock()
+    lims.get.return_value = ElementTree.fromstring(REAGENT_TYPES_XML)
+    reagent_type = mocker.patch(
+        "cg_lims.get.reagent_catalog.ReagentType",
+        side_effect=lambda lims, uri: Mock(sequence=uri[-1] * 3),
+    )
+    reagent_type._URI = "reagenttypes"
+    reagent_type._TAG = "reagent-type"
+    catalog_file: Path = tmp_path / "reagent_catalog.json"
+    ReagentCatalog(lims=lims, path=str(catalog_file)).sync()
+    assert reagent_type.call_count == 2
+
+    # WHEN syncing a new catalog from the same file, while the reagent types are unchanged
+    catalog = ReagentCatalog(lims=lims, path=str(catalog_file))
+    catalog.sync()
+
+    # THEN no reagent type is fetched again and labels are answered from the file
+    assert reagent_type.call_count == 2
+    assert catalog.get_sequences(label="IDT_10nt_UDI_2 (GGG-TTT)") == ["222"]
+
+    # THEN labels not in lims are not looked up
+    assert catalog.get_sequences(label="unknown") == []
+    lims.get_reagent_types.assert_not_called()
+
+
+def test_persisted_catalog_rebuilt_after_a_day(tmp_path: Path, mocker):
+    # GIVEN a catalog synced to a file a day ago, with unchanged reagent types in lims
+    lims = Mock()
+    lims.get.return_value = ElementTree.fromstring(REAGENT_TYPES_XML)
+    reagent_type = mocker.patch(
+        "cg_lims.get.reagent_catalog.ReagentType",
+        side_effect=lambda lims, uri: Mock(sequence=uri[-1] * 3),
+    )
+    reagent_type._URI = "reagenttypes"
+    reagent_type._TAG = "reagent-type"
+    clock = mocker.patch("cg_lims.get.reagent_catalog.time")
+    clock.time.return_value = 1000.0
+    catalog_file: Path = tmp_path / "reagent_catalog.json"
+    ReagentCatalog(lims=lims, path=str(catalog_file)).sync()
+
+    # WHEN a sequence has been edited in lims and the catalog is synced a day later
+    reagent_type.side_effect = lambda lims, uri: Mock(sequence=uri[-1] * 4)
+    clock.time.return_value = 1000.0 + DEFAULT_MAX_AGE_SECONDS + 1
+    catalog = ReagentCatalog(lims=lims, path=str(catalog_file))
+    catalog.sync()
+
+    # THEN all reagent types are fetched again and the edited sequence is returned
+    assert reagent_type.call_count == 4
+    assert catalog.get_sequences(label="IDT_10nt_UDI_2 (GGG-TTT)") == ["2222"]
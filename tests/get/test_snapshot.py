@@ -0,0 +1,34 @@
+from cg_lims.get.snapshot import ProcessSnapshot
+from genologics.entities import Process
+from genologics.lims import Lims
+from tests.conftest import server
+
+
+def test_process_snapshot_lookups(lims: Lims):
+    # GIVEN a process with three input artifacts in three tubes
+    server("reception_control_twist")
+    process = Process(lims, id="24-315065")
+
+    # WHEN building a snapshot of the process
+    snapshot = ProcessSnapshot(process=process)
+
+    # THEN the artifacts, samples, containers and container types can be looked up by id
+    assert len(snapshot.input_artifacts) == 3
+    assert snapshot.get_sample_ids() == {"ACC9476A2", "ACC9476A3", "ACC9476A23"}
+    assert snapshot.get_artifact_samples("ACC9476A2PA1") == [snapshot.get_sample("ACC9476A2")]
+    assert snapshot.get_container("27-233381").name
+    assert snapshot.get_container_type("2").name == "Tube"
+
+
+def test_process_snapshot_shares_entities_with_lims_cache(lims: Lims):
+    # GIVEN a loaded snapshot of a process
+    server("reception_control_twist")
+    process = Process(lims, id="24-315065")
+    snapshot = ProcessSnapshot(process=process).load()
+
+    # WHEN walking the process lazily
+    sample = process.all_inputs()[0].samples[0]
+
+    # THEN the same already loaded sample object is reached
+    assert sample is snapshot.get_sample(sample.id)
+    assert sample.root is not None
@@ -0,0 +1,123 @@
+import sys
+
+import click
+import pytest
+from cg_lims.exceptions import LimsError, WriteBackError
+from cg_lims.put.write_back import WriteBackSession, flush_write_back, write_back_session
+from click.testing import CliRunner, Result
+from genologics.entities import Artifact
+from genologics.lims import Lims
+from requests.exceptions import HTTPError
+from tests.conftest import server
+
+
+def test_write_back_session_defers_puts(lims: Lims, mocker):
+    # GIVEN two artifacts and a lims that accepts batch updates
+    server("flat_tests")
+    artifacts = [Artifact(lims, id="1"), Artifact(lims, id="2")]
+    put = mocker.patch.object(Lims, "put")
+    put_batch = mocker.patch.object(Lims, "put_batch")
+
+    # WHEN updating and putting the artifacts twice within a write-back session
+    with WriteBackSession(lims=lims):
+        for artifact in artifacts:
+            artifact.udf["Concentration"] = 1.0
+            artifact.put()
+            artifact.put()
+
+    # THEN no single puts were made and both artifacts were written in one batch call
+    put.assert_not_called()
+    put_batch.assert_called_once_with(artifacts)
+
+
+@pytest.mark.max_requests(artifact_batch_update=1, artifact_put=1)
+def test_write_back_session_without_batch_endpoint(lims: Lims):
+    # GIVEN a lims server without the batch endpoints
+    server("flat_tests")
+    artifact = Artifact(lims, id="1")
+
+    # WHEN updating an artifact within a write-back session
+    with WriteBackSession(lims=lims):
+        artifact.udf["Concentration"] = 2.0
+        artifact.put()
+
+    # THEN the artifact is updated one by one instead
+    artifact.get(force=True)
+    assert artifact.udf["Concentration"] == 2.0
+
+
+def test_write_back_session_reports_failed_entities(lims: Lims, mocker):
+    # GIVEN a lims where batch updates fail and where one of two artifacts can't be updated
+    server("flat_tests")
+    artifacts = [Artifact(lims, id="1"), Artifact(lims, id="2")]
+    mocker.patch.object(Lims, "put_batch", side_effect=HTTPError("400"))
+    mocker.patch.object(Lims, "put", side_effect=[None, HTTPError("400")])
+
+    # WHEN putting the artifacts within a write-back session
+    # THEN a WriteBackError naming the failing artifact is raised
+    with pytest.raises(WriteBackError) as error:
+        with WriteBackSession(lims=lims):
+            for artifact in artifacts:
+                artifact.get()
+                artifact.put()
+
+    assert error.value.message.endswith(": 2")
+
+
+def test_flush_write_back_reports_failures_before_success(lims: Lims, mocker):
+    # GIVEN a group with a write-back session and a command that flushes it before reporting
+    server("flat_tests")
+    mocker.patch.object(Lims, "put_batch", side_effect=HTTPError("400"))
+    mocker.patch.object(Lims, "put", side_effect=HTTPError("400"))
+
+    @click.group()
+    @click.pass_context
+    def udf(ctx):
+        ctx.with_resource(write_back_session(context_object=ctx.obj))
+
+    @udf.command()
+    @click.pass_context
+    def set(ctx):
+        artifact = Artifact(ctx.obj["lims"], id="1")
+        artifact.get()
+        artifact.put()
+        try:
+            flush_write_back(ctx.obj)
+            click.echo("Udfs have been set on all samples.")
+        except LimsError as e:
+            sys.exit(e.message)
+
+    # WHEN the update fails
+    result: Result = CliRunner().invoke(udf, ["set"], obj={"lims": lims})
+
+    # THEN the command fails with the failing artifact and does not report success
+    assert result.exit_code == 1
+    assert "Failed to update the following entities: 1" in result.output
+    assert "successfully" not in result.output
+
+
+def test_write_back_session_fails_group_on_updates_left(lims: Lims, mocker):
+    # GIVEN a group with a write-back session and a command that does not flush it
+    server("flat_tests")
+    mocker.patch.object(Lims, "put_batch", side_effect=HTTPError("400"))
+    mocker.patch.object(Lims, "put", side_effect=HTTPError("400"))
+
+    @click.group()
+    @click.pass_context
+    def udf(ctx):
+        ctx.with_resource(write_back_session(context_object=ctx.obj))
+
+    @udf.command()
+    @click.pass_context
+    def set(ctx):
+        artifact = Artifact(ctx.obj["lims"], id="1")
+        artifact.get()
+        artifact.put()
+
+    # WHEN the update fails as the group exits
+    result: Result = CliRunner().invoke(udf, ["set"], obj={"lims": lims})
+
+    # THEN the command exits with code 1 instead of a traceback
+    assert result.exit_code == 1
+    assert not isinstance(result.exception, WriteBackError)
+    assert "Failed to update the following entities: 1" in result.output
@@ -0,0 +1,110 @@
+"""
+Budgets of the requests a test makes to the lims mock server.
+
+Requests are counted by pattern, named after the entity type and method, eg. artifact_get,
+process_get or artifact_batch_retrieve for POST .../artifacts/batch/retrieve. A test declares its
+budget with a marker, or asserts it with the lims_requests fixture:
+
+    @pytest.mark.max_requests(artifact_get=5, total=8)
+    def test_something(lims):
+        ...
+
+    def test_something_else(lims, lims_requests):
+        ...
+        lims_requests.max_requests(artifact_batch_retrieve=1)
+
+When a budget is exceeded, the test fails with the cg_lims call sites of the requests. Requests
+that the mock server makes to itself, eg. to filter artifacts by process type, are not counted.
+"""
+
+import traceback
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import pytest
+from cg_lims import instrumentation
+from cg_lims.instrumentation import LIMS_ENTITY_TYPES, record_requests
+from requests import PreparedRequest, Response
+
+REPOSITORY = Path(__file__).parents[1]
+PACKAGE = REPOSITORY / "cg_lims"
+TOTAL = "total"
+MAX_CALL_SITES = 5
+
+
+def get_request_pattern(request: PreparedRequest) -> str:
+    """Name of the request, eg. artifact_get or sample_batch_retrieve."""
+    segments: List[str] = [segment for segment in urlparse(request.url).path.split("/") if segment]
+    if "v2" not in segments[:-1]:
+        return f"other_{request.method.lower()}"
+    segments = segments[segments.index("v2") + 1 :]
+    entity_type: str = LIMS_ENTITY_TYPES.get(segments[0], segments[0].rstrip("s"))
+    if len(segments) > 2 and segments[1] == "batch":
+        return f"{entity_type}_batch_{segments[2]}"
+    return f"{entity_type}_{request.method.lower()}"
+
+
+def get_call_site() -> Optional[str]:
+    """The innermost frame in cg_lims, or in the tests if the request was made there. None if the
+    request was not made from this repository, as when the mock server requests itself."""
+    frames: List[traceback.FrameSummary] = [
+        frame
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(str(REPOSITORY))
+        and frame.filename not in [__file__, instrumentation.__file__]
+    ]
+    package_frames = [frame for frame in frames if frame.filename.startswith(str(PACKAGE))]
+    frame: Optional[traceback.FrameSummary] = (package_frames or frames or [None])[-1]
+    if not frame:
+        return None
+    return f"{Path(frame.filename).relative_to(REPOSITORY)}:{frame.lineno} in {frame.name}"
+
+
+class LimsRequests:
+    """Requests to the lims at base_url, counted by pattern and by pattern and call site."""
+
+    def __init__(self, base_url: str):
+        self.host: str = urlparse(base_url).netloc
+        self.counts: Counter = Counter()
+        self.call_sites: Counter = Counter()
+
+    def add(self, request: PreparedRequest, response: Response, stream: bool) -> None:
+        call_site: Optional[str] = get_call_site()
+        if urlparse(request.url).netloc != self.host or not call_site:
+            return
+        pattern: str = get_request_pattern(request)
+        self.counts[pattern] += 1
+        self.call_sites[(pattern, call_site)] += 1
+
+    def get_count(self, pattern: str) -> int:
+        return sum(self.counts.values()) if pattern == TOTAL else self.counts[pattern]
+
+    def get_violations(self, budget: Dict[str, int]) -> List[str]:
+        violations: List[str] = []
+        for pattern, maximum in budget.items():
+            count: int = self.get_count(pattern)
+            if count <= maximum:
+                continue
+            violations.append(f"{pattern}: {count} requests, budget {maximum}")
+            call_sites: List[Tuple[Tuple[str, str], int]] = [
+                (key, calls)
+                for key, calls in self.call_sites.most_common()
+                if pattern == TOTAL or key[0] == pattern
+            ]
+            for (call_pattern, call_site), calls in call_sites[:MAX_CALL_SITES]:
+                violations.append(f"    {calls} x {call_pattern} from {call_site}")
+        return violations
+
+    def max_requests(self, **budget: int) -> None:
+        """Fail the test if any request pattern, or the total, is over its budget."""
+        violations: List[str] = self.get_violations(budget)
+        if violations:
+            pytest.fail("Lims requests over budget:\n" + "\n".join(violations), pytrace=False)
+
+
+def record_lims_requests(base_url: str) -> Iterator[LimsRequests]:
+    lims_requests = LimsRequests(base_url=base_url)
+    with record_requests(on_response=lims_requests.add):
+        yield lims_requests
@@ -0,0 +1,216 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import click
+import pytest
+from cg_lims import options
+from cg_lims.scripts.one_time_scripts.backfill import (
+    BackfillRunner,
+    BackfillState,
+    BackfillSummary,
+    get_backfill_processes,
+    get_default_state_file,
+    run_backfill,
+)
+from click.testing import CliRunner, Result
+from mock import Mock
+
+
+def build_processes(count: int) -> List[Mock]:
+    return [Mock(id=f"24-{number}") for number in range(count)]
+
+
+def test_backfill_retries_failed_processes(tmp_path: Path):
+    # GIVEN a loader that fails the first time it loads one of the processes
+    attempts: Dict[str, int] = {}
+
+    def loader(process: Mock) -> int:
+        attempts[process.id] = attempts.get(process.id, 0) + 1
+        if process.id == "24-3" and attempts[process.id] == 1:
+            raise ValueError("arnold is down")
+        return 2
+
+    state = BackfillState(path=str(tmp_path / "state.jsonl"))
+
+    # WHEN backfilling ten processes over four workers
+    summary: BackfillSummary = BackfillRunner(loader=loader, state=state, workers=4).run(
+        processes=build_processes(10)
+    )
+
+    # THEN all processes are loaded, the failing one after a retry
+    assert summary.loaded == 10
+    assert summary.documents == 20
+    assert summary.failed == []
+    assert attempts["24-3"] == 2
+
+    # THEN one line is appended per attempt, and every process is checkpointed as completed
+    lines: List[str] = (tmp_path / "state.jsonl").read_text().splitlines()
+    assert len(lines) == 11
+    assert json.loads(lines[-1])["error"] is None
+    resumed = BackfillState(path=str(tmp_path / "state.jsonl"))
+    assert len(resumed.completed) == 10
+    assert resumed.failed == {}
+
+
+def test_backfill_resumes_from_state(tmp_path: Path):
+    # GIVEN a state file from a stopped backfill where one process kept failing, and where the
+    # last line was cut off
+    state_file: Path = tmp_path / "state.jsonl"
+    entries: List[Dict] = [
+        {"id": "24-0", "error": None},
+        {"id": "24-1", "error": "arnold is down"},
+        {"id": "24-1", "error": None},
+        {"id": "24-2", "error": "arnold is down"},
+    ]
+    state_file.write_text(
+        "".join(f"{json.dumps(entry)}\n" for entry in entries) + '{"id": "24-3", "err'
+    )
+    loaded: List[str] = []
+
+    def loader(process: Mock) -> int:
+        loaded.append(process.id)
+        return 1
+
+    # WHEN resuming the backfill
+    summary: BackfillSummary = BackfillRunner(
+        loader=loader, state=BackfillState(path=str(state_file))
+    ).run(processes=build_processes(4))
+
+    # THEN only the processes not completed are loaded
+    assert sorted(loaded) == ["24-2", "24-3"]
+    assert summary.skipped == 2
+
+
+def test_backfill_reports_processes_failing_all_retries(tmp_path: Path):
+    # GIVEN a loader that always fails for one process
+    def loader(process: Mock) -> int:
+        if process.id == "24-1":
+            raise ValueError("invalid document")
+        return 1
+
+    state = BackfillState(path=str(tmp_path / "state.jsonl"))
+
+    # WHEN backfilling with one retry
+    summary: BackfillSummary = BackfillRunner(loader=loader, state=state, retries=1).run(
+        processes=build_processes(3)
+    )
+
+    # THEN the process is reported as failed, with its error kept in the state
+    assert summary.failed == ["24-1"]
+    assert state.failed == {"24-1": "invalid document"}
+
+
+def test_get_backfill_processes_since():
+    # GIVEN a lims
+    lims = Mock()
+
+    # WHEN getting the processes modified since a date
+    get_backfill_processes(
+        lims=lims, process_types=["NovaSeq Run"], since=datetime(year=2024, month=1, day=31)
+    )
+
+    # THEN lims is asked for processes modified since the start of that day
+    lims.get_processes.assert_called_once_with(
+        type=["NovaSeq Run"], last_modified="2024-01-31T00:00:00Z"
+    )
+
+
+def test_since_rejects_invalid_dates():
+    # GIVEN a command with the since option
+    @click.command()
+    @options.since()
+    def backfill(since: datetime):
+        click.echo(since.isoformat())
+
+    # WHEN giving a valid date and a date in another format
+    valid: Result = CliRunner().invoke(backfill, ["--since", "2024-01-31"])
+    invalid: Result = CliRunner().invoke(backfill, ["--since", "2024/01/31"])
+
+    # THEN the valid date is parsed and the other is rejected
+    assert valid.output.strip() == "2024-01-31T00:00:00"
+    assert invalid.exit_code == 2
+
+
+def test_default_state_file_depends_on_parameters():
+    # GIVEN a backfill command with the since option
+    @click.command()
+    @options.since()
+    @options.workers(default=1)
+    @click.pass_context
+    def backfill(ctx, since: datetime, workers: int):
+        click.echo(get_default_state_file(ctx))
+
+    # WHEN getting the default state file for different parameters
+    first: Result = CliRunner().invoke(backfill, ["--since", "2024-01-31"])
+    other_workers: Result = CliRunner().invoke(
+        backfill, ["--since", "2024-01-31", "--workers", "2"]
+    )
+    other_since: Result = CliRunner().invoke(backfill, ["--since", "2024-02-01"])
+
+    # THEN the state file is named after the command, and only changes with the processes loaded
+    assert first.output.startswith("backfill_")
+    assert first.output == other_workers.output
+    assert first.output != other_since.output
+
+
+def test_run_backfill_starts_over_unless_resumed(tmp_path: Path):
+    # GIVEN a state file of a completed backfill
+    state_file: Path = tmp_path / "state.jsonl"
+    state_file.write_text(json.dumps({"id": "24-0", "error": None}) + "\n")
+    lims = Mock()
+    lims.get_processes.return_value = build_processes(1)
+    loader = Mock(return_value=1)
+
+    # WHEN running the backfill again without resuming it
+    run_backfill(
+        lims=lims,
+        process_types=["NovaSeq Run"],
+        loader=loader,
+        state_file=str(state_file),
+        resume=False,
+        since=None,
+        workers=1,
+        retries=0,
+    )
+
+    # THEN the completed process is loaded again
+    loader.assert_called_once()
+
+    # WHEN resuming the backfill
+    run_backfill(
+        lims=lims,
+        process_types=["NovaSeq Run"],
+        loader=loader,
+        state_file=str(state_file),
+        resume=True,
+        since=None,
+        workers=1,
+        retries=0,
+    )
+
+    # THEN the completed process is skipped
+    loader.assert_called_once()
+
+
+def test_run_backfill_exits_with_error_on_failed_processes(tmp_path: Path):
+    # GIVEN a loader that fails
+    lims = Mock()
+    lims.get_processes.return_value = build_processes(1)
+    loader = Mock(side_effect=ValueError("arnold is down"))
+
+    # WHEN running the backfill
+    # THEN it exits with an error naming the failed process
+    with pytest.raises(SystemExit) as error:
+        run_backfill(
+            lims=lims,
+            process_types=["NovaSeq Run"],
+            loader=loader,
+            state_file=str(tmp_path / "state.jsonl"),
+            resume=False,
+            since=None,
+            workers=1,
+            retries=0,
+        )
+    assert "24-0" in str(error.value.code)
@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+
+from cg_lims.clients.cg.application_tag_cache import ApplicationTagCache
+from cg_lims.clients.cg.async_status_db_api import gather_application_tags
+from cg_lims.clients.cg.status_db_api import StatusDBAPI
+from mock import Mock
+
+
+def test_cache_get_missing_key():
+    # GIVEN an empty application tag cache
+    cache = ApplicationTagCache()
+
+    # WHEN getting a key that was never set
+    result = cache.get("/applications/WGSPCFC030")
+
+    # THEN None is returned and the miss is counted
+    assert result is None
+    assert cache.misses == 1
+
+
+def test_cache_entry_expires():
+    # GIVEN a cache with a ttl of zero seconds holding an application tag
+    cache = ApplicationTagCache(ttl=0)
+    cache.set("/applications/WGSPCFC030", {"target_reads": 30})
+
+    # WHEN getting the application tag
+    result = cache.get("/applications/WGSPCFC030")
+
+    # THEN the entry is considered expired
+    assert result is None
+
+
+def test_cache_is_shared_through_file(tmp_path: Path):
+    # GIVEN a cache backed by a file holding an application tag
+    cache_file: Path = tmp_path / "application_tags.json"
+    ApplicationTagCache(path=str(cache_file)).set("/applications/WGSPCFC030", {"target_reads": 30})
+
+    # WHEN a new cache is created from the same file
+    cache = ApplicationTagCache(path=str(cache_file))
+
+    # THEN the application tag is served from the file
+    assert cache.get("/applications/WGSPCFC030") == {"target_reads": 30}
+    assert cache.hits == 1
+    assert "/applications/WGSPCFC030" in json.loads(cache_file.read_text())
+
+
+def test_cache_file_keeps_entries_of_concurrent_caches(tmp_path: Path):
+    # GIVEN two caches, as in two concurrent EPPs, created from the same file
+    cache_file: Path = tmp_path / "application_tags.json"
+    first_cache = ApplicationTagCache(path=str(cache_file))
+    second_cache = ApplicationTagCache(path=str(cache_file))
+
+    # WHEN each cache sets a different application tag
+    first_cache.set("/applications/WGSPCFC030", {"target_reads": 30})
+    second_cache.set("/applications/RMLP05R800", {"target_reads": 800})
+
+    # THEN the file holds the application tags of both caches
+    cache = ApplicationTagCache(path=str(cache_file))
+    assert cache.get("/applications/WGSPCFC030") == {"target_reads": 30}
+    assert cache.get("/applications/RMLP05R800") == {"target_reads": 800}
+
+
+def test_get_application_tag_is_memoized(mocker):
+    # GIVEN a StatusDB client whose session returns an application tag
+    status_db_api_client = StatusDBAPI(base_url="https://something")
+    response = Mock(ok=True, text=json.dumps({"tag": "WGSPCFC030", "target_reads": 30}))
+    session_get = mocker.patch.object(status_db_api_client.session, "get", return_value=response)
+
+    # WHEN prefetching the application tags of several samples and then looking one up
+    gather_application_tags(
+        status_db=status_db_api_client, tag_names=["WGSPCFC030", "WGSPCFC030", None]
+    )
+    target_reads = status_db_api_client.get_application_tag(
+        tag_name="WGSPCFC030", key="target_reads"
+    )
+
+    # THEN clinical-api is only asked once
+    assert target_reads == 30
+    assert session_get.call_count == 1
+
+
+def test_get_application_tag_failed_response_not_cached(mocker):
+    # GIVEN a StatusDB client whose session returns a failed response
+    status_db_api_client = StatusDBAPI(base_url="https://something")
+    response = Mock(ok=False, text=json.dumps({"detail": "Not found"}))
+    session_get = mocker.patch.object(status_db_api_client.session, "get", return_value=response)
+
+    # WHEN looking up the application tag twice
+    status_db_api_client.get_application_tag(tag_name="MISSING")
+    status_db_api_client.get_application_tag(tag_name="MISSING")
+
+    # THEN clinical-api is asked both times
+    assert session_get.call_count == 2
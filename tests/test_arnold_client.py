@@ -0,0 +1,83 @@
+import gzip
+import json
+from typing import Dict, Iterator, List
+
+import pytest
+import requests
+from cg_lims.clients.arnold.arnold_client import ArnoldClient, BodyFormat, UploadResult
+from cg_lims.exceptions import LimsError
+from mock import Mock
+
+
+def generate_documents(count: int) -> Iterator[Dict]:
+    for number in range(count):
+        yield {"_id": f"ACC{number}A1_step", "sample_id": f"ACC{number}A1"}
+
+
+def test_send_documents_in_compressed_ndjson_chunks(mocker):
+    # GIVEN an arnold client sending gzip compressed NDJSON in chunks of two documents
+    arnold_client = ArnoldClient(
+        host="http://arnold", chunk_size=2, body_format=BodyFormat.NDJSON, compress=True
+    )
+    request = mocker.patch.object(arnold_client.session, "request", return_value=Mock(ok=True))
+    uploaded: List[List[Dict]] = []
+
+    # WHEN sending five documents from a generator
+    result: UploadResult = arnold_client.send_documents(
+        method="put", endpoint="steps", documents=generate_documents(5), on_uploaded=uploaded.append
+    )
+
+    # THEN three compressed requests are made, holding all documents in order
+    assert result == UploadResult(uploaded_count=5, errors=[])
+    assert request.call_count == 3
+    sent: List[Dict] = []
+    for call in request.call_args_list:
+        assert call.kwargs["headers"] == {
+            "Content-Type": "application/x-ndjson",
+            "Content-Encoding": "gzip",
+        }
+        lines: List[str] = gzip.decompress(call.kwargs["data"]).decode().splitlines()
+        sent.extend(json.loads(line) for line in lines)
+    assert sent == list(generate_documents(5))
+
+    # THEN each accepted chunk is reported
+    assert [len(chunk) for chunk in uploaded] == [2, 2, 1]
+
+
+def test_send_documents_reports_failed_chunks(mocker):
+    # GIVEN an arnold client where the second chunk is rejected and the third can not be sent
+    arnold_client = ArnoldClient(host="http://arnold", chunk_size=2)
+    mocker.patch.object(
+        arnold_client.session,
+        "request",
+        side_effect=[
+            Mock(ok=True),
+            Mock(ok=False, text="invalid document"),
+            requests.ConnectionError("no connection"),
+        ],
+    )
+
+    # WHEN sending five documents as JSON arrays
+    result: UploadResult = arnold_client.send_documents(
+        method="post", endpoint="steps", documents=generate_documents(5)
+    )
+
+    # THEN the first chunk is uploaded and the failing chunks are reported
+    assert result.uploaded_count == 2
+    assert not result.ok
+    assert result.get_error_summary() == (
+        "documents 2-3: invalid document; documents 4-4: no connection"
+    )
+
+
+def test_send_document_rejected(mocker):
+    # GIVEN an arnold client where the document is rejected
+    arnold_client = ArnoldClient(host="http://arnold")
+    mocker.patch.object(
+        arnold_client.session, "request", return_value=Mock(ok=False, text="invalid document")
+    )
+
+    # WHEN sending a single document
+    # THEN a LimsError is raised
+    with pytest.raises(LimsError):
+        arnold_client.send_document(method="post", endpoint="flow_cell", document="{}")
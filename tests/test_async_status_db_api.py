@@ -0,0 +1,136 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Dict, List
+
+import pytest
+import requests
+from cg_lims.clients.cg.async_status_db_api import AsyncStatusDBAPI, gather_application_tags
+from cg_lims.clients.cg.status_db_api import StatusDBAPI
+from cg_lims.exceptions import CgAPIClientConnectionError, LimsError
+from mock import Mock
+
+
+def application_tag_response(url: str, **kwargs) -> Mock:
+    tag_name: str = url.rsplit("/", 1)[-1]
+    if tag_name == "MISSING":
+        return Mock(ok=False, text=json.dumps({"detail": "Not found"}))
+    return Mock(ok=True, text=json.dumps({"tag": tag_name, "target_reads": len(tag_name)}))
+
+
+def test_gather_application_tags(mocker):
+    # GIVEN a StatusDB client where one of the application tags does not exist
+    status_db_api_client = StatusDBAPI(base_url="https://something")
+    session_get = mocker.patch.object(
+        status_db_api_client.session, "get", side_effect=application_tag_response
+    )
+
+    # WHEN gathering the target reads of the application tags of a list of samples
+    target_reads: Dict = gather_application_tags(
+        status_db=status_db_api_client,
+        tag_names=["WGSPCFC030", "RMLP05R800", "WGSPCFC030", None, "MISSING"],
+        key="target_reads",
+    )
+
+    # THEN each existing tag is returned and every distinct tag was requested once
+    assert target_reads == {"WGSPCFC030": 10, "RMLP05R800": 10}
+    assert session_get.call_count == 3
+
+
+def test_gather_application_tags_bounded_concurrency(mocker):
+    # GIVEN a StatusDB client with slow responses
+    status_db_api_client = StatusDBAPI(base_url="https://something")
+    in_flight: List[int] = [0]
+    max_in_flight: List[int] = [0]
+    lock = threading.Lock()
+
+    def slow_response(url: str, **kwargs) -> Mock:
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return application_tag_response(url)
+
+    mocker.patch.object(status_db_api_client.session, "get", side_effect=slow_response)
+
+    # WHEN gathering twenty application tags, at most four at a time
+    application_tags: Dict = gather_application_tags(
+        status_db=status_db_api_client,
+        tag_names=[f"TAG{number}" for number in range(20)],
+        max_concurrency=4,
+    )
+
+    # THEN all tags are fetched, concurrently but never more than four at a time
+    assert len(application_tags) == 20
+    assert 1 < max_in_flight[0] <= 4
+
+
+def test_async_status_db_api_retries_connection_errors(mocker):
+    # GIVEN a StatusDB client that loses the connection once
+    status_db_api_client = StatusDBAPI(base_url="https://something")
+    mocker.patch.object(
+        status_db_api_client.session,
+        "get",
+        side_effect=[requests.ConnectionError(), application_tag_response("/applications/TAG")],
+    )
+    mocker.patch("cg_lims.clients.cg.async_status_db_api.RETRY_BACKOFF", 0)
+    async_status_db = AsyncStatusDBAPI(status_db=status_db_api_client)
+
+    # WHEN fetching an application tag
+    application_tag: Dict = asyncio.run(async_status_db.get_application_tag(tag_name="TAG"))
+    async_status_db.close()
+
+    # THEN the request is retried and succeeds
+    assert application_tag == {"tag": "TAG", "target_reads": 3}
+
+
+def test_async_status_db_api_gives_up_after_retries(mocker):
+    # GIVEN a StatusDB client without connection to clinical-api
+    status_db_api_client = StatusDBAPI(base_url="https://something")
+    session_get = mocker.patch.object(
+        status_db_api_client.session, "get", side_effect=requests.ConnectionError()
+    )
+    mocker.patch("cg_lims.clients.cg.async_status_db_api.RETRY_BACKOFF", 0)
+    async_status_db = AsyncStatusDBAPI(status_db=status_db_api_client, retries=2)
+
+    # WHEN fetching an application tag
+    # THEN the error is raised after the retries
+    with pytest.raises(CgAPIClientConnectionError):
+        asyncio.run(async_status_db.get_application_tag(tag_name="TAG"))
+    async_status_db.close()
+    assert session_get.call_count == 3
+
+
+def test_async_status_db_api_does_not_retry_other_errors(mocker):
+    # GIVEN a StatusDB client that fails to find an application tag
+    status_db_api_client = StatusDBAPI(base_url="https://something")
+    get_application_tag = mocker.patch.object(
+        status_db_api_client, "get_application_tag", side_effect=LimsError("Unknown tag")
+    )
+    async_status_db = AsyncStatusDBAPI(status_db=status_db_api_client, retries=2)
+
+    # WHEN fetching the application tag
+    # THEN the error is raised without retrying
+    with pytest.raises(LimsError):
+        asyncio.run(async_status_db.get_application_tag(tag_name="TAG"))
+    async_status_db.close()
+    get_application_tag.assert_called_once()
+
+
+def test_async_status_db_api_does_not_retry_past_deadline(mocker):
+    # GIVEN a StatusDB client that answers slower than the deadline
+    status_db_api_client = StatusDBAPI(base_url="https://something")
+    get_application_tag = mocker.patch.object(
+        status_db_api_client, "get_application_tag", side_effect=lambda **kwargs: time.sleep(0.2)
+    )
+    async_status_db = AsyncStatusDBAPI(status_db=status_db_api_client, deadline=0.05, retries=2)
+
+    # WHEN fetching an application tag
+    # THEN the deadline error is raised without retrying
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(async_status_db.get_application_tag(tag_name="TAG"))
+    async_status_db.close()
+    get_application_tag.assert_called_once()
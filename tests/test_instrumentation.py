@@ -0,0 +1,122 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict
+
+import click
+import pytest
+import requests
+from cg_lims.instrumentation import Instrumentation, RequestStatistics, get_lims_entity_type
+from cg_lims.lazy import LazyGroup
+from click.testing import CliRunner, Result
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+SERVICE_HOSTS: Dict[str, str] = {
+    "lims": "https://lims.example.com",
+    "status_db": "https://cg.example.com/api",
+    "arnold": "http://arnold.example.com",
+    "atlas": None,
+    "smrt_link": "smrtlink.example.com",
+}
+
+
+def build_response(request: requests.PreparedRequest, **kwargs) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"<artifact/>"
+    response.headers = CaseInsensitiveDict()
+    response.url = request.url
+    response.request = request
+    return response
+
+
+@pytest.fixture
+def send(mocker):
+    """HTTPAdapter.send answering every request without a connection."""
+    return mocker.patch.object(
+        HTTPAdapter, "send", autospec=True, side_effect=lambda _, r, **k: build_response(r)
+    )
+
+
+@pytest.mark.parametrize(
+    "url, entity_type",
+    [
+        ("https://lims.example.com/api/v2/artifacts/2-123", "artifact"),
+        ("https://lims.example.com/api/v2/samples/batch/retrieve", "sample"),
+        ("https://lims.example.com/api/v2/reagenttypes?name=UDI", "reagenttype"),
+        ("https://lims.example.com/api/v2/containertypes/1", "other"),
+        ("https://lims.example.com/api", "other"),
+    ],
+)
+def test_get_lims_entity_type(url: str, entity_type: str):
+    # WHEN getting the entity type of a lims url
+    # THEN it is the singular entity name, or other
+    assert get_lims_entity_type(url) == entity_type
+
+
+def test_request_statistics(send):
+    # GIVEN requests statistics for the configured services
+    session = requests.Session()
+
+    # WHEN making requests to the services, through a session and module level calls
+    with RequestStatistics(service_hosts=SERVICE_HOSTS) as statistics:
+        session.get("https://lims.example.com/api/v2/artifacts/2-1")
+        session.get("https://lims.example.com/api/v2/artifacts/2-2")
+        session.post("https://lims.example.com/api/v2/samples/batch/retrieve", data="<links/>")
+        requests.put("https://lims.example.com/api/v2/artifacts/2-1", data="<artifact/>")
+        session.get("https://cg.example.com/api/applications/WGSPCFC030")
+        requests.get("https://smrtlink.example.com:8243/SMRTLink/runs")
+        requests.get("https://elsewhere.example.com")
+
+    # THEN lims calls are counted by method and entity type, with their bytes
+    summary: Dict = statistics.get_summary()
+    assert summary["lims"] == {
+        "GET": {"calls": 2, "bytes": 22, "entities": {"artifact": 2}},
+        "PUT": {"calls": 1, "bytes": 22, "entities": {"artifact": 1}},
+        "POST": {"calls": 1, "bytes": 19, "entities": {"sample": 1}},
+    }
+
+    # THEN the calls of the other services are counted
+    assert summary["services"] == {
+        "status_db": 1,
+        "arnold": 0,
+        "atlas": 0,
+        "smrt_link": 1,
+        "other": 1,
+    }
+
+    # THEN requests are not recorded after the statistics exit
+    session.get("https://lims.example.com/api/v2/artifacts/2-3")
+    assert statistics.get_summary()["lims"]["GET"]["calls"] == 2
+
+
+def test_command_recorder(send, tmp_path: Path, caplog):
+    # GIVEN a group that records its commands, with a metrics file
+    metrics_file: Path = tmp_path / "metrics.jsonl"
+    instrumentation = Instrumentation(service_hosts=SERVICE_HOSTS, metrics_file=str(metrics_file))
+
+    @click.group(cls=LazyGroup)
+    @click.pass_context
+    def epps(ctx):
+        ctx.with_resource(instrumentation.record(ctx))
+
+    @epps.command("copy")
+    def copy():
+        requests.get("https://lims.example.com/api/v2/processes/24-1")
+
+    # WHEN running a command of the group
+    with caplog.at_level(logging.INFO):
+        result: Result = CliRunner().invoke(epps, ["copy"])
+
+    # THEN a summary line of the command is logged
+    assert result.exit_code == 0
+    assert "Performance of epps copy" in caplog.text
+    assert "GET 1 (process 1)" in caplog.text
+
+    # THEN the summary is written to the metrics file
+    metrics: Dict = json.loads(metrics_file.read_text())
+    assert metrics["command"] == "epps copy"
+    assert metrics["lims"]["GET"]["entities"] == {"process": 1}
+    assert metrics["wall_seconds"] >= 0
+    assert metrics["peak_rss_mib"] > 0
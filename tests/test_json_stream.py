@@ -0,0 +1,70 @@
+import json
+from typing import Dict, List
+
+import pytest
+from cg_lims.clients.cg.json_stream import iter_json_array
+from tests.conftest import iter_json_chunks
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+def test_iter_json_array_any_chunk_size(chunk_size: int):
+    # GIVEN a json array with numbers, strings with multibyte characters and nested objects
+    elements: List = [1, 2.5, -300, "Åsa ☃", {"reads": [10, 20], "name": "x"}, None, True]
+
+    # WHEN decoding it from chunks of any size
+    result = list(iter_json_array(chunks=iter_json_chunks(elements, chunk_size=chunk_size)))
+
+    # THEN all elements should be yielded, numbers split over chunks included
+    assert result == elements
+
+
+def test_iter_json_array_under_key():
+    # GIVEN a json object with the array under a key, after other members
+    content: Dict = {"count": 2, "other": {"metrics": []}, "metrics": [{"a": 1}, {"a": 2}]}
+
+    # WHEN decoding the array under the key
+    result = list(iter_json_array(chunks=iter_json_chunks(content, chunk_size=3), key="metrics"))
+
+    # THEN the elements of that array should be yielded
+    assert result == [{"a": 1}, {"a": 2}]
+
+
+def test_iter_json_array_is_lazy():
+    # GIVEN a stream whose second chunk is not yet available
+    def chunks():
+        yield b'[{"a": 1}, '
+        raise AssertionError("Read past the first element")
+
+    # WHEN decoding the first element
+    first = next(iter_json_array(chunks=chunks()))
+
+    # THEN it should be yielded without reading further
+    assert first == {"a": 1}
+
+
+def test_iter_json_array_empty():
+    # GIVEN an empty json array
+    # WHEN decoding it
+    # THEN nothing should be yielded
+    assert list(iter_json_array(chunks=[b" [ ] "])) == []
+
+
+@pytest.mark.parametrize(
+    "content, key",
+    [(b'[{"a": 1}', None), (b'{"a": 1}', None), (b'{"runs": []}', "metrics"), (b"[1 2]", None)],
+)
+def test_iter_json_array_invalid(content: bytes, key: str):
+    # GIVEN a truncated or malformed stream
+    # WHEN decoding it
+    # THEN a value error should be raised
+    with pytest.raises(ValueError):
+        list(iter_json_array(chunks=[content], key=key))
+
+
+def test_iter_json_array_matches_json_loads(sequencing_metrics_json: List[Dict]):
+    # GIVEN a sequencing metrics response body
+    content: bytes = json.dumps(sequencing_metrics_json).encode()
+
+    # WHEN decoding it in a stream
+    # THEN the result should be identical to decoding it at once
+    assert list(iter_json_array(chunks=[content])) == json.loads(content)
@@ -0,0 +1,138 @@
+import subprocess
+import sys
+from typing import List
+
+import click
+import pytest
+from cg_lims.commands.base import cli
+from cg_lims.lazy import LazyContextObject, LazyGroup
+from click.testing import CliRunner, Result
+from mock import Mock
+
+
+def iter_groups(group: click.Group, ctx: click.Context):
+    yield group
+    for name in group.list_commands(ctx):
+        command: click.Command = group.get_command(ctx, name)
+        if isinstance(command, click.Group):
+            yield from iter_groups(command, ctx)
+
+
+def test_all_lazy_subcommands_resolve():
+    # GIVEN the cli command tree
+    ctx = click.Context(cli)
+
+    # WHEN resolving every subcommand of every group
+    for group in iter_groups(cli, ctx):
+        # THEN each lazy subcommand imports to a command registered under its own name
+        for name in group.list_commands(ctx):
+            command: click.Command = group.get_command(ctx, name)
+            assert command is not None
+            assert command.name == name
+
+
+def test_lazy_group_imports_on_lookup(mocker):
+    # GIVEN a lazy group with a command that is not imported yet
+    command = click.Command(name="copy")
+    import_module = mocker.patch(
+        "cg_lims.lazy.importlib.import_module", return_value=Mock(copy=command)
+    )
+    group = LazyGroup(name="udf", lazy_subcommands={"copy": "some.module:copy"})
+    ctx = click.Context(group)
+
+    # WHEN listing the commands
+    names: List[str] = group.list_commands(ctx)
+
+    # THEN the command is listed without importing its module
+    assert names == ["copy"]
+    import_module.assert_not_called()
+
+    # WHEN looking the command up twice
+    group.get_command(ctx, "copy")
+
+    # THEN its module is imported once
+    assert group.get_command(ctx, "copy") is command
+    import_module.assert_called_once_with("some.module")
+
+
+def test_lazy_group_not_a_command(mocker):
+    # GIVEN a lazy subcommand pointing at something that is not a click command
+    mocker.patch("cg_lims.lazy.importlib.import_module", return_value=Mock(copy="not a command"))
+    group = LazyGroup(name="udf", lazy_subcommands={"copy": "some.module:copy"})
+
+    # WHEN looking it up
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        group.get_command(click.Context(group), "copy")
+
+
+def test_lazy_context_object_calls_factory_once():
+    # GIVEN a context object with a registered factory
+    factory = Mock(return_value="client")
+    context_object = LazyContextObject({"lims": "lims"})
+    context_object.set_factory("status_db", factory)
+
+    # WHEN the key was not looked up
+    # THEN the factory is not called but the key is present
+    assert "status_db" in context_object
+    factory.assert_not_called()
+
+    # WHEN looking the key up twice
+    assert context_object["status_db"] == "client"
+    assert context_object.get("status_db") == "client"
+
+    # THEN the factory was called once
+    factory.assert_called_once()
+
+    # THEN unknown keys behave as in a dict
+    assert context_object.get("missing") is None
+    with pytest.raises(KeyError):
+        context_object["missing"]
+
+
+def test_single_command_does_not_import_heavy_dependencies():
+    # GIVEN a new python process
+    # WHEN resolving a single EPP and building its help
+    code = (
+        "import sys\n"
+        "import click\n"
+        "from cg_lims.commands.base import cli\n"
+        "ctx = click.Context(cli)\n"
+        "copy = cli.get_command(ctx, 'epps').get_command(ctx, 'udf').get_command(ctx, 'copy')\n"
+        "copy.get_help(ctx)\n"
+        "print(' '.join(name for name in ('pandas', 'matplotlib', 'openpyxl', 'google.auth', "
+        "'cg_lims.clients.cg.models') if name in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    # THEN none of the heavy dependencies are imported
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+def test_cli_help_lists_commands(config):
+    # WHEN showing the help of the epps group
+    result: Result = CliRunner().invoke(cli, ["-c", config, "epps", "--help"])
+
+    # THEN the lazy subcommands are listed
+    assert result.exit_code == 0
+    for name in ["arnold-upload", "files", "move", "qc", "udf"]:
+        assert name in result.output
+
+
+def test_lazy_context_object_child_shares_created_objects():
+    # GIVEN a context object with a factory, and a child of it
+    factory = Mock(return_value="client")
+    context_object = LazyContextObject({"lims": "lims"})
+    context_object.set_factory("status_db", factory)
+    child: LazyContextObject = context_object.child()
+
+    # WHEN the child creates the object and sets a key of its own
+    assert child["status_db"] == "client"
+    child["process"] = "process"
+
+    # THEN the object is kept in the parent for the next child, but the key of the child is not
+    assert context_object.child()["status_db"] == "client"
+    factory.assert_called_once()
+    assert "process" not in context_object
+    assert child["lims"] == "lims"
@@ -0,0 +1,157 @@
+import itertools
+import sqlite3
+from pathlib import Path
+
+from cg_lims.clients.lims_xml_cache import CachingLims, LimsXmlCache
+from genologics.entities import Containertype
+from genologics.lims import Lims
+from mock import Mock
+from tests.conftest import HOST, PORT, server
+
+
+def test_get_entity_type():
+    # GIVEN the uri of a container type
+    uri = "https://lims.scilifelab.se/api/v2/containertypes/2"
+
+    # WHEN getting the entity type of the uri
+    entity_type: str = LimsXmlCache.get_entity_type(uri)
+
+    # THEN the entity type is the first segment after the api version
+    assert entity_type == "containertypes"
+
+
+def test_cached_entity_shared_between_lims_instances(tmp_path: Path, mocker):
+    # GIVEN a container type fetched through a caching lims
+    server("reception_control_twist")
+    cache_file: Path = tmp_path / "lims_cache.sqlite"
+    lims = CachingLims(
+        f"http://{HOST}:{PORT}", "dummy", "dummy", xml_cache=LimsXmlCache(path=str(cache_file))
+    )
+    assert Containertype(lims, id="2").name == "Tube"
+
+    # WHEN a new caching lims with the same cache file fetches the container type again
+    new_lims = CachingLims(
+        f"http://{HOST}:{PORT}", "dummy", "dummy", xml_cache=LimsXmlCache(path=str(cache_file))
+    )
+    request_get = mocker.spy(new_lims.request_session, "get")
+    container_type = Containertype(new_lims, id="2")
+
+    # THEN the container type is served from the cache, without asking the lims
+    assert container_type.name == "Tube"
+    assert request_get.call_count == 0
+    assert new_lims.xml_cache.hits == 1
+
+
+def test_expired_entity_fetched_again(tmp_path: Path, mocker):
+    # GIVEN a caching lims with a container type entry that has an ETag
+    clock = mocker.patch("cg_lims.clients.lims_xml_cache.time")
+    clock.time.return_value = 1000.0
+    xml_cache = LimsXmlCache(path=str(tmp_path / "lims_cache.sqlite"), ttls={"containertypes": 60})
+    lims = CachingLims("https://lims.scilifelab.se", "dummy", "dummy", xml_cache=xml_cache)
+    uri = "https://lims.scilifelab.se/api/v2/containertypes/2"
+    xml_cache.store(uri=uri, xml=b"<type/>", etag='"1"')
+
+    # GIVEN that the ttl of the entry has passed
+    clock.time.return_value = 1061.0
+    entry = xml_cache.lookup(uri)
+    assert entry.xml == b"<type/>"
+    assert not xml_cache.is_fresh(uri=uri, entry=entry)
+
+    # WHEN getting the container type, and the lims answers that it is not modified
+    request_get = mocker.patch.object(
+        lims.request_session, "get", return_value=Mock(status_code=304)
+    )
+    root = lims.get(uri)
+
+    # THEN the entry is revalidated with a conditional request and served from the cache
+    request_get.assert_called_once()
+    assert request_get.call_args.kwargs["headers"]["If-None-Match"] == '"1"'
+    assert root.tag == "type"
+    assert xml_cache.revalidations == 1
+
+    # THEN the entry is fresh again
+    assert xml_cache.is_fresh(uri=uri, entry=xml_cache.lookup(uri))
+
+
+def test_least_recently_used_entries_evicted_on_flush(tmp_path: Path, mocker):
+    # GIVEN a cache that holds at most two entries, with two entries of which the first is used
+    clock = mocker.patch("cg_lims.clients.lims_xml_cache.time")
+    clock.time.side_effect = itertools.count(1000)
+    xml_cache = LimsXmlCache(path=str(tmp_path / "lims_cache.sqlite"), max_entries=2)
+    uri = "https://lims.scilifelab.se/api/v2/containertypes/"
+    xml_cache.store(uri=uri + "1", xml=b"<type/>")
+    xml_cache.store(uri=uri + "2", xml=b"<type/>")
+    xml_cache.touch(uri + "1")
+
+    # WHEN storing a third entry
+    xml_cache.store(uri=uri + "3", xml=b"<type/>")
+
+    # THEN nothing is evicted until the cache is flushed
+    assert len(xml_cache) == 3
+
+    # WHEN flushing the cache
+    xml_cache.flush()
+
+    # THEN the least recently used entry is evicted
+    assert len(xml_cache) == 2
+    assert xml_cache.lookup(uri + "2") is None
+    assert xml_cache.lookup(uri + "1")
+
+
+def test_cache_hits_written_on_flush(tmp_path: Path, mocker):
+    # GIVEN a cache with an entry
+    clock = mocker.patch("cg_lims.clients.lims_xml_cache.time")
+    clock.time.return_value = 1000.0
+    cache_file: Path = tmp_path / "lims_cache.sqlite"
+    xml_cache = LimsXmlCache(path=str(cache_file))
+    uri = "https://lims.scilifelab.se/api/v2/containertypes/2"
+    xml_cache.store(uri=uri, xml=b"<type/>")
+
+    # WHEN the entry is used and revalidated
+    clock.time.return_value = 2000.0
+    xml_cache.touch(uri, revalidated=True)
+
+    # THEN the revalidation is seen by this cache, but not yet written to the file
+    assert xml_cache.lookup(uri).fetched_at == 2000.0
+    assert LimsXmlCache(path=str(cache_file)).lookup(uri).fetched_at == 1000.0
+
+    # WHEN flushing the cache
+    xml_cache.flush()
+
+    # THEN the revalidation is written to the file
+    assert LimsXmlCache(path=str(cache_file)).lookup(uri).fetched_at == 2000.0
+
+
+def test_cache_errors_fall_back_to_lims(tmp_path: Path, mocker):
+    # GIVEN a caching lims whose cache file is locked by another process
+    xml_cache = LimsXmlCache(path=str(tmp_path / "lims_cache.sqlite"))
+    lims = CachingLims("https://lims.scilifelab.se", "dummy", "dummy", xml_cache=xml_cache)
+    mocker.patch.object(
+        xml_cache, "lookup", side_effect=sqlite3.OperationalError("database is locked")
+    )
+    lims_get = mocker.patch.object(Lims, "get", return_value="<type/>")
+
+    # WHEN getting a container type
+    root = lims.get("https://lims.scilifelab.se/api/v2/containertypes/2")
+
+    # THEN the container type is fetched from the lims, without the cache
+    assert root == "<type/>"
+    lims_get.assert_called_once()
+
+
+def test_cache_write_errors_ignored(tmp_path: Path, mocker):
+    # GIVEN a caching lims whose cache file cannot be written
+    xml_cache = LimsXmlCache(path=str(tmp_path / "lims_cache.sqlite"))
+    lims = CachingLims("https://lims.scilifelab.se", "dummy", "dummy", xml_cache=xml_cache)
+    mocker.patch.object(
+        xml_cache, "store", side_effect=sqlite3.OperationalError("attempt to write a readonly")
+    )
+    response = Mock(status_code=200, content=b"<type/>", headers={})
+    mocker.patch.object(lims.request_session, "get", return_value=response)
+    mocker.patch.object(lims, "parse_response", return_value="<type/>")
+
+    # WHEN getting a container type
+    root = lims.get("https://lims.scilifelab.se/api/v2/containertypes/2")
+
+    # THEN the container type from the lims is returned
+    assert root == "<type/>"
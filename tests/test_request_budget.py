@@ -0,0 +1,56 @@
+import pytest
+from cg_lims.get.artifacts import get_latest_analyte
+from genologics.lims import Lims
+from requests import Request
+from tests.conftest import server
+from tests.request_budget import LimsRequests, get_request_pattern
+
+SAMPLE_ID = "ACC7236A52"
+PROCESS_TYPE = "CG002 - Sort HiSeq Samples"
+
+
+@pytest.mark.parametrize(
+    "method, url, pattern",
+    [
+        ("GET", "http://127.0.0.1:8000/api/v2/artifacts/2-1", "artifact_get"),
+        ("GET", "http://127.0.0.1:8000/api/v2/artifacts?samplelimsid=ACC1", "artifact_get"),
+        ("PUT", "http://127.0.0.1:8000/api/v2/processes/24-1", "process_put"),
+        ("POST", "http://127.0.0.1:8000/api/v2/samples/batch/retrieve", "sample_batch_retrieve"),
+        ("GET", "http://127.0.0.1:8000/api/v2/containertypes/1", "containertype_get"),
+    ],
+)
+def test_get_request_pattern(method: str, url: str, pattern: str):
+    # WHEN getting the pattern of a lims request
+    # THEN it is named after the entity type and the method or batch action
+    assert get_request_pattern(Request(method=method, url=url).prepare()) == pattern
+
+
+@pytest.mark.max_requests(artifact_get=4, process_get=2, total=6)
+def test_get_latest_analyte_within_budget(lims: Lims):
+    # GIVEN a sample that has been run through the same type of process three times
+    server("test_get_artifacts")
+
+    # WHEN getting its latest analyte
+    latest_artifact = get_latest_analyte(
+        lims=lims, sample_id=SAMPLE_ID, process_types=[PROCESS_TYPE]
+    )
+
+    # THEN it is found with an artifact search, and a get of each artifact and its parent process
+    assert latest_artifact.parent_process.date_run == "2020-12-28"
+
+
+def test_request_budget_exceeded(lims: Lims, lims_requests: LimsRequests):
+    # GIVEN the latest analyte of a sample has been looked up
+    server("test_get_artifacts")
+    get_latest_analyte(lims=lims, sample_id=SAMPLE_ID, process_types=[PROCESS_TYPE])
+
+    # WHEN asserting a budget that the artifact gets exceed
+    with pytest.raises(pytest.fail.Exception) as failure:
+        lims_requests.max_requests(artifact_get=2, process_get=2)
+
+    # THEN the failure names the pattern and the cg_lims call sites of the requests
+    message: str = str(failure.value)
+    assert "artifact_get: 4 requests, budget 2" in message
+    assert "in get_latest_artifact" in message
+    assert "in get_latest_analyte" in message
+    assert "process_get" not in message
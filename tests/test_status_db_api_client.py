@@ -1,7 +1,12 @@
-from typing import Dict, List
+import logging
+from typing import Callable, Dict, List
 
-from cg_lims.clients.cg.models import SampleLaneSequencingMetrics
+import pytest
+from cg_lims.clients.cg.models import SampleLaneSequencingMetrics, SampleLaneSequencingMetricsRecord
 from cg_lims.clients.cg.status_db_api import StatusDBAPI
+from cg_lims.EPPs.base import log_status_db_statistics
+from cg_lims.exceptions import CgAPIClientDecodeError
+from cg_lims.lazy import LazyContextObject
 from mock import Mock
 
 
@@ -12,7 +17,9 @@ def test_get_sequencing_metrics_for_flow_cell(
     mocker,
 ):
     # GIVEN a json response with sequencing metrics data
-    mocker.patch("requests.get", return_value=mock_sequencing_metrics_get_response)
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=mock_sequencing_metrics_get_response
+    )
 
     # WHEN retrieving sequencing metrics for a flow cell
     result = status_db_api_client.get_sequencing_metrics_for_illumina_flow_cell("flow_cell_name")
@@ -22,3 +29,101 @@ def test_get_sequencing_metrics_for_flow_cell(
         SampleLaneSequencingMetrics.model_validate(data) for data in sequencing_metrics_json
     ]
     assert result == sequencing_metrics
+
+
+def test_iter_sequencing_metrics_for_flow_cell(
+    status_db_api_client: StatusDBAPI,
+    mock_sequencing_metrics_get_response: Mock,
+    sequencing_metrics_json: List[Dict],
+    mocker,
+):
+    # GIVEN a streamed json response with sequencing metrics data
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=mock_sequencing_metrics_get_response
+    )
+
+    # WHEN streaming sequencing metrics for a flow cell
+    result = list(
+        status_db_api_client.iter_sequencing_metrics_for_illumina_flow_cell("flow_cell_name")
+    )
+
+    # THEN compact records of the sequencing metrics should be yielded
+    assert result == [
+        SampleLaneSequencingMetricsRecord.from_json(data) for data in sequencing_metrics_json
+    ]
+    assert result[0].sample_base_percentage_passing_q30 == 95.0
+
+    # THEN the response body was never decoded as a whole
+    mock_sequencing_metrics_get_response.json.assert_not_called()
+
+
+def test_iter_sequencing_metrics_invalid_json(
+    status_db_api_client: StatusDBAPI, mock_response: Callable, mocker
+):
+    # GIVEN a streamed response with a truncated json body
+    response: Mock = mock_response([])
+    response.iter_content.side_effect = lambda **kwargs: iter([b'[{"flow_cell_name": '])
+    mocker.patch.object(status_db_api_client.session, "get", return_value=response)
+
+    # WHEN streaming sequencing metrics for a flow cell
+    # THEN a decode error should be raised
+    with pytest.raises(CgAPIClientDecodeError):
+        list(status_db_api_client.iter_sequencing_metrics_for_illumina_flow_cell("flow_cell_name"))
+
+
+def test_log_status_db_statistics(
+    status_db_api_client: StatusDBAPI,
+    mock_sequencing_metrics_get_response: Mock,
+    mocker,
+    caplog,
+):
+    # GIVEN a context object where the StatusDB client was used for two requests
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=mock_sequencing_metrics_get_response
+    )
+    context_object = LazyContextObject()
+    context_object.set_factory("status_db", lambda: status_db_api_client)
+    for _ in range(2):
+        context_object["status_db"].get_sequencing_metrics_for_illumina_flow_cell("flow_cell")
+
+    # WHEN logging the statistics of the client
+    with caplog.at_level(logging.INFO):
+        log_status_db_statistics(context_object=context_object)
+
+    # THEN the requests are counted
+    assert status_db_api_client.request_count == 2
+    assert "StatusDB: 2 requests in" in caplog.text
+
+
+def test_log_status_db_statistics_without_client(caplog):
+    # GIVEN a context object where the StatusDB client was not created
+    factory = Mock()
+    context_object = LazyContextObject()
+    context_object.set_factory("status_db", factory)
+
+    # WHEN logging the statistics of the client
+    with caplog.at_level(logging.INFO):
+        log_status_db_statistics(context_object=context_object)
+
+    # THEN the client is not created and nothing is logged
+    factory.assert_not_called()
+    assert "StatusDB" not in caplog.text
+
+
+def test_reset_statistics(
+    status_db_api_client: StatusDBAPI, mock_sequencing_metrics_get_response: Mock, mocker
+):
+    # GIVEN a StatusDB client that made a request and refreshed its token
+    status_db_api_client._token_manager.refresh_count = 1
+    mocker.patch.object(
+        status_db_api_client.session, "get", return_value=mock_sequencing_metrics_get_response
+    )
+    status_db_api_client.get_sequencing_metrics_for_illumina_flow_cell("flow_cell")
+
+    # WHEN resetting its statistics and making another request
+    status_db_api_client.reset_statistics()
+    status_db_api_client.get_sequencing_metrics_for_illumina_flow_cell("flow_cell")
+
+    # THEN only the request after the reset is counted
+    assert status_db_api_client.request_count == 1
+    assert status_db_api_client.token_refresh_count == 0
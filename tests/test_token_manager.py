@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+
+from cg_lims.clients.cg.token_manager import TokenManager
+from mock import MagicMock
+
+
+def test_get_token_reuses_valid_token(mocker):
+    # GIVEN a token manager whose credentials produce a token valid for one hour
+    credentials = MagicMock(token="jwt", expiry=datetime.utcnow() + timedelta(hours=1))
+    from_file = mocker.patch(
+        "google.oauth2.service_account.IDTokenCredentials.from_service_account_file",
+        return_value=credentials,
+    )
+    token_manager = TokenManager(
+        service_account_email="email", service_account_auth_file="file", audience="audience"
+    )
+
+    # WHEN getting a token several times
+    tokens = [token_manager.get_token() for _ in range(3)]
+
+    # THEN the service account file is read and the token refreshed only once
+    assert tokens == ["jwt"] * 3
+    from_file.assert_called_once()
+    assert token_manager.refresh_count == 1
+
+
+def test_get_token_refreshes_expiring_token(mocker):
+    # GIVEN a token manager whose credentials produce a token expiring within a minute
+    credentials = MagicMock(token="jwt", expiry=datetime.utcnow() + timedelta(minutes=1))
+    mocker.patch(
+        "google.oauth2.service_account.IDTokenCredentials.from_service_account_file",
+        return_value=credentials,
+    )
+    token_manager = TokenManager(
+        service_account_email="email", service_account_auth_file="file", audience="audience"
+    )
+
+    # WHEN getting a token twice
+    token_manager.get_token()
+    token_manager.get_token()
+
+    # THEN the token is refreshed both times
+    assert token_manager.refresh_count == 2
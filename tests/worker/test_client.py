@@ -0,0 +1,28 @@
+import socket
+from pathlib import Path
+
+from cg_lims.worker.client import main, run_in_worker
+
+
+def test_main_without_worker(mocker, monkeypatch, tmp_path: Path):
+    # GIVEN no worker listening on the socket
+    monkeypatch.setenv("LIMS_WORKER_SOCKET", str(tmp_path / "missing.sock"))
+    cli = mocker.patch("cg_lims.commands.base.cli")
+
+    # WHEN running a command with the client
+    main(args=["-c", "config.yaml", "epps"])
+
+    # THEN the command is run in the client process
+    cli.main.assert_called_once_with(args=["-c", "config.yaml", "epps"], prog_name="lims")
+
+
+def test_run_in_worker_connection_closed():
+    # GIVEN a worker that closes the connection without answering
+    client_connection, worker_connection = socket.socketpair()
+    worker_connection.close()
+
+    # WHEN sending a command
+    response = run_in_worker(connection=client_connection, args=["epps"])
+
+    # THEN the command fails
+    assert response["exit_code"] == 1
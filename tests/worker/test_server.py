@@ -0,0 +1,251 @@
+import logging
+import os
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+import pytest
+from cg_lims.get.reagent_catalog import ReagentCatalog, set_reagent_catalog
+from cg_lims.worker.client import connect, main, run_in_worker
+from cg_lims.worker.server import (
+    MAX_FAILED_STARTS,
+    STARTUP_FAILURE_EXIT_CODE,
+    CommandResult,
+    WarmContext,
+    WorkerPool,
+    handle_connection,
+    run_command,
+    warm_cli,
+)
+from mock import Mock
+
+
+@click.command("lims-id")
+@click.pass_context
+def lims_id(ctx):
+    logging.getLogger(__name__).info("running lims-id")
+    click.echo(id(ctx.obj["lims"]))
+
+
+@click.command("fail")
+def fail():
+    raise click.ClickException("something failed")
+
+
+@click.command("crash")
+def crash():
+    raise ValueError("unexpected")
+
+
+@pytest.fixture
+def warm_context(config: Path, mocker) -> WarmContext:
+    mocker.patch.dict(warm_cli.commands, {"lims-id": lims_id, "fail": fail, "crash": crash})
+    return WarmContext(config=str(config))
+
+
+def test_run_command_reuses_clients(warm_context: WarmContext, config: Path, tmp_path: Path):
+    # GIVEN a warm worker context and a lims entity cached by an earlier command
+    warm_context.context_object["lims"].cache["https://lims/artifacts/1"] = "artifact"
+
+    # WHEN running a command twice
+    results = [
+        run_command(warm_context=warm_context, args=["-c", str(config), "lims-id"], cwd=".")
+        for _ in range(2)
+    ]
+
+    # THEN both runs succeed with the same lims client
+    assert [result.exit_code for result in results] == [0, 0]
+    assert results[0].stdout == results[1].stdout == f"{id(warm_context.context_object['lims'])}\n"
+
+    # THEN the entities cached by earlier commands are dropped
+    assert warm_context.context_object["lims"].cache == {}
+
+
+def test_new_context_object_resets_command_state(warm_context: WarmContext):
+    # GIVEN a warm worker context with a synced reagent catalog and a used StatusDB client
+    lims = warm_context.context_object["lims"]
+    catalog = ReagentCatalog(lims=lims)
+    catalog.synced = True
+    set_reagent_catalog(catalog)
+    status_db = Mock()
+    warm_context.context_object["status_db"] = status_db
+
+    # WHEN creating the context object of the next command
+    warm_context.new_context_object()
+
+    # THEN the reagent catalog is synced again and the StatusDB statistics start from zero
+    assert not catalog.synced
+    status_db.reset_statistics.assert_called_once()
+
+
+def test_run_command_exit_codes(warm_context: WarmContext, config: Path):
+    # WHEN running a command that fails with a click exception
+    result: CommandResult = run_command(
+        warm_context=warm_context, args=["-c", str(config), "fail"], cwd="."
+    )
+
+    # THEN its exit code and message are captured
+    assert result.exit_code == 1
+    assert "something failed" in result.stderr
+
+    # WHEN running a command that raises an unexpected error
+    result = run_command(warm_context=warm_context, args=["-c", str(config), "crash"], cwd=".")
+
+    # THEN the traceback is captured
+    assert result.exit_code == 1
+    assert "ValueError: unexpected" in result.stderr
+
+
+def test_run_command_other_config(warm_context: WarmContext, tmp_path: Path):
+    # GIVEN a config that the worker was not started with
+    other_config: Path = tmp_path / "config.yaml"
+    other_config.touch()
+
+    # WHEN running a command with it
+    result: CommandResult = run_command(
+        warm_context=warm_context, args=["-c", str(other_config), "lims-id"], cwd="."
+    )
+
+    # THEN it is rejected as a usage error
+    assert result.exit_code == 2
+    assert "the worker runs with" in result.stderr
+
+
+def test_client_and_worker_round_trip(warm_context: WarmContext, config: Path):
+    # GIVEN a connected client and worker
+    client_connection, worker_connection = socket.socketpair()
+    worker_thread = threading.Thread(
+        target=handle_connection,
+        kwargs={"connection": worker_connection, "warm_context": warm_context},
+    )
+    worker_thread.start()
+
+    # WHEN the client sends a command
+    response: Dict = run_in_worker(
+        connection=client_connection, args=["-c", str(config.absolute()), "fail"]
+    )
+    worker_thread.join()
+    worker_connection.close()
+
+    # THEN the result of the command is received
+    assert response["exit_code"] == 1
+    assert "something failed" in response["stderr"]
+
+
+def wait_for_socket(socket_path: Path, process: subprocess.Popen) -> None:
+    deadline: float = time.monotonic() + 60
+    while time.monotonic() < deadline and process.poll() is None:
+        connection: Optional[socket.socket] = connect(str(socket_path))
+        if connection:
+            connection.close()
+            return
+        time.sleep(0.1)
+    raise AssertionError("The worker pool did not start")
+
+
+def test_worker_pool(config: Path, tmp_path: Path, monkeypatch, mocker, capsys):
+    # GIVEN a worker pool of one worker that is replaced after two commands
+    socket_path: Path = tmp_path / "worker.sock"
+    pool = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from cg_lims.commands.base import cli; cli(prog_name='lims')",
+            "-c",
+            str(config),
+            "worker",
+            "--socket-path",
+            str(socket_path),
+            "--workers",
+            "1",
+            "--max-requests",
+            "2",
+        ]
+    )
+    try:
+        wait_for_socket(socket_path=socket_path, process=pool)
+
+        # THEN only the user of the pool can connect to its socket
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+        # WHEN running three commands with lims-client
+        monkeypatch.setenv("LIMS_WORKER_SOCKET", str(socket_path))
+        run_in_client = mocker.patch("cg_lims.commands.base.cli")
+        exit_codes: List[int] = []
+        for _ in range(3):
+            with pytest.raises(SystemExit) as error:
+                main(args=["-c", str(config), "epps", "--help"])
+            exit_codes.append(error.value.code)
+
+        # THEN they are run by the workers, also after the first worker was replaced
+        assert exit_codes == [0, 0, 0]
+        assert capsys.readouterr().out.count("arnold-upload") == 3
+        run_in_client.main.assert_not_called()
+    finally:
+        # WHEN stopping the pool
+        pool.send_signal(signal.SIGTERM)
+        pool.wait(timeout=30)
+
+    # THEN it exits and removes its socket
+    assert pool.returncode == 0
+    assert not socket_path.exists()
+
+
+def test_worker_pool_refuses_socket_in_use(config: Path, tmp_path: Path):
+    # GIVEN a socket that a running worker pool listens on
+    socket_path: Path = tmp_path / "worker.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+
+    # WHEN another pool starts listening on it
+    pool = WorkerPool(config=str(config), socket_path=str(socket_path), workers=1, max_requests=1)
+
+    # THEN it refuses to start
+    with pytest.raises(click.ClickException):
+        pool._listen()
+    listener.close()
+
+    # WHEN the first pool has stopped without removing the socket
+    pool._listen()
+
+    # THEN the socket is replaced
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+    pool.listener.close()
+
+
+def test_worker_pool_stops_after_failed_starts(config: Path, mocker):
+    # GIVEN a worker pool where workers fail to start
+    sleep = mocker.patch("cg_lims.worker.server.time.sleep")
+    pool = WorkerPool(config=str(config), socket_path="worker.sock", workers=1, max_requests=1)
+    failed_start: int = STARTUP_FAILURE_EXIT_CODE << 8
+
+    # WHEN workers keep failing to start
+    # THEN each replacement is delayed twice as long as the one before
+    for _ in range(MAX_FAILED_STARTS - 1):
+        pool._on_worker_exit(pid=1, status=failed_start)
+    assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0, 4.0, 8.0]
+
+    # THEN the pool stops after MAX_FAILED_STARTS failed starts in a row
+    with pytest.raises(click.ClickException):
+        pool._on_worker_exit(pid=1, status=failed_start)
+
+
+def test_worker_pool_resets_failed_starts(config: Path, mocker):
+    # GIVEN a worker pool where a worker failed to start
+    mocker.patch("cg_lims.worker.server.time.sleep")
+    pool = WorkerPool(config=str(config), socket_path="worker.sock", workers=1, max_requests=1)
+    pool._on_worker_exit(pid=1, status=STARTUP_FAILURE_EXIT_CODE << 8)
+
+    # WHEN a worker exits after serving its commands
+    pool._on_worker_exit(pid=2, status=0)
+
+    # THEN the failed starts are counted from zero again
+    assert pool.failed_starts == 0